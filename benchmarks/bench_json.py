@@ -0,0 +1,76 @@
+"""
+Compare the time and peak memory of encoding a NumPy array input
+as nested lists, as a `.npy` data URI, and as a `.npy` file to upload.
+
+Requires numpy.
+
+Usage: python benchmarks/bench_json.py [size]
+"""
+
+import io
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from vaikerai.files import upload_file
+from vaikerai.json import encode_json
+
+
+def upload_without_sending(file: io.IOBase) -> str:
+    # Stands in for an upload, which reads the file in chunks
+    while file.read(64 * 1024):
+        pass
+    return "https://api.vaikerai.com/v1/files/f1"
+
+
+def as_list(arr: np.ndarray) -> str:
+    return json.dumps({"input": encode_json({"array": arr}, upload_file)})
+
+
+def as_data_uri(arr: np.ndarray) -> str:
+    return json.dumps(
+        {"input": encode_json({"array": arr}, upload_file, array_encoding="npy")}
+    )
+
+
+def as_upload(arr: np.ndarray) -> str:
+    return json.dumps(
+        {
+            "input": encode_json(
+                {"array": arr}, upload_without_sending, array_encoding="npy"
+            )
+        }
+    )
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+    arr = np.random.default_rng(0).random((size, size))
+    print(f"{size}x{size} float64 array, {arr.nbytes / 2**20:.0f} MiB")
+
+    for name, func in [
+        ("list (current)", as_list),
+        ("npy data URI", as_data_uri),
+        ("npy upload", as_upload),
+    ]:
+        start = time.perf_counter()
+        body = func(arr)
+        elapsed = time.perf_counter() - start
+
+        # Measure memory separately, since tracing slows allocations down
+        tracemalloc.start()
+        func(arr)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{name:<16} {elapsed * 1000:9.1f} ms  "
+            f"peak {peak / 2**20:8.1f} MiB  body {len(body) / 2**20:8.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare parsing the progress of a prediction from its whole log on every poll
+with reading only the part of the log added since the previous poll.
+
+Usage: python benchmarks/bench_logs.py [polls]
+"""
+
+import sys
+import time
+
+from vaikerai.prediction import Prediction, _LogReader
+
+LINE = "{percentage}%|{bar:<10}| {current}/{total} [00:01<00:01, 22.46it/s]\n"
+
+
+def make_logs(polls: int, lines_per_poll: int = 20) -> list:
+    total = polls * lines_per_poll
+    logs = "Using seed: 12345\n"
+    snapshots = []
+    for poll in range(polls):
+        for i in range(lines_per_poll):
+            current = poll * lines_per_poll + i + 1
+            percentage = current * 100 // total
+            logs += LINE.format(
+                percentage=percentage,
+                bar="#" * (percentage // 10),
+                current=current,
+                total=total,
+            )
+        snapshots.append(logs)
+    return snapshots
+
+
+def parse_whole_log(snapshots: list) -> Prediction.Progress:
+    progress = None
+    for logs in snapshots:
+        progress = Prediction.Progress.parse(logs)
+    return progress
+
+
+def read_new_text(snapshots: list) -> Prediction.Progress:
+    reader = _LogReader()
+    for logs in snapshots:
+        reader.read(logs)
+    return reader.progress
+
+
+def main() -> None:
+    polls = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    snapshots = make_logs(polls)
+    size = len(snapshots[-1]) / 1024 / 1024
+
+    for name, func in [
+        ("parse whole log", parse_whole_log),
+        ("read new text", read_new_text),
+    ]:
+        start = time.perf_counter()
+        progress = func(snapshots)
+        elapsed = time.perf_counter() - start
+        if progress is None or progress.current != progress.total:
+            raise RuntimeError(f"{name} parsed the wrong progress")
+        print(
+            f"{name:<16} {elapsed * 1000:9.1f} ms  "
+            f"{elapsed / polls * 1e6:9.1f} us/poll  ({polls} polls, {size:.1f} MiB log)"
+        )
+
+
+if __name__ == "__main__":
+    main()
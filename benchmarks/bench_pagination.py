@@ -0,0 +1,69 @@
+"""
+Compare validating a page of predictions twice with building it from validated results.
+
+Usage: python benchmarks/bench_pagination.py [results]
+"""
+
+import sys
+import timeit
+
+from vaikerai.client import Client
+from vaikerai.pagination import Page, _json_to_page, _lazy_page
+from vaikerai.prediction import Prediction, _json_to_prediction
+
+
+def make_page(results: int) -> dict:
+    return {
+        "next": "https://api.vaikerai.com/v1/predictions?cursor=abc",
+        "previous": None,
+        "results": [
+            {
+                "id": f"p{i}",
+                "model": "test/example",
+                "version": "v1",
+                "urls": {
+                    "get": f"https://api.vaikerai.com/v1/predictions/p{i}",
+                    "cancel": f"https://api.vaikerai.com/v1/predictions/p{i}/cancel",
+                },
+                "created_at": "2024-01-01T00:00:00.000000Z",
+                "source": "api",
+                "status": "succeeded",
+                "input": {"prompt": f"prompt {i}", "steps": 50},
+                "output": [f"https://example.com/p{i}.png"],
+                "error": None,
+                "logs": "",
+                "metrics": {"predict_time": 1.5},
+            }
+            for i in range(results)
+        ],
+    }
+
+
+def main() -> None:
+    results = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    obj = make_page(results)
+    client = Client()
+
+    def factory(result: dict) -> Prediction:
+        return _json_to_prediction(client, result)
+
+    def validate_twice() -> Page:
+        # The previous construction path: each result is validated by the factory,
+        # then again by the page's own validation of its `results` field
+        return Page[Prediction](
+            **{**obj, "results": [factory(result) for result in obj["results"]]}
+        )
+
+    for name, func in [
+        ("validate twice", validate_twice),
+        ("construct", lambda: _json_to_page(obj, Prediction, factory)),
+        ("lazy", lambda: _lazy_page(obj, Prediction, factory)),
+    ]:
+        if len(func()) != results:
+            raise RuntimeError(f"{name} built the wrong number of results")
+        best = min(timeit.repeat(func, number=10, repeat=5)) / 10
+        print(f"{name:<16} {best * 1000:8.2f} ms  {results / best:12,.0f} results/s")
+
+
+if __name__ == "__main__":
+    main()
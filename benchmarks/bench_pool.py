@@ -0,0 +1,109 @@
+"""
+Compare the throughput of concurrent requests, and the connections they open,
+with the default connection pool and with pools sized for the concurrency.
+
+Requests are made against a local HTTP/1.1 server that responds after a short delay,
+running in another process so that it doesn't compete with the client for the GIL.
+
+Usage: python benchmarks/bench_pool.py [requests] [concurrency]
+"""
+
+import asyncio
+import multiprocessing
+import socket
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional, Tuple
+
+import httpx
+
+from vaikerai.client import Client
+
+BODY = b'{"id": "p1", "status": "succeeded"}'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: Any = None
+
+    def setup(self) -> None:
+        with self.connections.get_lock():
+            self.connections.value += 1
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self) -> None:
+        time.sleep(0.005)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+        pass
+
+
+def serve(port: Any, connections: Any) -> None:  # noqa: ANN401
+    Handler.connections = connections
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    port.value = server.server_address[1]
+    server.serve_forever()
+
+
+async def fetch_all(client: Client, requests: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch() -> None:
+        async with semaphore:
+            resp = await client._async_request("GET", "/v1/predictions/p1")
+            if resp.status_code != 200:
+                raise RuntimeError(f"unexpected status {resp.status_code}")
+
+    await asyncio.gather(*(fetch() for _ in range(requests)))
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+    port = multiprocessing.Value("i", 0)
+    connections = multiprocessing.Value("i", 0)
+    server = multiprocessing.Process(
+        target=serve, args=(port, connections), daemon=True
+    )
+    server.start()
+    while not port.value:
+        time.sleep(0.01)
+    base_url = f"http://127.0.0.1:{port.value}"
+
+    # By default, at most 20 idle connections are kept alive,
+    # so with more requests in flight, most connections are closed after one response
+    cases: "List[Tuple[str, Optional[httpx.Limits]]]" = [("default limits", None)]
+    for size in [8, 32, concurrency]:
+        limits = httpx.Limits(
+            max_connections=size, max_keepalive_connections=size, keepalive_expiry=30
+        )
+        cases.append((f"pool of {size}", limits))
+
+    for name, limits in cases:
+        connections.value = 0
+        client = Client(base_url=base_url, limits=limits)
+
+        start = time.perf_counter()
+        asyncio.run(fetch_all(client, requests, concurrency))
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{name:<15} {elapsed * 1000:8.1f} ms  {requests / elapsed:8,.0f} requests/s  "
+            f"{connections.value:5,} connections"
+        )
+
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare the line-based server-sent event decoder with the byte-level decoder.
+
+Usage: python benchmarks/bench_stream.py [events]
+"""
+
+import sys
+import timeit
+
+from vaikerai.stream import EventSource
+
+
+def make_body(events: int) -> bytes:
+    lines = []
+    for i in range(events):
+        lines.append(f"event: output\nid: {i}\ndata: token{i}\n\n")
+    lines.append(f"event: done\nid: {events}\ndata: {{}}\n\n")
+    return "".join(lines).encode("utf-8")
+
+
+def chunks(body: bytes, size: int = 4096) -> list:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def decode_lines(parts: list) -> int:
+    # Equivalent to `httpx.Response.iter_lines()` feeding `EventSource.Decoder`
+    decoder = EventSource.Decoder()
+    count = 0
+    text = b"".join(parts).decode("utf-8")
+    for line in text.splitlines():
+        if decoder.decode(line) is not None:
+            count += 1
+    return count
+
+
+def decode_bytes(parts: list) -> int:
+    decoder = EventSource.ByteDecoder()
+    count = 0
+    for chunk in parts:
+        count += len(decoder.feed(chunk))
+    return count
+
+
+def decode_bytes_validated(parts: list) -> int:
+    decoder = EventSource.ByteDecoder()
+    count = 0
+    for chunk in parts:
+        for sse in decoder.feed(chunk):
+            sse.to_model()
+            count += 1
+    return count
+
+
+def main() -> None:
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    parts = chunks(make_body(events))
+
+    for name, func in [
+        ("line decoder (pydantic)", decode_lines),
+        ("byte decoder (pydantic)", decode_bytes_validated),
+        ("byte decoder", decode_bytes),
+    ]:
+        if func(parts) != events + 1:
+            raise RuntimeError(f"{name} decoded the wrong number of events")
+        best = min(timeit.repeat(lambda: func(parts), number=1, repeat=5))  # noqa: B023
+        print(f"{name:<26} {best * 1000:8.1f} ms  {events / best:12,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Compare verifying webhook signatures with `Webhooks.validate` and with a `WebhookVerifier`,
+and measure the throughput and size of a `MemoryReplayStore` under concurrent load.
+
+Usage: python benchmarks/bench_webhook.py [webhooks]
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import sys
+import threading
+import time
+import timeit
+
+from vaikerai.replay import MemoryReplayStore
+from vaikerai.webhook import Webhooks, WebhookSigningSecret, WebhookVerifier
+
+# This is a test secret and should not be used in production
+SECRET = WebhookSigningSecret(key="whsec_MfKQ9r8GKYqrTwjUPD8ILPZIo2LaLaSw")
+
+
+def make_webhook(size: int = 4096) -> tuple:
+    body = json.dumps(
+        {"id": "p1", "status": "succeeded", "logs": "x" * size, "output": ["a", "b"]}
+    ).encode()
+    webhook_id = "msg_p5jXN8AQM9LWM0D4loKWxJek"
+    timestamp = str(int(time.time()))
+    key = base64.b64decode(SECRET.key.split("_")[1])
+    signature = hmac.new(
+        key, f"{webhook_id}.{timestamp}.".encode() + body, hashlib.sha256
+    ).digest()
+    headers = {
+        "Content-Type": "application/json",
+        "Webhook-ID": webhook_id,
+        "Webhook-Timestamp": timestamp,
+        "Webhook-Signature": f"v1,{base64.b64encode(signature).decode()}",
+    }
+    return headers, body
+
+
+def main() -> None:
+    webhooks = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    headers, body = make_webhook()
+    verifier = WebhookVerifier(SECRET, tolerance=300)
+
+    def validate() -> None:
+        # A receiver gets the body as bytes, so it has to decode it for `validate`
+        Webhooks.validate(
+            headers=headers, body=body.decode("utf-8"), secret=SECRET, tolerance=300
+        )
+
+    def verify() -> None:
+        verifier.verify(headers, body)
+
+    for name, func in [("Webhooks.validate", validate), ("WebhookVerifier", verify)]:
+        best = min(timeit.repeat(func, number=webhooks, repeat=3))
+        print(
+            f"{name:<18} {best * 1000:8.1f} ms  "
+            f"{best / webhooks * 1e6:6.2f} us/webhook  {webhooks / best:10,.0f} webhooks/s"
+        )
+
+    # Each thread receives its own webhooks, timestamped as if 1,000 arrived every second,
+    # so only the last `tolerance` seconds' worth should be kept
+    tolerance, rate, threads = 30, 1_000, 8
+    for shards in [1, 16]:
+        store = MemoryReplayStore(shards=shards)
+        start = time.time()
+
+        def receive(
+            thread: int, store: MemoryReplayStore = store, start: float = start
+        ) -> None:
+            for i in range(webhooks):
+                expires_at = start + (i - webhooks) / rate + tolerance
+                if not store.add(f"msg_{thread}_{i}", expires_at):
+                    raise RuntimeError("new webhook ID was rejected")
+
+        workers = [threading.Thread(target=receive, args=(n,)) for n in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.time() - start
+
+        if len(store) > threads * rate * tolerance:
+            raise RuntimeError("replay store wasn't bounded by the tolerance")
+        print(
+            f"MemoryReplayStore(shards={shards:<2}) {elapsed * 1000:8.1f} ms  "
+            f"{threads * webhooks / elapsed:10,.0f} IDs/s  {len(store):,} IDs kept"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import json
+
+import httpx
+import pytest
+import respx
+
+from vaikerai.client import Client
+from vaikerai.exceptions import ModelError, VaikerAIError
+from vaikerai.polling import FixedPollingStrategy
+
+
+def prediction_with_status(id: str, status: str, text: str) -> dict:
+    return {
+        "id": id,
+        "model": "test/example",
+        "version": "v1",
+        "urls": {
+            "get": f"https://api.vaikerai.com/v1/predictions/{id}",
+            "cancel": f"https://api.vaikerai.com/v1/predictions/{id}/cancel",
+        },
+        "created_at": "2024-01-01T00:00:00.000000Z",
+        "source": "api",
+        "status": status,
+        "input": {"text": text},
+        "output": f"Hello, {text}!" if status == "succeeded" else None,
+        "error": "OOM" if status == "failed" else None,
+        "logs": "",
+    }
+
+
+def make_client() -> Client:
+    def create(request: httpx.Request) -> httpx.Response:
+        text = json.loads(request.content)["input"]["text"]
+        if text == "invalid":
+            return httpx.Response(422, json={"detail": "Invalid input"})
+        return httpx.Response(
+            201, json=prediction_with_status(f"p-{text}", "starting", text)
+        )
+
+    def get(request: httpx.Request, id: str) -> httpx.Response:
+        text = id[len("p-") :]
+        if text == "gone":
+            return httpx.Response(404, json={"detail": "Not found"})
+        status = "failed" if text == "oom" else "succeeded"
+        return httpx.Response(200, json=prediction_with_status(id, status, text))
+
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="POST", path="/models/test/example/predictions").mock(
+        side_effect=create
+    )
+    router.route(method="GET", path="/predictions").mock(
+        return_value=httpx.Response(
+            200, json={"next": None, "previous": None, "results": []}
+        )
+    )
+    router.route(method="GET", path__regex=r"/predictions/(?P<id>[^/]+)").mock(
+        side_effect=get
+    )
+
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        polling_strategy=FixedPollingStrategy(),
+    )
+    client.poll_interval = 0.0
+    return client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_create_many(async_flag):
+    client = make_client()
+    inputs = [{"text": text} for text in ["a", "b", "invalid", "c", "d"]]
+
+    if async_flag:
+        results = await client.models.predictions.async_create_many(
+            "test/example", inputs, max_concurrency=2
+        )
+    else:
+        results = client.models.predictions.create_many(
+            "test/example", iter(inputs), max_concurrency=2
+        )
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.input for result in results] == inputs
+    assert [result.ok for result in results] == [True, True, False, True, True]
+    assert isinstance(results[2].error, VaikerAIError)
+    assert results[3].prediction is not None
+    assert results[3].prediction.id == "p-c"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_run_many(async_flag):
+    client = make_client()
+    inputs = [{"text": text} for text in ["a", "oom", "b"]]
+
+    if async_flag:
+        results = await client.predictions.async_run_many(inputs, model="test/example")
+    else:
+        results = client.predictions.run_many(inputs, model="test/example")
+
+    assert results[0].output == "Hello, a!"
+    assert isinstance(results[1].error, ModelError)
+    assert results[2].output == "Hello, b!"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_run_many_reports_fetch_errors_per_item(async_flag):
+    client = make_client()
+    inputs = [{"text": text} for text in ["a", "gone", "b"]]
+
+    if async_flag:
+        results = await client.predictions.async_run_many(inputs, model="test/example")
+    else:
+        results = client.predictions.run_many(inputs, model="test/example")
+
+    assert results[0].output == "Hello, a!"
+    assert isinstance(results[1].error, VaikerAIError)
+    assert results[2].output == "Hello, b!"
+    assert results[2].ok
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_create_many_derives_an_idempotency_key_per_item(async_flag):
+    client = make_client()
+    inputs = [{"text": text} for text in ["a", "b", "c"]]
+
+    if async_flag:
+        results = await client.models.predictions.async_create_many(
+            "test/example", inputs, idempotency_key="k"
+        )
+    else:
+        results = client.models.predictions.create_many(
+            "test/example", inputs, idempotency_key="k"
+        )
+
+    assert all(result.ok for result in results)
+    assert [result.prediction.id for result in results] == ["p-a", "p-b", "p-c"]
+    assert sorted(client.idempotency_table._entries) == ["k-0", "k-1", "k-2"]
+
+
+def test_create_many_requires_a_single_target():
+    client = make_client()
+
+    with pytest.raises(ValueError):
+        client.predictions.create_many([{"text": "a"}])
+
+    with pytest.raises(ValueError):
+        client.predictions.create_many([], max_concurrency=0, model="test/example")
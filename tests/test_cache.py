@@ -0,0 +1,234 @@
+import io
+import json
+import os
+
+import httpx
+import pytest
+import respx
+
+from vaikerai.cache import CachedVersion, UploadCache, VersionCache
+from vaikerai.client import Client
+from vaikerai.version import Version
+
+version = {
+    "id": "v1",
+    "created_at": "2024-07-18T00:35:56.210272Z",
+    "cog_version": "0.9.10",
+    "openapi_schema": {
+        "openapi": "3.0.2",
+        "components": {
+            "schemas": {
+                "Output": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "x-cog-array-type": "iterator",
+                },
+            }
+        },
+    },
+}
+
+prediction = {
+    "id": "p1",
+    "model": "test/example",
+    "version": "v1",
+    "urls": {
+        "get": "https://api.vaikerai.com/v1/predictions/p1",
+        "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+    },
+    "created_at": "2024-07-18T00:35:56.210272Z",
+    "source": "api",
+    "status": "succeeded",
+    "input": {"text": "world"},
+    "output": ["Hello", ", ", "world!"],
+    "error": None,
+    "logs": "",
+}
+
+
+def test_version_cache_lru():
+    cache = VersionCache(maxsize=2)
+    entry = CachedVersion(Version(**version), has_output_iterator=True)
+
+    cache.put("a", "b", "v1", entry)
+    cache.put("a", "b", "v2", entry)
+    assert cache.get("a", "b", "v1") == entry
+
+    cache.put("a", "b", "v3", entry)
+    assert cache.get("a", "b", "v2") is None
+    assert cache.get("a", "b", "v1") == entry
+    assert len(cache) == 2
+
+
+def test_version_cache_persistence(tmp_path):
+    path = tmp_path / "versions.json"
+
+    cache = VersionCache(path=path)
+    cache.put(
+        "a", "b", "v1", CachedVersion(Version(**version), has_output_iterator=True)
+    )
+
+    reloaded = VersionCache(path=path)
+    cached = reloaded.get("a", "b", "v1")
+
+    assert cached is not None
+    assert cached.version.id == "v1"
+    assert cached.has_output_iterator is True
+
+
+def test_version_cache_ignores_unwritable_path(tmp_path):
+    cache = VersionCache(path=tmp_path / "missing" / "versions.json")
+    entry = CachedVersion(Version(**version), has_output_iterator=True)
+
+    cache.put("a", "b", "v1", entry)
+
+    assert cache.get("a", "b", "v1") == entry
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_run_uses_version_cache(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(
+            201, json={**prediction, "status": "processing", "output": None}
+        )
+    )
+    router.route(method="GET", path="/predictions/p1").mock(
+        return_value=httpx.Response(200, json=prediction)
+    )
+    versions = router.route(method="GET", path="/models/test/example/versions/v1").mock(
+        return_value=httpx.Response(200, json=version)
+    )
+
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        version_cache=VersionCache(),
+    )
+    client.poll_interval = 0.0
+
+    for _ in range(3):
+        if async_flag:
+            output = await client.async_run("test/example:v1")
+            assert [item async for item in output] == ["Hello", ", ", "world!"]
+        else:
+            output = client.run("test/example:v1")
+            assert list(output) == ["Hello", ", ", "world!"]
+
+    assert versions.call_count == 1
+
+
+def test_upload_cache_digest(tmp_path):
+    cache = UploadCache()
+
+    path = tmp_path / "image.png"
+    path.write_bytes(b"image")
+    with path.open("rb") as f:
+        digest = cache.digest(f)
+
+    assert digest == cache.digest(io.BytesIO(b"image"))
+    assert cache.digest(io.StringIO("image")) is None
+
+    # Unchanged files are recognized by path, size, and modification time
+    with path.open("rb") as f:
+        f.read = None  # type: ignore[method-assign]
+        assert cache.digest(f) == digest
+
+    path.write_bytes(b"other")
+    os.utime(path, ns=(0, 0))
+    with path.open("rb") as f:
+        assert cache.digest(f) != digest
+
+
+def test_upload_cache_eviction():
+    cache = UploadCache(maxsize=2, max_bytes=10)
+    cache.put("a", "12345")
+    cache.put("b", "12345")
+    assert cache.get("a") == "12345"
+
+    cache.put("c", "1")
+    assert cache.get("b") is None
+    assert cache.get("a") == "12345"
+    assert len(cache) == 2
+
+    cache.put("d", "1234567890")
+    assert len(cache) == 1
+
+    expired = UploadCache(ttl=-1)
+    expired.put("a", "https://example.com/a")
+    assert expired.get("a") is None
+
+
+def test_upload_cache_persistence(tmp_path):
+    path = tmp_path / "uploads.json"
+
+    cache = UploadCache(path=path)
+    cache.put("a", "https://api.vaikerai.com/v1/files/f1")
+    cache.put("b", "data:text/plain;base64,aGVsbG8=")
+
+    reloaded = UploadCache(path=path)
+    assert reloaded.get("a") == "https://api.vaikerai.com/v1/files/f1"
+    assert reloaded.get("b") is None
+
+
+def test_upload_cache_saves_only_persisted_changes(tmp_path):
+    path = tmp_path / "uploads.json"
+
+    cache = UploadCache(path=path)
+    cache.put("a", "data:text/plain;base64,aGVsbG8=")
+    assert not path.exists()
+
+    cache.put("b", "https://api.vaikerai.com/v1/files/f1")
+    assert path.exists()
+
+    # The cache is only an optimization, so it still works when it can't be saved
+    unwritable = UploadCache(path=tmp_path / "missing" / "uploads.json")
+    unwritable.put("a", "https://api.vaikerai.com/v1/files/f1")
+    assert unwritable.get("a") == "https://api.vaikerai.com/v1/files/f1"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_create_uses_upload_cache(async_flag, tmp_path):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    predictions = router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(201, json={**prediction, "status": "starting"})
+    )
+    files = router.route(method="POST", path="/files").mock(
+        return_value=httpx.Response(
+            201,
+            json={
+                "id": "f1",
+                "name": "weights.bin",
+                "content_type": "application/octet-stream",
+                "size": 32,
+                "urls": {"get": "https://api.vaikerai.com/v1/files/f1"},
+            },
+        )
+    )
+
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        upload_threshold=16,
+        upload_cache=UploadCache(),
+    )
+
+    weights = tmp_path / "weights.bin"
+    weights.write_bytes(b"x" * 32)
+
+    for _ in range(3):
+        input = {"weights": weights, "copy": io.BytesIO(b"x" * 32)}
+        if async_flag:
+            await client.predictions.async_create(version="v1", input=input)
+        else:
+            client.predictions.create(version="v1", input=input)
+
+    assert files.call_count == 1
+    for call in predictions.calls:
+        body = json.loads(call.request.content)
+        assert body["input"] == {
+            "weights": "https://api.vaikerai.com/v1/files/f1",
+            "copy": "https://api.vaikerai.com/v1/files/f1",
+        }
@@ -114,3 +114,52 @@ def test_custom_headers_are_applied():
         pass
 
     mock_send_wrapper.assert_called_once()
+
+
+@pytest.mark.parametrize("async_flag", [True, False])
+def test_connection_pool_options(async_flag):
+    from vaikerai.client import Client
+
+    client = Client(
+        api_token="test-token",
+        limits=httpx.Limits(
+            max_connections=64, max_keepalive_connections=32, keepalive_expiry=30
+        ),
+        host_limits={"all://files.example.com": httpx.Limits(max_connections=4)},
+    )
+    httpx_client = client._async_client if async_flag else client._client
+
+    pool = httpx_client._transport._wrapped_transport._pool
+    assert pool._max_connections == 64
+    assert pool._max_keepalive_connections == 32
+    assert pool._keepalive_expiry == 30
+
+    # Requests to other hosts use their own pool, still wrapped with retries
+    transport = httpx_client._transport_for_url(
+        httpx.URL("https://files.example.com/output.png")
+    )
+    assert transport is not httpx_client._transport
+    assert transport._wrapped_transport._pool._max_connections == 4
+
+    with pytest.raises(ValueError):
+        Client(
+            api_token="test-token",
+            limits=httpx.Limits(max_connections=1),
+            transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+        )._request("GET", "/")
+
+    # Mounts for other hosts would bypass the custom transport
+    with pytest.raises(ValueError):
+        Client(
+            api_token="test-token",
+            host_limits={"all://files.example.com": httpx.Limits(max_connections=4)},
+            transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+        )._request("GET", "/")
+
+
+def test_http2_option():
+    pytest.importorskip("h2")
+    from vaikerai.client import Client
+
+    client = Client(api_token="test-token", http2=True)
+    assert client._client._transport._wrapped_transport._pool._http2
@@ -0,0 +1,97 @@
+import json
+from typing import Any, Union
+
+import httpx
+import pytest
+import respx
+
+from vaikerai.client import Client
+from vaikerai.codec import (
+    HAS_ORJSON,
+    JSONCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    get_codec,
+)
+
+prediction = {
+    "id": "p1",
+    "model": "test/example",
+    "version": "v1",
+    "urls": {
+        "get": "https://api.vaikerai.com/v1/predictions/p1",
+        "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+    },
+    "created_at": "2024-01-01T00:00:00.000000Z",
+    "source": "api",
+    "status": "starting",
+    "input": {"text": "wörld"},
+    "output": None,
+    "error": None,
+    "logs": "",
+}
+
+
+class CountingCodec(StdlibJSONCodec):
+    def __init__(self) -> None:
+        self.dumped = 0
+        self.loaded = 0
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        self.dumped += 1
+        return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:  # noqa: ANN401
+        self.loaded += 1
+        return super().loads(data)
+
+
+def test_get_codec():
+    assert isinstance(get_codec(), StdlibJSONCodec)
+    assert isinstance(get_codec("stdlib"), StdlibJSONCodec)
+    assert isinstance(get_codec("auto"), JSONCodec)
+
+    codec = CountingCodec()
+    assert get_codec(codec) is codec
+
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+def test_orjson_codec_matches_stdlib():
+    obj = {"text": "wörld", "numbers": [1, 2.5], "nested": {"ok": True, "x": None}}
+
+    assert OrjsonCodec().dumps(obj) == StdlibJSONCodec().dumps(obj)
+    assert OrjsonCodec().loads(StdlibJSONCodec().dumps(obj)) == obj
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_client_uses_codec(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    route = router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(201, json=prediction)
+    )
+
+    codec = CountingCodec()
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        json_codec=codec,
+    )
+
+    if async_flag:
+        created = await client.predictions.async_create(
+            version="v1", input={"text": "wörld"}
+        )
+    else:
+        created = client.predictions.create(version="v1", input={"text": "wörld"})
+
+    assert created.input == {"text": "wörld"}
+    assert codec.dumped == 1
+    assert codec.loaded == 1
+
+    request = route.calls[0].request
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content)["input"] == {"text": "wörld"}
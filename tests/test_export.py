@@ -0,0 +1,151 @@
+import json
+
+import httpx
+import pytest
+import respx
+
+from vaikerai.client import Client
+from vaikerai.codec import StdlibJSONCodec
+from vaikerai.exceptions import VaikerAIError
+
+
+def prediction(id: str, created_at: str) -> dict:
+    return {
+        "id": id,
+        "model": "test/example",
+        "version": "v1",
+        "urls": {
+            "get": f"https://api.vaikerai.com/v1/predictions/{id}",
+            "cancel": f"https://api.vaikerai.com/v1/predictions/{id}/cancel",
+        },
+        "created_at": created_at,
+        "source": "api",
+        "status": "succeeded",
+        "input": {"text": "world"},
+        "output": ["Hello", "world"],
+        "error": None,
+        "logs": "",
+    }
+
+
+p1 = prediction("p1", "2024-01-03T00:00:00.000000Z")
+p2 = prediction("p2", "2024-01-02T00:00:00.000000Z")
+p3 = prediction("p3", "2024-01-01T00:00:00.000000Z")
+p4 = prediction("p4", "2024-01-04T00:00:00.000000Z")
+
+
+def page(results: list, *, next: bool = False) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "next": "https://api.vaikerai.com/v1/predictions?cursor=abc"
+            if next
+            else None,
+            "previous": None,
+            "results": results,
+        },
+    )
+
+
+def read_ids(path) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["id"] for line in f]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_export_resumes_and_is_incremental(async_flag, tmp_path):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    second = router.route(
+        method="GET", path="/predictions", params={"cursor": "abc"}
+    ).mock(
+        side_effect=[
+            httpx.Response(404, json={"detail": "Not found"}),
+            page([p3]),
+        ]
+    )
+    first = router.route(method="GET", path="/predictions").mock(
+        side_effect=[
+            page([p1, p2], next=True),
+            page([p4, p1, p2], next=True),
+        ]
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+    path = tmp_path / "predictions.jsonl"
+
+    async def export(**kwargs):
+        if async_flag:
+            return await client.predictions.async_export(path, **kwargs)
+        return client.predictions.export(path, **kwargs)
+
+    with pytest.raises(VaikerAIError):
+        await export()
+    assert read_ids(path) == ["p1", "p2"]
+
+    # The interrupted export continues from the saved cursor
+    assert await export() == 1
+    assert read_ids(path) == ["p1", "p2", "p3"]
+    assert first.call_count == 1
+    assert second.call_count == 2
+
+    # Only predictions newer than the last export are fetched and appended
+    assert await export(incremental=True) == 1
+    assert read_ids(path) == ["p1", "p2", "p3", "p4"]
+    assert first.call_count == 2
+    assert second.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="GET", path="/predictions").mock(
+        return_value=page([p1, p2, p3])
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+    path = tmp_path / "predictions"
+
+    assert client.predictions.export(path, format="parquet") == 3
+
+    table = parquet.read_table(path)
+    assert table.column("id").to_pylist() == ["p1", "p2", "p3"]
+    assert json.loads(table.column("output")[0].as_py()) == ["Hello", "world"]
+
+
+def test_export_rejects_unknown_format(tmp_path):
+    client = Client(api_token="test-token")
+
+    with pytest.raises(ValueError):
+        client.predictions.export(tmp_path / "predictions.csv", format="csv")  # type: ignore[arg-type]
+
+
+def test_export_uses_client_json_codec(tmp_path):
+    class CountingCodec(StdlibJSONCodec):
+        dumped = 0
+
+        def dumps(self, obj):
+            CountingCodec.dumped += 1
+            return super().dumps(obj)
+
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="GET", path="/predictions").mock(
+        return_value=page([p1, p2, p3])
+    )
+
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        json_codec=CountingCodec(),
+    )
+    path = tmp_path / "predictions.jsonl"
+
+    assert client.predictions.export(path) == 3
+    assert CountingCodec.dumped == 3
+    assert read_ids(path) == ["p1", "p2", "p3"]
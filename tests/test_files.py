@@ -0,0 +1,202 @@
+import asyncio
+import io
+import json
+import threading
+
+import httpx
+import pytest
+import respx
+
+from vaikerai.cache import UploadCache
+from vaikerai.client import Client
+
+prediction = {
+    "id": "p1",
+    "model": "test/example",
+    "version": "v1",
+    "urls": {
+        "get": "https://api.vaikerai.com/v1/predictions/p1",
+        "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+    },
+    "created_at": "2024-01-01T00:00:00.000000Z",
+    "source": "api",
+    "status": "starting",
+    "input": {},
+    "output": None,
+    "error": None,
+    "logs": "",
+}
+
+file = {
+    "id": "f1",
+    "name": "large.bin",
+    "content_type": "application/octet-stream",
+    "size": 32,
+    "urls": {"get": "https://api.vaikerai.com/v1/files/f1"},
+}
+
+
+def router_for_uploads() -> respx.Router:
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(201, json=prediction)
+    )
+    router.route(method="POST", path="/files").mock(
+        return_value=httpx.Response(201, json=file)
+    )
+    return router
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_create_uploads_large_files(async_flag, tmp_path):
+    router = router_for_uploads()
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        upload_threshold=16,
+    )
+
+    large = tmp_path / "large.bin"
+    large.write_bytes(b"x" * 32)
+    small = io.BytesIO(b"hello")
+
+    input = {"large": large, "small": small}
+    if async_flag:
+        await client.predictions.async_create(version="v1", input=input)
+    else:
+        client.predictions.create(version="v1", input=input)
+
+    upload = router.routes[1].calls[0].request
+    assert b'name="content"; filename="large.bin"' in upload.content
+    assert b"x" * 32 in upload.content
+
+    body = json.loads(router.routes[0].calls[0].request.content)
+    assert body["input"]["large"] == "https://api.vaikerai.com/v1/files/f1"
+    assert body["input"]["small"] == "data:application/octet-stream;base64,aGVsbG8="
+
+
+@pytest.mark.asyncio
+async def test_create_inlines_files_without_upload_threshold(tmp_path):
+    router = router_for_uploads()
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        upload_threshold=None,
+    )
+
+    large = tmp_path / "large.bin"
+    large.write_bytes(b"x" * 32)
+    client.predictions.create(version="v1", input={"large": large})
+
+    body = json.loads(router.routes[0].calls[0].request.content)
+    assert body["input"]["large"].startswith("data:application/octet-stream;base64,")
+    assert router.routes[1].call_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_files_create(async_flag, tmp_path):
+    router = router_for_uploads()
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    path = tmp_path / "weights.safetensors"
+    path.write_bytes(b"\0" * 32)
+
+    if async_flag:
+        created = await client.files.async_create(
+            path, filename="lora.safetensors", metadata={"step": 1}
+        )
+    else:
+        created = client.files.create(
+            path, filename="lora.safetensors", metadata={"step": 1}
+        )
+
+    assert created.id == "f1"
+
+    request = router.routes[1].calls[0].request
+    assert b'filename="lora.safetensors"' in request.content
+    assert b'{"step": 1}' in request.content
+
+
+class ThreadCheckingFile(io.BytesIO):
+    def __init__(self, content: bytes) -> None:
+        super().__init__(content)
+        self.name = "input.bin"
+        self.read_threads = set()
+
+    def read(self, size: int = -1) -> bytes:
+        self.read_threads.add(threading.get_ident())
+        return super().read(size)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("upload_threshold", [None, 16])
+async def test_async_create_reads_files_off_the_event_loop(upload_threshold):
+    router = router_for_uploads()
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        upload_threshold=upload_threshold,
+    )
+
+    file = ThreadCheckingFile(b"x" * 32)
+    await client.predictions.async_create(version="v1", input={"file": file})
+
+    assert file.read_threads
+    assert threading.get_ident() not in file.read_threads
+
+    if upload_threshold is not None:
+        upload = router.routes[1].calls[0].request
+        assert int(upload.headers["Content-Length"]) == len(upload.content)
+
+        content_type = upload.headers["Content-Type"]
+        assert content_type.startswith("multipart/form-data; boundary=")
+        boundary = content_type.partition("boundary=")[2].encode()
+
+        assert upload.content == (
+            b"--" + boundary + b"\r\n"
+            b'Content-Disposition: form-data; name="content"; filename="input.bin"\r\n'
+            b"Content-Type: application/octet-stream\r\n\r\n"
+            + b"x" * 32
+            + b"\r\n--"
+            + boundary
+            + b"--\r\n"
+        )
+
+
+class ThreadCheckingCache(UploadCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads = set()
+
+    def get(self, digest: str):
+        self.threads.add(threading.get_ident())
+        return super().get(digest)
+
+    def put(self, digest: str, value: str) -> None:
+        self.threads.add(threading.get_ident())
+        super().put(digest, value)
+
+
+@pytest.mark.asyncio
+async def test_async_encode_uses_cache_off_the_event_loop():
+    router = router_for_uploads()
+    cache = ThreadCheckingCache()
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        upload_threshold=16,
+        upload_cache=cache,
+    )
+
+    values = await asyncio.gather(
+        *(client.files.async_encode(io.BytesIO(b"x" * 32)) for _ in range(4))
+    )
+
+    assert values == ["https://api.vaikerai.com/v1/files/f1"] * 4
+    assert router.routes[1].call_count == 1
+    assert cache.threads
+    assert threading.get_ident() not in cache.threads
@@ -0,0 +1,180 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+import respx
+
+from vaikerai.client import Client
+from vaikerai.exceptions import VaikerAIError
+from vaikerai.idempotency import IdempotencyKeyConflictError, IdempotencyTable
+
+prediction = {
+    "id": "p1",
+    "model": "test/example",
+    "version": "v1",
+    "urls": {
+        "get": "https://api.vaikerai.com/v1/predictions/p1",
+        "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+    },
+    "created_at": "2024-01-01T00:00:00.000000Z",
+    "source": "api",
+    "status": "starting",
+    "input": {"text": "world"},
+    "output": None,
+    "error": None,
+    "logs": "",
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_create_is_retried_with_idempotency_key(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    route = router.route(method="POST", path="/predictions").mock(
+        side_effect=[
+            httpx.Response(503, headers={"Retry-After": "0"}, json={}),
+            httpx.Response(201, json=prediction),
+        ]
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    for _ in range(2):
+        if async_flag:
+            created = await client.predictions.async_create(
+                version="v1", input={"text": "world"}, idempotency_key="key-1"
+            )
+        else:
+            created = client.predictions.create(
+                version="v1", input={"text": "world"}, idempotency_key="key-1"
+            )
+
+        assert created.id == "p1"
+
+    # The first call is retried once, and the second call is deduplicated locally
+    assert route.call_count == 2
+    keys = {call.request.headers["Idempotency-Key"] for call in route.calls}
+    assert keys == {"key-1"}
+
+
+@pytest.mark.asyncio
+async def test_create_generates_idempotency_keys():
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    route = router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(201, json=prediction)
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+    client.predictions.create(version="v1", input={"text": "world"})
+    client.predictions.create(version="v1", input={"text": "world"})
+
+    keys = {call.request.headers["Idempotency-Key"] for call in route.calls}
+    assert len(keys) == 2
+
+    # Generated keys can't be looked up again, so they aren't recorded
+    assert len(client.idempotency_table) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_idempotency_key_reused_for_different_request(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    route = router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(201, json=prediction)
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    for text in ["world", "moon"]:
+        params = {"version": "v1", "input": {"text": text}, "idempotency_key": "key-1"}
+        if text == "world":
+            client.predictions.create(**params)
+            continue
+
+        with pytest.raises(IdempotencyKeyConflictError):
+            if async_flag:
+                await client.predictions.async_create(**params)
+            else:
+                client.predictions.create(**params)
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_with_same_key_send_one_request():
+    release = threading.Event()
+
+    def create(request: httpx.Request) -> httpx.Response:
+        release.wait(timeout=5)
+        return httpx.Response(201, json=prediction)
+
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    route = router.route(method="POST", path="/predictions").mock(side_effect=create)
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+    params = {"version": "v1", "input": {"text": "world"}, "idempotency_key": "key-1"}
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(client.predictions.create(**params))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    while "key-1" not in client.idempotency_table._pending:
+        await asyncio.sleep(0.001)
+
+    # A coroutine waits on the same request without blocking the event loop
+    task = asyncio.create_task(client.predictions.async_create(**params))
+    await asyncio.sleep(0.05)
+    release.set()
+    results.append(await task)
+    for thread in threads:
+        thread.join()
+
+    assert route.call_count == 1
+    assert [created.id for created in results] == ["p1"] * 5
+
+
+@pytest.mark.asyncio
+async def test_post_without_idempotency_key_is_not_retried():
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    route = router.route(method="POST", path="/predictions/p1/cancel").mock(
+        return_value=httpx.Response(503, headers={"Retry-After": "0"}, json={})
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    with pytest.raises(VaikerAIError):
+        client.predictions.cancel("p1")
+
+    assert route.call_count == 1
+
+
+def test_idempotency_table_eviction():
+    table = IdempotencyTable(maxsize=2)
+    table.put("a", {"id": "a"})
+    table.put("b", {"id": "b"})
+    assert table.get("a") == {"id": "a"}
+
+    table.put("c", {"id": "c"})
+    assert table.get("b") is None
+    assert table.get("a") == {"id": "a"}
+    assert len(table) == 2
+
+    expired = IdempotencyTable(ttl=-1)
+    expired.put("a", {"id": "a"})
+    assert expired.get("a") is None
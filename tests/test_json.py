@@ -0,0 +1,183 @@
+import array
+import asyncio
+import io
+import threading
+
+import pytest
+
+from vaikerai.json import HAS_NUMPY, async_encode_json, encode_json
+
+
+def test_encode_json_encodes_each_file_once(tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"image")
+    buffer = io.BytesIO(b"buffer")
+
+    calls = []
+
+    def upload_file(file: io.IOBase) -> str:
+        content = file.read()
+        calls.append(content)
+        return content.decode()
+
+    encoded = encode_json(
+        {
+            "images": [path, tmp_path / "." / "image.png", buffer],
+            "nested": {"image": path, "buffer": buffer},
+            "tokens": (token for token in ["a", "b"]),
+        },
+        upload_file,
+    )
+
+    assert encoded == {
+        "images": ["image", "image", "buffer"],
+        "nested": {"image": "image", "buffer": "buffer"},
+        "tokens": ["a", "b"],
+    }
+    assert sorted(calls) == [b"buffer", b"image"]
+
+
+def test_encode_json_encodes_files_concurrently():
+    barrier = threading.Barrier(4, timeout=5)
+
+    def upload_file(file: io.IOBase) -> str:
+        # Every call waits for the others, so this only passes if they run concurrently
+        barrier.wait()
+        return file.read().decode()
+
+    files = [io.BytesIO(f"file{i}".encode()) for i in range(4)]
+    assert encode_json(files, upload_file) == ["file0", "file1", "file2", "file3"]
+
+
+def test_encode_json_top_level_file():
+    assert encode_json(io.BytesIO(b"file"), lambda f: f.read().decode()) == "file"
+
+
+@pytest.mark.asyncio
+async def test_async_encode_json():
+    event = asyncio.Event()
+    started = 0
+
+    async def upload_file(file: io.IOBase) -> str:
+        nonlocal started
+        started += 1
+        if started == 2:
+            event.set()
+        await asyncio.wait_for(event.wait(), timeout=5)
+        return file.read().decode()
+
+    first, second = io.BytesIO(b"first"), io.BytesIO(b"second")
+    encoded = await async_encode_json({"a": first, "b": [second, first]}, upload_file)
+
+    assert encoded == {"a": "first", "b": ["second", "first"]}
+    assert started == 2
+
+
+def upload_as_bytes(file: io.IOBase) -> str:
+    return repr((getattr(file, "name", None), file.read()))
+
+
+def test_encode_json_binary_data():
+    data = b"\x00\x01"
+
+    encoded = encode_json(
+        {
+            "bytes": data,
+            "bytearray": bytearray(data),
+            "memoryview": memoryview(data),
+            "array": array.array("B", data),
+        },
+        upload_as_bytes,
+    )
+
+    assert encoded == {
+        "bytes": repr((None, data)),
+        "bytearray": repr((None, data)),
+        "memoryview": repr((None, data)),
+        "array": repr((None, data)),
+    }
+
+
+def test_encode_json_non_contiguous_buffers():
+    encoded = encode_json({"x": memoryview(b"abcdef")[::2]}, upload_as_bytes)
+
+    assert encoded == {"x": repr((None, b"ace"))}
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_encode_json_numpy_arrays():
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    arr = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+    assert encode_json({"array": arr}, upload_as_bytes) == {
+        "array": [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+    }
+
+    files = []
+
+    def upload_file(file: io.IOBase) -> str:
+        files.append(file)
+        return "https://example.com/array.npy"
+
+    encoded = encode_json(
+        {"array": arr, "same": arr}, upload_file, array_encoding="npy"
+    )
+
+    assert encoded == {
+        "array": "https://example.com/array.npy",
+        "same": "https://example.com/array.npy",
+    }
+    assert len(files) == 1
+    assert files[0].name == "array.npy"
+    np.testing.assert_array_equal(np.load(files[0]), arr)
+
+
+def test_encode_json_buffers_from_a_generator():
+    # Each buffer is freed once the generator moves on,
+    # so its id may be reused by the next one
+    encoded = encode_json(
+        {"x": (bytearray([65 + i]) * 3 for i in range(4))},
+        lambda file: file.read().decode(),
+    )
+
+    assert encoded == {"x": ["AAA", "BBB", "CCC", "DDD"]}
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_encode_json_numpy_arrays_from_a_generator():
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    encoded = encode_json(
+        {"x": (np.array([i]) for i in range(4))},
+        lambda file: str(np.load(file)[0]),
+        array_encoding="npy",
+    )
+
+    assert encoded == {"x": ["0", "1", "2", "3"]}
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+@pytest.mark.asyncio
+async def test_async_encode_json_writes_arrays_off_the_event_loop(monkeypatch):
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    write_array = np.lib.format.write_array
+    threads = []
+
+    def recording_write_array(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return write_array(*args, **kwargs)
+
+    monkeypatch.setattr(np.lib.format, "write_array", recording_write_array)
+
+    async def upload_file(file: io.IOBase) -> str:
+        return str(np.load(file).tolist())
+
+    # Columns of a C-ordered array aren't contiguous
+    arr = np.arange(6).reshape(2, 3)[:, ::2]
+    encoded = await async_encode_json({"x": arr}, upload_file, array_encoding="npy")
+
+    assert encoded == {"x": "[[0, 2], [3, 5]]"}
+    assert threads
+    assert threading.current_thread() not in threads
@@ -1,6 +1,23 @@
+import asyncio
+import copy
+import pickle
+import threading
+
+import httpx
 import pytest
+import respx
 
 import vaikerai
+from vaikerai.client import Client
+from vaikerai.hardware import Hardware
+from vaikerai.pagination import Page
+from vaikerai.prediction import Prediction
+from vaikerai.resource import ResourceView
+
+try:
+    from pydantic import v1 as pydantic  # type: ignore
+except ImportError:
+    import pydantic  # type: ignore
 
 
 @pytest.mark.asyncio
@@ -36,3 +53,246 @@ async def test_paginate(async_flag):
                     break
 
     assert found
+
+
+prediction = {
+    "id": "p1",
+    "model": "test/example",
+    "version": "v1",
+    "urls": {
+        "get": "https://api.vaikerai.com/v1/predictions/p1",
+        "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+    },
+    "created_at": "2024-01-01T00:00:00.000000Z",
+    "source": "api",
+    "status": "succeeded",
+    "input": {"text": "world"},
+    "output": "Hello, world!",
+    "error": None,
+    "logs": "",
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_list_lazy(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="GET", path="/predictions").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "next": "https://api.vaikerai.com/v1/predictions?cursor=abc",
+                "previous": None,
+                "results": [prediction, {**prediction, "id": "p2", "metrics": "bad"}],
+            },
+        )
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    if async_flag:
+        page = await client.predictions.async_list(lazy=True)
+    else:
+        page = client.predictions.list(lazy=True)
+
+    assert page.next == "https://api.vaikerai.com/v1/predictions?cursor=abc"
+    assert len(page) == 2
+    assert all(isinstance(view, ResourceView) for view in page)
+
+    view = page[0]
+    assert view.id == "p1"
+    assert view.status == "succeeded"
+    assert view.metrics is None
+    assert view.to_dict() is page[0].to_dict()
+
+    full = view.to_resource()
+    assert isinstance(full, Prediction)
+    assert full.output == "Hello, world!"
+    assert full._client is client
+
+    with pytest.raises(AttributeError):
+        view.wait  # noqa: B018
+
+    # Fields are only validated when they're accessed
+    assert page[1].id == "p2"
+    with pytest.raises(pydantic.ValidationError):
+        page[1].metrics  # noqa: B018
+
+
+def test_resource_view_copy_and_pickle():
+    view = ResourceView({"sku": "cpu", "name": "CPU"}, Hardware, Hardware.parse_obj)
+    assert view.sku == "cpu"
+
+    for copied in [
+        copy.copy(view),
+        copy.deepcopy(view),
+        pickle.loads(pickle.dumps(view)),  # noqa: S301
+    ]:
+        assert copied.sku == "cpu"
+        assert copied.to_resource() == Hardware(sku="cpu", name="CPU")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_list_does_not_revalidate_results(async_flag, monkeypatch):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="GET", path="/predictions").mock(
+        return_value=httpx.Response(
+            200,
+            json={"next": None, "previous": None, "results": [prediction]},
+        )
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    built = []
+    json_to_prediction = vaikerai.prediction._json_to_prediction
+    monkeypatch.setattr(
+        vaikerai.prediction,
+        "_json_to_prediction",
+        lambda client, obj: built.append(json_to_prediction(client, obj)) or built[-1],
+    )
+
+    if async_flag:
+        page = await client.predictions.async_list()
+    else:
+        page = client.predictions.list()
+
+    assert isinstance(page, Page)
+    assert page.next is None
+    assert page[0].id == "p1"
+    assert page.results == built
+    assert page[0] is built[0]
+    assert page[0]._client is client
+
+
+def pages_of(count: int):
+    return [
+        Page.construct(
+            previous=None,
+            next=str(i + 1) if i + 1 < count else None,
+            results=[i],
+        )
+        for i in range(count)
+    ]
+
+
+def test_paginate_prefetch():
+    pages = pages_of(4)
+    cursors = []
+    fetched = threading.Semaphore(0)
+
+    def list_method(cursor):
+        cursors.append(cursor)
+        fetched.release()
+        return pages[0 if cursor is ... else int(cursor)]
+
+    iterator = vaikerai.paginate(list_method, prefetch=1)
+    assert next(iterator) is pages[0]
+
+    # The next page is requested while the current page is being processed,
+    # but no more than `prefetch` pages are held ahead of the caller
+    for _ in range(3):
+        assert fetched.acquire(timeout=1)
+    assert not fetched.acquire(timeout=0.2)
+    assert cursors == [..., "1", "2"]
+
+    assert list(iterator) == pages[1:]
+    assert cursors == [..., "1", "2", "3"]
+
+
+def test_paginate_prefetch_error():
+    def list_method(cursor):
+        if cursor is ...:
+            return Page.construct(previous=None, next="1", results=[])
+        raise ValueError("boom")
+
+    iterator = vaikerai.paginate(list_method, prefetch=2)
+    next(iterator)
+    with pytest.raises(ValueError, match="boom"):
+        next(iterator)
+
+
+@pytest.mark.asyncio
+async def test_async_paginate_prefetch():
+    pages = pages_of(4)
+    cursors = []
+
+    async def list_method(cursor):
+        cursors.append(cursor)
+        return pages[0 if cursor is ... else int(cursor)]
+
+    iterator = vaikerai.async_paginate(list_method, prefetch=1)
+    assert await iterator.__anext__() is pages[0]
+
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert cursors == [..., "1", "2"]
+
+    assert [page async for page in iterator] == pages[1:]
+    assert cursors == [..., "1", "2", "3"]
+
+    # Closing the iterator early stops fetching
+    iterator = vaikerai.async_paginate(list_method, prefetch=1)
+    await iterator.__anext__()
+    await iterator.aclose()
+    fetched = len(cursors)
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert len(cursors) == fetched
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_iter_all(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    second = router.route(
+        method="GET", path="/predictions", params={"cursor": "abc"}
+    ).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "next": None,
+                "previous": None,
+                "results": [
+                    {**prediction, "id": "p3", "created_at": "2024-01-01T00:00:00Z"},
+                ],
+            },
+        )
+    )
+
+    first = router.route(method="GET", path="/predictions").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "next": "https://api.vaikerai.com/v1/predictions?cursor=abc",
+                "previous": None,
+                "results": [
+                    {**prediction, "id": "p1", "created_at": "2024-01-03T00:00:00Z"},
+                    {**prediction, "id": "p2", "created_at": "2024-01-02T00:00:00Z"},
+                ],
+            },
+        )
+    )
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    async def ids(**kwargs):
+        if async_flag:
+            return [p.id async for p in client.predictions.aiter_all(**kwargs)]
+        return [p.id for p in client.predictions.iter_all(**kwargs)]
+
+    assert await ids() == ["p1", "p2", "p3"]
+    assert second.call_count == 1
+
+    # Stopping within the first page never fetches the second
+    assert await ids(limit=2) == ["p1", "p2"]
+    assert await ids(until=lambda p: p.created_at < "2024-01-03") == ["p1"]
+    assert await ids(limit=0) == []
+    assert first.call_count == 3
+    assert second.call_count == 1
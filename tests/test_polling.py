@@ -0,0 +1,119 @@
+import httpx
+import pytest
+import respx
+
+from vaikerai.client import Client
+from vaikerai.polling import (
+    BackoffPollingStrategy,
+    FixedPollingStrategy,
+    PollingStats,
+)
+
+
+def prediction_with_status(status: str) -> dict:
+    return {
+        "id": "p1",
+        "model": "test/example",
+        "version": "v1",
+        "urls": {
+            "get": "https://api.vaikerai.com/v1/predictions/p1",
+            "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+        },
+        "created_at": "2023-10-05T12:00:00.000000Z",
+        "source": "api",
+        "status": status,
+        "input": {"text": "world"},
+        "output": "Hello, world!" if status == "succeeded" else None,
+        "error": None,
+        "logs": "",
+    }
+
+
+def test_fixed_polling_strategy():
+    strategy = FixedPollingStrategy()
+    schedule = strategy.schedule(0.5)
+
+    intervals = [schedule.next_interval("processing") for _ in range(5)]
+
+    assert intervals == [0.5] * 5
+    assert strategy.stats.polls == 5
+    assert strategy.stats.saved == 0
+
+
+def test_backoff_polling_strategy_fast_start_and_caps():
+    strategy = BackoffPollingStrategy(
+        fast_start_polls=2,
+        starting_max_interval=4.0,
+        processing_max_interval=1.5,
+        jitter=False,
+    )
+    schedule = strategy.schedule(0.5)
+
+    assert schedule.next_interval("starting") == 0.5
+    assert schedule.next_interval("starting") == 0.5
+    assert schedule.next_interval("starting") == 1.5
+    assert schedule.next_interval("starting") == 4.0
+    assert schedule.next_interval("starting") == 4.0
+    assert schedule.next_interval("processing") == 1.5
+
+
+def test_backoff_polling_strategy_jitter_bounds():
+    strategy = BackoffPollingStrategy(fast_start_polls=0, processing_max_interval=2.0)
+    schedule = strategy.schedule(0.5)
+
+    for _ in range(100):
+        interval = schedule.next_interval("processing")
+        assert 0.5 <= interval <= 2.0
+
+
+def test_backoff_polling_strategy_with_zero_interval():
+    strategy = BackoffPollingStrategy(fast_start_polls=0)
+    schedule = strategy.schedule(0.0)
+
+    assert all(schedule.next_interval("starting") == 0.0 for _ in range(10))
+
+
+def test_polling_stats_counts_saved_requests():
+    stats = PollingStats()
+    stats.record(0.5, 0.5)
+    stats.record(2.0, 0.5)
+    stats.record(2.0, 0.5)
+
+    assert stats.polls == 3
+    assert stats.saved == 6
+    assert stats.time_waited == 4.5
+
+    stats.reset()
+    assert stats.polls == 0
+    assert stats.saved == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_wait_uses_polling_strategy(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="GET", path="/predictions/p1").mock(
+        side_effect=[
+            httpx.Response(200, json=prediction_with_status("starting")),
+            httpx.Response(200, json=prediction_with_status("processing")),
+            httpx.Response(200, json=prediction_with_status("succeeded")),
+        ]
+    )
+
+    strategy = FixedPollingStrategy()
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        polling_strategy=strategy,
+    )
+    client.poll_interval = 0.0
+
+    if async_flag:
+        prediction = await client.predictions.async_get("p1")
+        await prediction.async_wait()
+    else:
+        prediction = client.predictions.get("p1")
+        prediction.wait()
+
+    assert prediction.status == "succeeded"
+    assert strategy.stats.polls == 2
@@ -499,3 +499,98 @@ async def test_predictions_stream(async_flag):
 #             assert progress.current == 5
 #             assert progress.total == 5
 #             assert progress.percentage == 1.0
+
+
+def test_prediction_progress_is_read_incrementally():
+    prediction = vaikerai.prediction.Prediction(
+        id="p1",
+        model="test/example",
+        version="v1",
+        status="processing",
+        logs="",
+    )
+
+    logs = "Using seed: 12345\n"
+    prediction.logs = logs
+    assert prediction.progress is None
+
+    # Progress bars rewrite their line with carriage returns
+    for current in range(6):
+        logs += f"\r{current * 20}%|{'#' * current:<5}| {current}/5 [00:01<00:01]"
+        prediction.logs = logs
+        progress = prediction.progress
+        assert progress is not None
+        assert progress.current == current
+        assert progress.total == 5
+        assert progress.percentage == pytest.approx(current * 0.2)
+
+    logs += "\nDone\n"
+    prediction.logs = logs
+    assert prediction.progress is not None
+    assert prediction.progress.current == 5
+
+    # Logs that are replaced rather than appended to are read again
+    prediction.logs = "0%|          | 0/3 [00:00<?, ?it/s]"
+    assert prediction.progress is not None
+    assert prediction.progress.total == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_prediction_iter_logs(async_flag):
+    prediction = {
+        "id": "p1",
+        "model": "test/example",
+        "version": "v1",
+        "urls": {
+            "get": "https://api.vaikerai.com/v1/predictions/p1",
+            "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+        },
+        "created_at": "2022-04-26T20:00:40.658234Z",
+        "source": "api",
+        "status": "processing",
+        "input": {"text": "world"},
+        "output": None,
+        "error": None,
+        "logs": "starting\nloa",
+    }
+
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="GET", path="/predictions/p1").mock(
+        side_effect=[
+            httpx.Response(200, json=prediction),
+            httpx.Response(200, json={**prediction, "logs": "starting\nloaded\n"}),
+            httpx.Response(
+                200,
+                json={
+                    **prediction,
+                    "status": "succeeded",
+                    "logs": "starting\nloaded\nstep 1\nstep 2",
+                },
+            ),
+        ]
+    )
+
+    client = vaikerai.Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+    client.poll_interval = 0.0
+
+    if async_flag:
+        created = await client.predictions.async_get("p1")
+        lines = [line async for line in created.aiter_logs()]
+    else:
+        created = client.predictions.get("p1")
+        lines = list(created.iter_logs())
+
+    assert lines == ["starting", "loaded", "step 1", "step 2"]
+
+
+def test_log_reader_strips_crlf():
+    from vaikerai.prediction import _LogReader
+
+    reader = _LogReader()
+
+    assert reader.read("one\r\ntwo\r") == ["one"]
+    assert reader.read("one\r\ntwo\r\nthree") == ["two"]
+    assert reader.flush() == ["three"]
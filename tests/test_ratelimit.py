@@ -0,0 +1,84 @@
+import httpx
+import pytest
+import respx
+
+from vaikerai.client import Client
+from vaikerai.ratelimit import RateLimiter, endpoint_class, parse_retry_after
+
+
+def request(method: str, url: str) -> httpx.Request:
+    return httpx.Request(method, f"https://api.vaikerai.com{url}")
+
+
+def test_endpoint_class():
+    assert endpoint_class(request("POST", "/v1/predictions")) == "create"
+    assert endpoint_class(request("POST", "/v1/models/a/b/predictions")) == "create"
+    assert endpoint_class(request("POST", "/v1/predictions/p1/cancel")) == "other"
+    assert endpoint_class(request("GET", "/v1/predictions")) == "list"
+    assert endpoint_class(request("GET", "/v1/predictions?cursor=abc")) == "list"
+    assert endpoint_class(request("GET", "/v1/models/a/b/versions")) == "list"
+    assert endpoint_class(request("GET", "/v1/predictions/p1")) == "get"
+    assert endpoint_class(request("DELETE", "/v1/models/a/b")) == "other"
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"Retry-After": "3"}) == 3.0
+    assert parse_retry_after({"Retry-After": "2000-01-01T00:00:00+00:00"}) is None
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+
+
+def test_reserve_spaces_requests_after_burst():
+    limiter = RateLimiter({"get": 10.0}, burst=2)
+    get = request("GET", "/v1/predictions/p1")
+
+    delays = [limiter.reserve(get) for _ in range(4)]
+
+    assert delays[0] == 0
+    assert delays[1] == 0
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_adapts_to_429():
+    limiter = RateLimiter({"create": 10.0}, cooldown=60)
+    create = request("POST", "/v1/predictions")
+
+    limiter.observe(create, httpx.Response(429, headers={"Retry-After": "2"}))
+    assert limiter.rate("create") == 5.0
+    assert limiter.reserve(create) == pytest.approx(2.0, abs=0.05)
+
+    # Other responses to the same burst don't decrease the rate again
+    limiter.observe(create, httpx.Response(429))
+    assert limiter.rate("create") == 5.0
+
+    for _ in range(10):
+        limiter.observe(create, httpx.Response(201))
+    assert 5.0 < limiter.rate("create") <= 10.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_client_rate_limiter(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="GET", path="/predictions/p1").mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "0"}, json={}),
+            httpx.Response(200, json={}),
+        ]
+    )
+
+    limiter = RateLimiter({"get": 20.0})
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        rate_limiter=limiter,
+    )
+
+    if async_flag:
+        resp = await client._async_request("GET", "/v1/predictions/p1")
+    else:
+        resp = client._request("GET", "/v1/predictions/p1")
+
+    assert resp.status_code == 200
+    assert limiter.rate("get") < 20.0
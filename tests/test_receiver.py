@@ -0,0 +1,275 @@
+import base64
+import hashlib
+import hmac
+import io
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from vaikerai.client import Client
+from vaikerai.codec import StdlibJSONCodec
+from vaikerai.receiver import WebhookReceiver
+from vaikerai.replay import MemoryReplayStore
+from vaikerai.webhook import WebhookSigningSecret
+
+# This is a test secret and should not be used in production
+secret = WebhookSigningSecret(key="whsec_MfKQ9r8GKYqrTwjUPD8ILPZIo2LaLaSw")
+
+
+def prediction(status: str, **kwargs) -> dict:
+    return {
+        "id": "p1",
+        "model": "test/example",
+        "version": "v1",
+        "urls": {
+            "get": "https://api.vaikerai.com/v1/predictions/p1",
+            "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+        },
+        "created_at": "2024-01-01T00:00:00.000000Z",
+        "source": "api",
+        "status": status,
+        "input": {"text": "world"},
+        "output": None,
+        "error": None,
+        "logs": "",
+        **kwargs,
+    }
+
+
+def signed(obj: dict, *, timestamp: int = 0) -> tuple:
+    body = json.dumps(obj).encode()
+    webhook_id = "msg_1"
+    timestamp = timestamp or int(time.time())
+    key = base64.b64decode(secret.key.split("_")[1])
+    signature = hmac.new(
+        key, f"{webhook_id}.{timestamp}.".encode() + body, hashlib.sha256
+    ).digest()
+    headers = {
+        "Content-Type": "application/json",
+        "Webhook-ID": webhook_id,
+        "Webhook-Timestamp": str(timestamp),
+        "Webhook-Signature": f"v1,{base64.b64encode(signature).decode()}",
+    }
+    return headers, body
+
+
+def test_handle_resolves_waiting_predictions():
+    receiver = WebhookReceiver("https://example.com/webhooks", secret)
+
+    future = receiver.expect("p1")
+    headers, body = signed(prediction("processing"))
+    assert receiver.handle(headers, body) == 204
+    assert not future.done()
+
+    headers, body = signed(prediction("succeeded", output="Hello, world!"))
+    assert receiver.handle(headers, b"tampered" + body) == 400
+    assert receiver.handle({**headers, "Webhook-Timestamp": "1"}, body) == 400
+    assert not future.done()
+
+    assert receiver.handle(headers, body) == 204
+    assert future.result(timeout=0)["output"] == "Hello, world!"
+
+    # Webhooks that arrive before anything waits on them aren't missed
+    headers, body = signed({**prediction("succeeded"), "id": "p2"})
+    assert receiver.handle(headers, body) == 204
+    assert receiver.expect("p2").result(timeout=0)["id"] == "p2"
+
+
+def test_handle_acknowledges_redeliveries():
+    receiver = WebhookReceiver(
+        "https://example.com/webhooks", secret, replay_store=MemoryReplayStore()
+    )
+
+    headers, body = signed(prediction("succeeded"))
+    assert receiver.handle(headers, body) == 204
+    assert receiver.expect("p1").result(timeout=0)["id"] == "p1"
+
+    # A redelivery is acknowledged, but doesn't resolve predictions again
+    assert receiver.handle(headers, body) == 204
+    assert not receiver.expect("p1").done()
+
+
+def test_handle_uses_client_json_codec():
+    class CountingCodec(StdlibJSONCodec):
+        loads_count = 0
+
+        def loads(self, data):
+            self.loads_count += 1
+            return super().loads(data)
+
+    codec = CountingCodec()
+    receiver = WebhookReceiver("https://example.com/webhooks", secret)
+    Client(api_token="test-token", json_codec=codec, webhook_receiver=receiver)
+    assert receiver.json_codec is codec
+
+    headers, body = signed(prediction("succeeded"))
+    assert receiver.handle(headers, body) == 204
+    assert codec.loads_count == 1
+
+    headers, body = signed(["not", "a", "prediction"])
+    assert receiver.handle(headers, body) == 400
+    headers, body = signed(prediction("succeeded"))
+    assert receiver.handle(headers, body[:-1]) == 400
+
+
+@pytest.mark.asyncio
+async def test_asgi_and_wsgi_apps():
+    receiver = WebhookReceiver("https://example.com/webhooks", secret)
+    headers, body = signed(prediction("succeeded"))
+
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+        **{f"HTTP_{k.upper().replace('-', '_')}": v for k, v in headers.items()},
+    }
+    statuses = []
+    receiver.wsgi(environ, lambda status, headers: statuses.append(status))
+    assert statuses == ["204 No Content"]
+    assert receiver.expect("p1").done()
+
+    messages = [
+        {"type": "http.request", "body": body[:10], "more_body": True},
+        {"type": "http.request", "body": body[10:]},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    future = receiver.expect("p1")
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+    await receiver.asgi(scope, receive, send)
+    assert sent[0]["status"] == 204
+    assert future.done()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_run_completes_with_webhook(async_flag):
+    receiver = WebhookReceiver("https://example.com/webhooks", secret)
+    host, port = receiver.listen()
+
+    def deliver():
+        headers, body = signed(prediction("succeeded", output="Hello, world!"))
+        httpx.post(f"http://{host}:{port}/", headers=headers, content=body)
+
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    create = router.route(method="POST", path="/models/test/example/predictions").mock(
+        side_effect=lambda request: (
+            threading.Timer(0.05, deliver).start()
+            or httpx.Response(201, json=prediction("starting"))
+        )
+    )
+    get = router.route(method="GET", path="/predictions/p1").mock(
+        return_value=httpx.Response(200, json=prediction("succeeded"))
+    )
+
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        webhook_receiver=receiver,
+    )
+
+    try:
+        if async_flag:
+            output = await client.async_run("test/example", completion="webhook")
+        else:
+            output = client.run("test/example", completion="webhook")
+    finally:
+        receiver.close()
+
+    assert output == "Hello, world!"
+    assert get.call_count == 0
+
+    body = json.loads(create.calls[0].request.content)
+    assert body["webhook"] == "https://example.com/webhooks"
+    assert body["webhook_events_filter"] == ["completed"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_run_falls_back_to_polling(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="POST", path="/models/test/example/predictions").mock(
+        return_value=httpx.Response(201, json=prediction("starting"))
+    )
+    get = router.route(method="GET", path="/predictions/p1").mock(
+        return_value=httpx.Response(
+            200, json=prediction("succeeded", output="Hello, world!")
+        )
+    )
+
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        webhook_receiver=WebhookReceiver(
+            "https://example.com/webhooks", secret, timeout=0.01
+        ),
+    )
+    client.poll_interval = 0.0
+
+    if async_flag:
+        output = await client.async_run("test/example", completion="webhook")
+    else:
+        output = client.run("test/example", completion="webhook")
+
+    assert output == "Hello, world!"
+    assert get.call_count == 1
+
+
+def test_run_requires_receiver():
+    client = Client(api_token="test-token")
+
+    with pytest.raises(ValueError):
+        client.run("test/example", completion="webhook")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_run_with_webhook_params(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    create = router.route(method="POST", path="/models/test/example/predictions").mock(
+        return_value=httpx.Response(201, json=prediction("starting"))
+    )
+    router.route(method="GET", path="/predictions/p1").mock(
+        return_value=httpx.Response(200, json=prediction("succeeded"))
+    )
+
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        webhook_receiver=WebhookReceiver(
+            "https://example.com/webhooks", secret, timeout=0.01
+        ),
+    )
+    client.poll_interval = 0.0
+
+    async def run(**params):
+        if async_flag:
+            return await client.async_run(
+                "test/example", completion="webhook", **params
+            )
+        return client.run("test/example", completion="webhook", **params)
+
+    # The receiver can't resolve predictions whose webhooks go elsewhere
+    with pytest.raises(ValueError):
+        await run(webhook="https://example.com/other")
+    assert create.call_count == 0
+
+    # It needs to be told when they complete
+    await run(webhook="https://example.com/webhooks", webhook_events_filter=["start"])
+    body = json.loads(create.calls[0].request.content)
+    assert body["webhook"] == "https://example.com/webhooks"
+    assert body["webhook_events_filter"] == ["start", "completed"]
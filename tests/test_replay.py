@@ -0,0 +1,136 @@
+import threading
+import time
+
+import pytest
+
+import vaikerai
+from vaikerai.replay import MemoryReplayStore, ReplayStore
+from vaikerai.webhook import (
+    DuplicateWebhookError,
+    InvalidSignatureError,
+    WebhookSigningSecret,
+    WebhookVerifier,
+)
+
+# This is a test secret and should not be used in production
+secret = WebhookSigningSecret(key="whsec_MfKQ9r8GKYqrTwjUPD8ILPZIo2LaLaSw")
+
+headers = {
+    "Webhook-ID": "msg_p5jXN8AQM9LWM0D4loKWxJek",
+    "Webhook-Timestamp": "1614265330",
+    "Webhook-Signature": "v1,g0hM9SsE+OTPJTGt/tmIKtSyZlE3uFJELVlNIOLJ1OE=",
+}
+body = '{"test": 2432232314}'
+
+
+def test_memory_replay_store():
+    store = MemoryReplayStore(shards=4)
+    now = time.time()
+
+    assert store.add("a", now + 60)
+    assert not store.add("a", now + 60)
+    assert store.add("b", now + 60)
+    assert len(store) == 2
+
+    # Expired IDs are forgotten as new ones are added, in any shard
+    assert store.add("expired", now - 1)
+    for i in range(8):
+        store.add(f"c{i}", now + 60)
+    assert store.add("expired", now + 60)
+
+    with pytest.raises(ValueError):
+        MemoryReplayStore(shards=0)
+
+
+def test_memory_replay_store_maxsize():
+    store = MemoryReplayStore(shards=1, maxsize=2)
+    now = time.time()
+
+    store.add("a", now + 10)
+    store.add("b", now + 30)
+    store.add("c", now + 20)
+
+    # The ID closest to expiring is evicted first
+    assert len(store) == 2
+    assert store.add("a", now + 10)
+    assert not store.add("b", now + 30)
+
+
+def test_memory_replay_store_discard():
+    store = MemoryReplayStore(shards=1)
+    now = time.time()
+
+    store.add("a", now + 60)
+    store.discard("a")
+    store.discard("missing")
+    assert len(store) == 0
+
+    # The discarded ID is accepted again, and expires as usual
+    assert store.add("a", now + 60)
+    assert not store.add("a", now + 60)
+
+
+def test_replay_store_requires_discard():
+    class AddOnlyStore(ReplayStore):
+        def add(self, webhook_id: str, expires_at: float) -> bool:
+            return True
+
+    with pytest.raises(TypeError):
+        AddOnlyStore()  # type: ignore[abstract]
+
+
+def test_memory_replay_store_is_atomic():
+    store = MemoryReplayStore()
+    expires_at = time.time() + 60
+    accepted = []
+
+    def add() -> None:
+        for i in range(1000):
+            if store.add(f"msg_{i}", expires_at):
+                accepted.append(i)
+
+    threads = [threading.Thread(target=add) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(accepted) == list(range(1000))
+
+
+def test_verifier_rejects_duplicates(monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 1614265330.0)
+
+    store = MemoryReplayStore()
+    verifier = WebhookVerifier(secret, tolerance=300, replay_store=store)
+
+    # Forged requests don't mark the ID as received
+    with pytest.raises(InvalidSignatureError):
+        verifier.verify(headers, body + " ")
+
+    verifier.verify(headers, body)
+    with pytest.raises(DuplicateWebhookError):
+        verifier.verify(headers, body)
+
+    # The store can be shared with `validate`
+    with pytest.raises(DuplicateWebhookError):
+        vaikerai.webhooks.validate(
+            headers=headers,
+            body=body,
+            secret=secret,
+            tolerance=300,
+            replay_store=store,
+        )
+
+    # A webhook whose handling failed is accepted when it's retried
+    store.discard(headers["Webhook-ID"])
+    vaikerai.webhooks.validate(
+        headers=headers,
+        body=body,
+        secret=secret,
+        tolerance=300,
+        replay_store=store,
+    )
+
+    with pytest.raises(ValueError):
+        WebhookVerifier(secret, replay_store=store)
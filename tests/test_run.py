@@ -1,4 +1,5 @@
 import asyncio
+import json
 import sys
 
 import httpx
@@ -253,3 +254,166 @@ async def test_run_with_model_error(mock_vaikerai_api_token):
     assert str(excinfo.value) == "OOM"
     assert excinfo.value.prediction.error == "OOM"
     assert excinfo.value.prediction.status == "failed"
+
+
+def iterator_prediction(status: str, **kwargs) -> dict:
+    return {
+        "id": "p1",
+        "model": "test/example",
+        "version": "v1",
+        "urls": {
+            "get": "https://api.vaikerai.com/v1/predictions/p1",
+            "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+            "stream": "https://api.vaikerai.com/v1/streams/p1",
+        },
+        "created_at": "2023-10-05T12:00:00.000000Z",
+        "source": "api",
+        "status": status,
+        "input": {"text": "world"},
+        "output": None,
+        "error": None,
+        "logs": "",
+        **kwargs,
+    }
+
+
+iterator_version = {
+    "id": "v1",
+    "created_at": "2024-07-18T00:35:56.210272Z",
+    "cog_version": "0.9.10",
+    "openapi_schema": {
+        "openapi": "3.0.2",
+        "components": {
+            "schemas": {
+                "Output": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "x-cog-array-type": "iterator",
+                },
+            }
+        },
+    },
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_run_streams_output_iterator(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    create = router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(201, json=iterator_prediction("starting"))
+    )
+    get = router.route(method="GET", path="/predictions/p1").mock(
+        return_value=httpx.Response(200, json=iterator_prediction("succeeded"))
+    )
+    router.route(method="GET", path="/models/test/example/versions/v1").mock(
+        return_value=httpx.Response(200, json=iterator_version)
+    )
+    router.route(method="GET", path="/streams/p1").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=(
+                b"event: output\nid: 1\ndata: Hello\n\n"
+                b"event: logs\nid: 2\ndata: generating\n\n"
+                b"event: output\nid: 3\ndata: , world!\n\n"
+                b"event: done\nid: 4\ndata: {}\n\n"
+            ),
+        )
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    if async_flag:
+        output = await client.async_run("test/example:v1", input={"text": "world"})
+        assert [item async for item in output] == ["Hello", ", world!"]
+    else:
+        output = client.run("test/example:v1", input={"text": "world"})
+        assert list(output) == ["Hello", ", world!"]
+
+    assert json.loads(create.calls[0].request.content)["stream"] is True
+    assert get.call_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_run_stream_error_raises_model_error(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(201, json=iterator_prediction("starting"))
+    )
+    router.route(method="GET", path="/predictions/p1").mock(
+        return_value=httpx.Response(
+            200, json=iterator_prediction("failed", error="OOM", output=["Hello"])
+        )
+    )
+    router.route(method="GET", path="/models/test/example/versions/v1").mock(
+        return_value=httpx.Response(200, json=iterator_version)
+    )
+    router.route(method="GET", path="/streams/p1").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=(
+                b"event: output\nid: 1\ndata: Hello\n\n"
+                b"event: error\nid: 2\ndata: OOM\n\n"
+            ),
+        )
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    with pytest.raises(ModelError) as excinfo:
+        if async_flag:
+            output = await client.async_run("test/example:v1")
+            [item async for item in output]
+        else:
+            list(client.run("test/example:v1"))
+
+    assert excinfo.value.prediction.error == "OOM"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+@pytest.mark.parametrize("unavailable", ["status", "connection"])
+async def test_run_falls_back_to_polling_when_stream_is_unavailable(
+    async_flag, unavailable, monkeypatch
+):
+    monkeypatch.setattr(sys.modules["vaikerai.stream"], "DEFAULT_RECONNECT_DELAY", 0.0)
+
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(201, json=iterator_prediction("starting"))
+    )
+    router.route(method="GET", path="/predictions/p1").mock(
+        return_value=httpx.Response(
+            200, json=iterator_prediction("succeeded", output=["Hello", ", world!"])
+        )
+    )
+    router.route(method="GET", path="/models/test/example/versions/v1").mock(
+        return_value=httpx.Response(200, json=iterator_version)
+    )
+
+    def stream(request: httpx.Request) -> httpx.Response:
+        if unavailable == "connection":
+            raise httpx.ConnectError("Connection refused", request=request)
+        return httpx.Response(
+            503, headers={"Retry-After": "0"}, json={"detail": "Service unavailable"}
+        )
+
+    router.route(method="GET", path="/streams/p1").mock(side_effect=stream)
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    if async_flag:
+        output = await client.async_run("test/example:v1")
+        assert [item async for item in output] == ["Hello", ", world!"]
+    else:
+        output = client.run("test/example:v1")
+        assert list(output) == ["Hello", ", world!"]
@@ -1,10 +1,22 @@
 import os
+import sys
+from typing import AsyncIterator, Iterator
 
+import httpx
 import pytest
+import respx
 
 import vaikerai
+from vaikerai.client import Client
 from vaikerai.exceptions import VaikerAIError
-from vaikerai.stream import ServerSentEvent
+from vaikerai.prediction import Prediction
+from vaikerai.stream import (
+    MAX_RECONNECTS,
+    EventSource,
+    LightweightServerSentEvent,
+    ServerSentEvent,
+    _Reconnection,
+)
 
 skip_if_no_token = pytest.mark.skipif(
     os.environ.get("VAIKERAI_API_TOKEN") is None, reason="VAIKERAI_API_TOKEN not set"
@@ -75,3 +87,256 @@ async def test_stream_prediction(async_flag, record_mode):
             pytest.skip("Skipping test due to authentication error")
         else:
             raise e
+
+
+def test_byte_decoder_handles_split_chunks():
+    body = (
+        b": comment\r\n"
+        b"event: output\r\nid: 1\r\ndata: Hello\r\n\r\n"
+        b"event: output\nid: 2\ndata: caf\xc3\xa9\ndata: line\n\n"
+        b"event: unknown\nid: 3\ndata: ignored\n\n"
+        b"event: done\nid: 4\nretry: 1000\ndata: {}\n\n"
+    )
+
+    # Split the body at every offset, including inside CRLF and multi-byte characters
+    for size in range(1, len(body)):
+        decoder = EventSource.ByteDecoder()
+        events = []
+        for start in range(0, len(body), size):
+            events.extend(decoder.feed(body[start : start + size]))
+
+        assert [(e.event, e.data, e.id, e.retry) for e in events] == [
+            (ServerSentEvent.EventType.OUTPUT, "Hello", "1", None),
+            (ServerSentEvent.EventType.OUTPUT, "café\nline", "2", None),
+            (ServerSentEvent.EventType.DONE, "{}", "4", 1000),
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+@pytest.mark.parametrize("validate", [True, False])
+async def test_stream_events(async_flag, validate):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    router.route(method="POST", path="/predictions").mock(
+        return_value=httpx.Response(
+            201,
+            json={
+                "id": "p1",
+                "model": "test/example",
+                "version": "v1",
+                "urls": {
+                    "get": "https://api.vaikerai.com/v1/predictions/p1",
+                    "cancel": "https://api.vaikerai.com/v1/predictions/p1/cancel",
+                    "stream": "https://api.vaikerai.com/v1/stream/p1",
+                },
+                "created_at": "2024-01-01T00:00:00.000000Z",
+                "source": "api",
+                "status": "starting",
+                "input": {"text": "world"},
+            },
+        )
+    )
+    router.route(method="GET", path="/stream/p1").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=(
+                b"event: output\nid: 1\ndata: Hello\n\n"
+                b"event: output\nid: 2\ndata: , world!\n\n"
+                b"event: done\nid: 3\ndata: {}\n\n"
+            ),
+        )
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+
+    if async_flag:
+        events = [
+            event
+            async for event in await client.async_stream(
+                "test/example:v1", input={"text": "world"}, validate=validate
+            )
+        ]
+    else:
+        events = list(
+            client.stream("test/example:v1", input={"text": "world"}, validate=validate)
+        )
+
+    expected_type = ServerSentEvent if validate else LightweightServerSentEvent
+    assert all(isinstance(event, expected_type) for event in events)
+    assert "".join(str(event) for event in events) == "Hello, world!"
+    assert events[-1].event == ServerSentEvent.EventType.DONE
+
+
+class DroppedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.content
+        raise httpx.ReadError("connection dropped")
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.content
+        raise httpx.ReadError("connection dropped")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_stream_reconnects_with_last_event_id(async_flag):
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    route = router.route(method="GET", path="/stream/p1").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                headers={"Content-Type": "text/event-stream"},
+                stream=DroppedStream(
+                    b"retry: 0\nevent: output\nid: 1\ndata: Hello\n\n"
+                    b"event: output\nid: 2\ndata: , \n\n"
+                ),
+            ),
+            httpx.Response(
+                200,
+                headers={"Content-Type": "text/event-stream"},
+                content=(
+                    b"event: output\nid: 2\ndata: , \n\n"
+                    b"event: output\nid: 3\ndata: world!\n\n"
+                    b"event: done\nid: 4\ndata: {}\n\n"
+                ),
+            ),
+        ]
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+    prediction = Prediction(
+        id="p1",
+        model="test/example",
+        version="v1",
+        urls={"stream": "https://api.vaikerai.com/v1/stream/p1"},
+        status="processing",
+        input={},
+    )
+    prediction._client = client
+
+    if async_flag:
+        events = [event async for event in prediction.async_stream()]
+    else:
+        events = list(prediction.stream())
+
+    assert [event.id for event in events] == ["1", "2", "3", "4"]
+    assert "".join(str(event) for event in events) == "Hello, world!"
+    assert route.call_count == 2
+    assert "Last-Event-ID" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["Last-Event-ID"] == "2"
+
+
+def test_stream_gives_up_after_max_reconnects():
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    route = router.route(method="GET", path="/stream/p1").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=b"retry: 0\nevent: output\nid: 1\ndata: Hello\n\n",
+        )
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+    prediction = Prediction(
+        id="p1",
+        model="test/example",
+        version="v1",
+        urls={"stream": "https://api.vaikerai.com/v1/stream/p1"},
+        status="processing",
+        input={},
+    )
+    prediction._client = client
+
+    events = []
+    with pytest.raises(VaikerAIError):
+        for event in prediction.stream():
+            events.append(event)
+
+    assert [event.id for event in events] == ["1"]
+    assert route.call_count == MAX_RECONNECTS + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_stream_reconnects_after_server_errors(async_flag, monkeypatch):
+    monkeypatch.setattr(sys.modules["vaikerai.stream"], "DEFAULT_RECONNECT_DELAY", 0.0)
+
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    route = router.route(method="GET", path="/stream/p1").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                headers={"Content-Type": "text/event-stream"},
+                stream=DroppedStream(b"event: output\nid: 1\ndata: Hello\n\n"),
+            ),
+            # Without Retry-After, so that the transport doesn't wait to retry
+            httpx.Response(502, json={"detail": "Bad gateway"}),
+            httpx.Response(
+                200,
+                headers={"Content-Type": "text/event-stream"},
+                content=(
+                    b"event: output\nid: 2\ndata: , world!\n\n"
+                    b"event: done\nid: 3\ndata: {}\n\n"
+                ),
+            ),
+            httpx.Response(404, json={"detail": "Not found"}),
+        ]
+    )
+
+    client = Client(
+        api_token="test-token", transport=httpx.MockTransport(router.handler)
+    )
+    prediction = Prediction(
+        id="p1",
+        model="test/example",
+        version="v1",
+        urls={"stream": "https://api.vaikerai.com/v1/stream/p1"},
+        status="processing",
+        input={},
+    )
+    prediction._client = client
+
+    if async_flag:
+        events = [event async for event in prediction.async_stream()]
+    else:
+        events = list(prediction.stream())
+
+    assert "".join(str(event) for event in events) == "Hello, world!"
+    assert route.calls[1].request.headers["Last-Event-ID"] == "1"
+    assert route.calls[2].request.headers["Last-Event-ID"] == "1"
+
+    # Other errors aren't worth reconnecting after
+    with pytest.raises(VaikerAIError) as excinfo:
+        if async_flag:
+            [event async for event in prediction.async_stream()]
+        else:
+            list(prediction.stream())
+    assert excinfo.value.status == 404
+    assert route.call_count == 4
+
+
+def test_reconnection_remembers_only_recent_event_ids():
+    reconnection = _Reconnection()
+    events = [
+        LightweightServerSentEvent(
+            event=ServerSentEvent.EventType.OUTPUT, data=str(i), id=str(i)
+        )
+        for i in range(1000)
+    ]
+
+    assert all(reconnection.receive(sse) for sse in events)
+    assert len(reconnection._seen) <= 256
+
+    # Events a server sends again after reconnecting are still skipped
+    assert not reconnection.receive(events[-1])
+    assert reconnection.last_event_id == "999"
@@ -0,0 +1,285 @@
+import httpx
+import pytest
+import respx
+
+from vaikerai.client import Client
+from vaikerai.exceptions import VaikerAIError
+from vaikerai.polling import FixedPollingStrategy
+from vaikerai.prediction import _json_to_prediction
+from vaikerai.waiter import PredictionWaiter
+
+
+def prediction_with_status(id: str, status: str, created_at: str) -> dict:
+    return {
+        "id": id,
+        "model": "test/example",
+        "version": "v1",
+        "urls": {
+            "get": f"https://api.vaikerai.com/v1/predictions/{id}",
+            "cancel": f"https://api.vaikerai.com/v1/predictions/{id}/cancel",
+        },
+        "created_at": created_at,
+        "source": "api",
+        "status": status,
+        "input": {"text": "world"},
+        "output": f"Hello from {id}" if status == "succeeded" else None,
+        "error": None,
+        "logs": "",
+    }
+
+
+def make_router() -> respx.Router:
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+
+    router.route(method="GET", path="/predictions", name="predictions.list").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "next": None,
+                "previous": None,
+                "results": [
+                    prediction_with_status(
+                        "p2", "processing", "2024-01-01T00:00:02.000000Z"
+                    ),
+                    prediction_with_status(
+                        "p1", "succeeded", "2024-01-01T00:00:01.000000Z"
+                    ),
+                ],
+            },
+        )
+    )
+    router.route(method="GET", path="/predictions/p2", name="predictions.get.p2").mock(
+        return_value=httpx.Response(
+            200,
+            json=prediction_with_status(
+                "p2", "succeeded", "2024-01-01T00:00:02.000000Z"
+            ),
+        )
+    )
+    router.route(method="GET", path="/predictions/p3", name="predictions.get.p3").mock(
+        return_value=httpx.Response(
+            200,
+            json=prediction_with_status(
+                "p3", "succeeded", "2023-01-01T00:00:00.000000Z"
+            ),
+        )
+    )
+
+    return router
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_watch(async_flag):
+    router = make_router()
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        polling_strategy=FixedPollingStrategy(),
+    )
+    client.poll_interval = 0.0
+
+    if async_flag:
+        finished = [
+            prediction
+            async for prediction in client.predictions.async_watch(["p1", "p2", "p3"])
+        ]
+    else:
+        finished = list(client.predictions.watch(["p1", "p2", "p3"]))
+
+    assert sorted(p.id for p in finished) == ["p1", "p2", "p3"]
+    assert all(p.status == "succeeded" for p in finished)
+    assert finished[-1].id == "p2"
+
+    # p1 and p2 are found by listing, p3 is fetched as a straggler,
+    # and once only p2 is left it's cheaper to fetch it directly
+    assert router["predictions.list"].call_count == 1
+    assert router["predictions.get.p3"].call_count == 1
+    assert router["predictions.get.p2"].call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_waiter_wait():
+    router = make_router()
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        polling_strategy=FixedPollingStrategy(),
+    )
+    client.poll_interval = 0.0
+
+    waiter = PredictionWaiter(client)
+    futures = [waiter.add(id) for id in ["p1", "p2", "p3"]]
+    prediction = await waiter.wait("p2")
+
+    assert prediction.output == "Hello from p2"
+    assert all(future.done() for future in futures)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_watch_many_predictions(async_flag):
+    # 500 tracked predictions, followed by older ones that aren't tracked
+    ids = [f"p{i}" for i in range(700)]
+    listed = {id: 0 for id in ids}
+    page_size = 50
+
+    def list_predictions(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params.get("cursor", 0))
+        results = []
+        for i in range(start, min(start + page_size, len(ids))):
+            id = ids[i]
+            # Each prediction finishes after it's been listed once
+            status = "succeeded" if listed[id] else "processing"
+            listed[id] += 1
+            created_at = f"2024-01-01T00:{59 - i // 60:02d}:{59 - i % 60:02d}.000000Z"
+            results.append(prediction_with_status(id, status, created_at))
+
+        next = start + page_size
+        return httpx.Response(
+            200,
+            json={
+                "next": f"https://api.vaikerai.com/v1/predictions?cursor={next}"
+                if next < len(ids)
+                else None,
+                "previous": None,
+                "results": results,
+            },
+        )
+
+    router = respx.Router(base_url="https://api.vaikerai.com/v1")
+    list_route = router.route(method="GET", path="/predictions").mock(
+        side_effect=list_predictions
+    )
+    get_route = router.route(method="GET", path__regex=r"/predictions/p\d+").mock(
+        return_value=httpx.Response(404, json={})
+    )
+
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        polling_strategy=FixedPollingStrategy(),
+    )
+    client.poll_interval = 0.0
+
+    tracked = ids[:500]
+    if async_flag:
+        finished = [p async for p in client.predictions.async_watch(tracked)]
+    else:
+        finished = list(client.predictions.watch(tracked))
+
+    assert len(finished) == 500
+    # Two rounds of 10 pages each, without listing older pages or fetching any prediction
+    assert list_route.call_count == 20
+    assert get_route.call_count == 0
+
+
+def test_stragglers_are_capped_per_round():
+    waiter = PredictionWaiter(Client(api_token="test-token"), max_fetches=2)
+    remaining = {"p1", "p2", "p3"}
+
+    rounds = [waiter._stragglers(remaining) for _ in range(3)]
+
+    assert all(len(fetched) == 2 for fetched in rounds)
+    assert set().union(*rounds) == remaining
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_watch_fails_only_predictions_that_cant_be_fetched(async_flag):
+    router = make_router()
+    router.route(method="GET", path="/predictions/p4").mock(
+        return_value=httpx.Response(404, json={"detail": "Not found"})
+    )
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        polling_strategy=FixedPollingStrategy(),
+    )
+    client.poll_interval = 0.0
+
+    waiter = PredictionWaiter(client)
+    errors = {}
+    if async_flag:
+        finished = [
+            p
+            async for p in waiter.async_iter_completed(
+                ["p1", "p2", "p3", "p4"], errors=errors
+            )
+        ]
+    else:
+        finished = list(waiter.iter_completed(["p1", "p2", "p3", "p4"], errors=errors))
+
+    assert sorted(p.id for p in finished) == ["p1", "p2", "p3"]
+    assert list(errors) == ["p4"]
+    assert isinstance(errors["p4"], VaikerAIError)
+
+    # Without `errors`, the error is raised after the others have finished
+    finished = []
+    with pytest.raises(VaikerAIError):
+        if async_flag:
+            async for p in client.predictions.async_watch(["p1", "p2", "p3", "p4"]):
+                finished.append(p)
+        else:
+            for p in client.predictions.watch(["p1", "p2", "p3", "p4"]):
+                finished.append(p)
+    assert sorted(p.id for p in finished) == ["p1", "p2", "p3"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_flag", [True, False])
+async def test_listing_is_capped_on_busy_accounts(async_flag):
+    # Pages of newer predictions that aren't tracked, without end
+    def list_predictions(request: httpx.Request) -> httpx.Response:
+        cursor = int(request.url.params.get("cursor", 0))
+        return httpx.Response(
+            200,
+            json={
+                "next": f"https://api.vaikerai.com/v1/predictions?cursor={cursor + 1}",
+                "previous": None,
+                "results": [
+                    prediction_with_status(
+                        f"other{cursor}-{i}",
+                        "processing",
+                        "2024-06-01T00:00:00.000000Z",
+                    )
+                    for i in range(2)
+                ],
+            },
+        )
+
+    router = make_router()
+    router.routes.pop("predictions.list")
+    list_route = router.route(method="GET", path="/predictions").mock(
+        side_effect=list_predictions
+    )
+    router.route(method="GET", path="/predictions/p1").mock(
+        return_value=httpx.Response(
+            200,
+            json=prediction_with_status(
+                "p1", "succeeded", "2024-01-01T00:00:01.000000Z"
+            ),
+        )
+    )
+    client = Client(
+        api_token="test-token",
+        transport=httpx.MockTransport(router.handler),
+        polling_strategy=FixedPollingStrategy(),
+    )
+    client.poll_interval = 0.0
+
+    tracked = [
+        _json_to_prediction(
+            client,
+            prediction_with_status(id, "processing", "2024-01-01T00:00:00.000000Z"),
+        )
+        for id in ["p1", "p2", "p3"]
+    ]
+    if async_flag:
+        finished = [p async for p in client.predictions.async_watch(tracked)]
+    else:
+        finished = list(client.predictions.watch(tracked))
+
+    assert len(finished) == 3
+    # Listing stops after covering twice as many predictions as are tracked
+    assert list_route.call_count == 3
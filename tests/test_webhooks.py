@@ -14,6 +14,7 @@ from vaikerai.webhook import (
     MissingWebhookBodyError,
     MissingWebhookHeaderError,
     WebhookSigningSecret,
+    WebhookVerifier,
 )
 
 
@@ -164,3 +165,50 @@ def test_validate_webhook_timestamp(
             secret=webhook_signing_secret,
             tolerance=3600,
         )
+
+
+def test_webhook_verifier(webhook_signing_secret):
+    headers = {
+        "Content-Type": "application/json",
+        "Webhook-ID": "msg_p5jXN8AQM9LWM0D4loKWxJek",
+        "Webhook-Timestamp": "1614265330",
+        "Webhook-Signature": "v1,g0hM9SsE+OTPJTGt/tmIKtSyZlE3uFJELVlNIOLJ1OE=",
+    }
+    body = b'{"test": 2432232314}'
+
+    verifier = WebhookVerifier(webhook_signing_secret)
+    verifier.verify(headers, body)
+    verifier.verify(headers, body.decode())
+    verifier.verify({k.lower(): v for k, v in headers.items()}, memoryview(body))
+    verifier.verify_request(
+        Request("POST", "http://test.host/webhook", headers=headers, content=body)
+    )
+
+    with pytest.raises(InvalidSignatureError):
+        verifier.verify(headers, body + b" ")
+    with pytest.raises(MissingWebhookHeaderError):
+        verifier.verify({"Webhook-ID": headers["Webhook-ID"]}, body)
+    with pytest.raises(MissingWebhookBodyError):
+        verifier.verify(headers, b"")
+    with pytest.raises(InvalidTimestampError):
+        WebhookVerifier(webhook_signing_secret, tolerance=3600).verify(headers, body)
+
+
+def test_webhook_verifier_rotation(webhook_signing_secret):
+    headers = {
+        "Webhook-ID": "msg_p5jXN8AQM9LWM0D4loKWxJek",
+        "Webhook-Timestamp": "1614265330",
+        "Webhook-Signature": "v1,g0hM9SsE+OTPJTGt/tmIKtSyZlE3uFJELVlNIOLJ1OE=",
+    }
+    body = b'{"test": 2432232314}'
+    new_secret = WebhookSigningSecret(key="whsec_c2VjcmV0LWFmdGVyLXJvdGF0aW9u")
+
+    with pytest.raises(InvalidSignatureError):
+        WebhookVerifier(new_secret).verify(headers, body)
+
+    WebhookVerifier([new_secret, webhook_signing_secret]).verify(headers, body)
+
+    with pytest.raises(InvalidSecretKeyError):
+        WebhookVerifier(WebhookSigningSecret(key="invalid"))
+    with pytest.raises(ValueError):
+        WebhookVerifier([])
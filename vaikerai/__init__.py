@@ -16,6 +16,7 @@ async_paginate = _async_paginate
 collections = default_client.collections
 hardware = default_client.hardware
 deployments = default_client.deployments
+files = default_client.files
 models = default_client.models
 predictions = default_client.predictions
 trainings = default_client.trainings
@@ -35,7 +35,7 @@ class Accounts(Namespace):
         """
 
         resp = self._client._request("GET", "/v1/account")
-        obj = resp.json()
+        obj = self._client._decode_json(resp)
 
         return _json_to_account(obj)
 
@@ -48,7 +48,7 @@ class Accounts(Namespace):
         """
 
         resp = await self._client._async_request("GET", "/v1/account")
-        obj = resp.json()
+        obj = self._client._decode_json(resp)
 
         return _json_to_account(obj)
 
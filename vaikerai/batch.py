@@ -0,0 +1,231 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+from vaikerai.exceptions import ModelError
+from vaikerai.polling import TERMINAL_STATUSES
+from vaikerai.waiter import PredictionWaiter
+
+if TYPE_CHECKING:
+    from vaikerai.client import Client
+    from vaikerai.prediction import Prediction
+
+
+@dataclass
+class BatchResult:
+    """
+    The result for one input in a batch of predictions.
+    """
+
+    index: int
+    """The position of the input in the batch."""
+
+    input: Dict[str, Any]
+    """The input to the prediction."""
+
+    prediction: Optional["Prediction"] = None
+    """The prediction, if it was created."""
+
+    output: Optional[Any] = None
+    """The output of the prediction, if it was run to completion."""
+
+    error: Optional[Exception] = None
+    """The error raised while creating or running the prediction, if any."""
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the prediction was created (and run) without error.
+        """
+
+        return self.error is None
+
+
+def create_many(
+    create: Callable[..., "Prediction"],
+    inputs: Iterable[Dict[str, Any]],
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    max_concurrency: int,
+) -> List[BatchResult]:
+    """
+    Create a prediction for each input, with at most `max_concurrency` requests in flight.
+
+    Inputs are encoded and submitted on worker threads, and consumed from
+    `inputs` lazily. Each is passed to `create` with `params`,
+    which are adjusted for each item where needed.
+    Errors are reported per item instead of being raised.
+    """
+
+    if max_concurrency < 1:
+        raise ValueError(
+            f"max_concurrency should be at least 1, actual {max_concurrency}"
+        )
+
+    items = enumerate(inputs)
+    lock = threading.Lock()
+    results: Dict[int, BatchResult] = {}
+
+    def worker() -> None:
+        while True:
+            with lock:
+                item = next(items, None)
+            if item is None:
+                return
+
+            index, input = item
+            result = BatchResult(index=index, input=input)
+            try:
+                result.prediction = create(input, **_item_params(params, index))
+            except Exception as exc:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+                result.error = exc
+            results[index] = result
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for future in [executor.submit(worker) for _ in range(max_concurrency)]:
+            future.result()
+
+    return [results[index] for index in range(len(results))]
+
+
+async def async_create_many(
+    create: Callable[..., Awaitable["Prediction"]],
+    inputs: Iterable[Dict[str, Any]],
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    max_concurrency: int,
+) -> List[BatchResult]:
+    """
+    Create a prediction for each input, with at most `max_concurrency` requests in flight.
+
+    Inputs are consumed from `inputs` lazily by a fixed number of tasks.
+    Each is passed to `create` with `params`, which are adjusted for each item where needed.
+    Errors are reported per item instead of being raised.
+    """
+
+    if max_concurrency < 1:
+        raise ValueError(
+            f"max_concurrency should be at least 1, actual {max_concurrency}"
+        )
+
+    items = enumerate(inputs)
+    results: Dict[int, BatchResult] = {}
+
+    async def worker() -> None:
+        for index, input in items:
+            result = BatchResult(index=index, input=input)
+            try:
+                result.prediction = await create(input, **_item_params(params, index))
+            except Exception as exc:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+                result.error = exc
+            results[index] = result
+
+    await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+
+    return [results[index] for index in range(len(results))]
+
+
+def run_many(
+    client: "Client",
+    create: Callable[..., "Prediction"],
+    inputs: Iterable[Dict[str, Any]],
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    max_concurrency: int,
+) -> List[BatchResult]:
+    """
+    Create a prediction for each input and wait for all of them to finish.
+    """
+
+    results = create_many(
+        create, inputs, params=params, max_concurrency=max_concurrency
+    )
+
+    pending = [result.prediction for result in results if result.prediction]
+    errors: Dict[str, Exception] = {}
+    try:
+        for _ in PredictionWaiter(client).iter_completed(pending, errors=errors):
+            pass
+    except Exception as exc:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+        # Listing predictions failed, so none of the unfinished ones can be waited on
+        for result in results:
+            if result.prediction and result.prediction.status not in TERMINAL_STATUSES:
+                result.error = exc
+
+    for result in results:
+        if result.prediction and result.prediction.id in errors:
+            result.error = errors[result.prediction.id]
+
+    for result in results:
+        _set_output(result)
+
+    return results
+
+
+async def async_run_many(
+    client: "Client",
+    create: Callable[..., Awaitable["Prediction"]],
+    inputs: Iterable[Dict[str, Any]],
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    max_concurrency: int,
+) -> List[BatchResult]:
+    """
+    Create a prediction for each input and wait for all of them to finish asynchronously.
+    """
+
+    results = await async_create_many(
+        create, inputs, params=params, max_concurrency=max_concurrency
+    )
+
+    waiter = PredictionWaiter(client)
+    futures = [
+        (result, waiter.add(result.prediction))
+        for result in results
+        if result.prediction
+    ]
+    for result, future in futures:
+        try:
+            await future
+        except Exception as exc:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+            result.error = exc
+
+    for result in results:
+        _set_output(result)
+
+    return results
+
+
+def _item_params(params: Optional[Dict[str, Any]], index: int) -> Dict[str, Any]:
+    params = dict(params or {})
+
+    # A key identifies a single create request, so each item needs its own
+    key = params.get("idempotency_key")
+    if key is not None:
+        params["idempotency_key"] = f"{key}-{index}"
+
+    return params
+
+
+def _set_output(result: BatchResult) -> None:
+    if result.prediction is None or result.error is not None:
+        return
+
+    if result.prediction.status == "failed":
+        result.error = ModelError(result.prediction)
+    else:
+        result.output = result.prediction.output
+
+
+__all__ = ["BatchResult"]
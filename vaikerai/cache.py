@@ -0,0 +1,418 @@
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from vaikerai.version import Version
+
+
+class CachedVersion(NamedTuple):
+    """
+    A model version and the metadata derived from its OpenAPI schema.
+    """
+
+    version: Version
+    """The model version."""
+
+    has_output_iterator: bool
+    """Whether the version's output is an iterator."""
+
+
+class VersionCache:
+    """
+    A size-bounded, thread-safe LRU cache of model versions.
+
+    Model versions are immutable, so entries never need to be invalidated.
+    If `path` is set, the cache is loaded from and saved to that JSON file,
+    so that it survives across processes.
+    """
+
+    maxsize: int
+    """The maximum number of versions to keep."""
+
+    path: Optional[str]
+    """The file to persist the cache to, if any."""
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.path = os.fspath(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str, str], CachedVersion]" = (
+            OrderedDict()
+        )
+        self._loaded = self.path is None
+
+    def get(self, owner: str, name: str, version_id: str) -> Optional[CachedVersion]:
+        """
+        Return the cached version, if any.
+        """
+
+        key = (owner, name, version_id)
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, owner: str, name: str, version_id: str, entry: CachedVersion) -> None:
+        """
+        Add a version to the cache.
+        """
+
+        key = (owner, name, version_id)
+        with self._lock:
+            self._load()
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._save()
+
+    def clear(self) -> None:
+        """
+        Remove all versions from the cache.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        if self._loaded or self.path is None:
+            return
+
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        for item in data.get("versions", [])[-self.maxsize :]:
+            try:
+                key = (item["owner"], item["name"], item["version"]["id"])
+                self._entries[key] = CachedVersion(
+                    Version(**item["version"]), bool(item["has_output_iterator"])
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+
+        versions = [
+            {
+                "owner": owner,
+                "name": name,
+                "version": json.loads(entry.version.json()),
+                "has_output_iterator": entry.has_output_iterator,
+            }
+            for (owner, name, _), entry in self._entries.items()
+        ]
+
+        _write_json(self.path, {"versions": versions})
+
+
+default_version_cache = VersionCache()
+"""The version cache shared by every client in this process, unless one is configured."""
+
+
+class _CachedUpload(NamedTuple):
+    value: str
+    expires_at: float
+
+
+class UploadCache:
+    """
+    A content-addressed cache of encoded file inputs.
+
+    Files are keyed by the SHA-256 digest of their contents,
+    and map to the URL they were uploaded to, or to their data URI.
+    For files on disk, the digest is remembered by path, size, and modification time,
+    so unchanged files are recognized without being read again.
+
+    Entries expire after `ttl` seconds, and the least recently used entries are evicted
+    once there are more than `maxsize` of them
+    or their values take up more than `max_bytes`.
+    If `path` is set, uploaded URLs and file digests are loaded from and saved to that JSON file,
+    so that they survive across processes. Data URIs are only cached in memory.
+    """
+
+    maxsize: int
+    """The maximum number of files to keep."""
+
+    max_bytes: int
+    """The maximum total size of the cached values, in bytes."""
+
+    ttl: float
+    """The number of seconds to keep each file for."""
+
+    path: Optional[str]
+    """The file to persist the cache to, if any."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 23 * 60 * 60,
+        path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.path = os.fspath(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _CachedUpload]" = OrderedDict()
+        self._digests: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._bytes = 0
+        self._pending: Dict[str, List] = {}
+        self._async_pending: "weakref.WeakKeyDictionary[Any, Dict[str, List]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._loaded = self.path is None
+
+    @contextlib.contextmanager
+    def lock(self, digest: str) -> Iterator[None]:
+        """
+        Hold a lock for a digest,
+        so that files with the same contents are encoded one at a time.
+        """
+
+        lock = self._acquire_pending(digest)
+        try:
+            with lock:
+                yield
+        finally:
+            self._release_pending(digest)
+
+    @contextlib.asynccontextmanager
+    async def async_lock(self, digest: str) -> AsyncIterator[None]:
+        """
+        Hold a lock for a digest without blocking the event loop,
+        so that coroutines on the same loop encode files with the same contents one at a time.
+        """
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pending = self._async_pending.setdefault(loop, {})
+            entry = pending.setdefault(digest, [asyncio.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del pending[digest]
+
+    def digest(self, file: io.IOBase) -> Optional[str]:
+        """
+        Return the SHA-256 digest of a file's contents,
+        or `None` if the file can't be hashed without consuming it.
+        """
+
+        if isinstance(file, io.TextIOBase) or not file.seekable():
+            return None
+
+        stat_key = _stat_key(file)
+        if stat_key is not None:
+            with self._lock:
+                self._load()
+                digest = self._digests.get(stat_key)
+                if digest is not None:
+                    self._digests.move_to_end(stat_key)
+                    return digest
+
+        file.seek(0)
+        sha256 = hashlib.sha256()
+        while chunk := file.read(1024 * 1024):
+            sha256.update(chunk)
+        file.seek(0)
+        digest = sha256.hexdigest()
+
+        if stat_key is not None:
+            with self._lock:
+                self._digests[stat_key] = digest
+                while len(self._digests) > self.maxsize:
+                    self._digests.popitem(last=False)
+
+        return digest
+
+    def get(self, digest: str) -> Optional[str]:
+        """
+        Return the cached value for a digest, if any.
+        """
+
+        with self._lock:
+            self._load()
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+
+            if entry.expires_at <= time.time():
+                self._remove(digest)
+                return None
+
+            self._entries.move_to_end(digest)
+            return entry.value
+
+    def put(self, digest: str, value: str) -> None:
+        """
+        Add the value a file was encoded to.
+        """
+
+        with self._lock:
+            self._load()
+            changed = _is_persisted(value)
+            if digest in self._entries:
+                changed |= self._remove(digest)
+
+            self._entries[digest] = _CachedUpload(value, time.time() + self.ttl)
+            self._bytes += len(value)
+            while self._entries and (
+                len(self._entries) > self.maxsize or self._bytes > self.max_bytes
+            ):
+                changed |= self._remove(next(iter(self._entries)))
+
+            # Data URIs are only cached in memory, so there's nothing new to save
+            if changed:
+                self._save()
+
+    def clear(self) -> None:
+        """
+        Remove all files from the cache.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._digests.clear()
+            self._bytes = 0
+            self._loaded = True
+            self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _acquire_pending(self, digest: str) -> threading.Lock:
+        with self._lock:
+            pending = self._pending.setdefault(digest, [threading.Lock(), 0])
+            pending[1] += 1
+            return pending[0]
+
+    def _release_pending(self, digest: str) -> None:
+        with self._lock:
+            pending = self._pending[digest]
+            pending[1] -= 1
+            if not pending[1]:
+                del self._pending[digest]
+
+    def _remove(self, digest: str) -> bool:
+        entry = self._entries.pop(digest)
+        self._bytes -= len(entry.value)
+        return _is_persisted(entry.value)
+
+    def _load(self) -> None:
+        if self._loaded or self.path is None:
+            return
+
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        now = time.time()
+        for item in data.get("uploads", [])[-self.maxsize :]:
+            try:
+                if item["expires_at"] > now:
+                    entry = _CachedUpload(item["value"], float(item["expires_at"]))
+                    self._entries[item["digest"]] = entry
+                    self._bytes += len(entry.value)
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        for item in data.get("digests", [])[-self.maxsize :]:
+            try:
+                key = (item["path"], int(item["size"]), int(item["mtime_ns"]))
+                self._digests[key] = item["digest"]
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+
+        uploads = [
+            {"digest": digest, "value": entry.value, "expires_at": entry.expires_at}
+            for digest, entry in self._entries.items()
+            if _is_persisted(entry.value)
+        ]
+        digests = [
+            {"path": path, "size": size, "mtime_ns": mtime_ns, "digest": digest}
+            for (path, size, mtime_ns), digest in self._digests.items()
+        ]
+
+        _write_json(self.path, {"uploads": uploads, "digests": digests})
+
+
+def _is_persisted(value: str) -> bool:
+    return not value.startswith("data:")
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    # The cache is only an optimization, so failing to persist it isn't an error
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+
+
+def _stat_key(file: io.IOBase) -> Optional[Tuple[str, int, int]]:
+    name = getattr(file, "name", None)
+    if not isinstance(name, str):
+        return None
+
+    try:
+        stat = os.fstat(file.fileno())
+    except (AttributeError, OSError):
+        return None
+
+    return (os.path.abspath(name), stat.st_size, stat.st_mtime_ns)
+
+
+__all__ = ["CachedVersion", "VersionCache", "UploadCache"]
@@ -1,8 +1,8 @@
 import asyncio
+import copy
 import os
 import random
 import time
-from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,19 +21,32 @@ from typing_extensions import Unpack
 
 from vaikerai.__about__ import __version__
 from vaikerai.account import Accounts
+from vaikerai.cache import UploadCache, VersionCache, default_version_cache
+from vaikerai.codec import JSONCodec, get_codec
 from vaikerai.collection import Collections
 from vaikerai.deployment import Deployments
 from vaikerai.exceptions import VaikerAIError
+from vaikerai.files import DEFAULT_UPLOAD_THRESHOLD, Files
 from vaikerai.hardware import HardwareNamespace as Hardware
+from vaikerai.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    IdempotencyTable,
+    new_idempotency_key,
+    request_fingerprint,
+)
+from vaikerai.json import ArrayEncoding
 from vaikerai.model import Models
+from vaikerai.polling import BackoffPollingStrategy, PollingStrategy
 from vaikerai.prediction import Predictions
-from vaikerai.run import async_run, run
+from vaikerai.ratelimit import RateLimiter, parse_retry_after
+from vaikerai.receiver import WebhookReceiver
+from vaikerai.run import Completion, async_run, run
 from vaikerai.stream import async_stream, stream
 from vaikerai.training import Trainings
 from vaikerai.webhook import Webhooks
 
 if TYPE_CHECKING:
-    from vaikerai.stream import ServerSentEvent
+    from vaikerai.stream import LightweightServerSentEvent, ServerSentEvent
 
 
 class Client:
@@ -48,6 +61,17 @@ class Client:
         *,
         base_url: Optional[str] = None,
         timeout: Optional[httpx.Timeout] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        version_cache: Optional[VersionCache] = None,
+        upload_threshold: Optional[int] = DEFAULT_UPLOAD_THRESHOLD,
+        upload_cache: Optional[UploadCache] = None,
+        array_encoding: ArrayEncoding = "list",
+        json_codec: Union[str, JSONCodec] = "stdlib",
+        webhook_receiver: Optional[WebhookReceiver] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        host_limits: Optional[Mapping[str, httpx.Limits]] = None,
         **kwargs,
     ) -> None:
         super().__init__()
@@ -55,9 +79,27 @@ class Client:
         self._api_token = api_token
         self._base_url = base_url
         self._timeout = timeout
-        self._client_kwargs = kwargs
+        self._rate_limiter = rate_limiter
+        self._client_kwargs = {
+            "limits": limits,
+            "http2": http2,
+            "host_limits": host_limits,
+            **kwargs,
+        }
 
         self.poll_interval = float(os.environ.get("VAIKERAI_POLL_INTERVAL", "0.5"))
+        self.polling_strategy = polling_strategy or BackoffPollingStrategy()
+        self.idempotency_table = IdempotencyTable()
+        self.version_cache = (
+            version_cache if version_cache is not None else default_version_cache
+        )
+        self.upload_threshold = upload_threshold
+        self.upload_cache = upload_cache
+        self.array_encoding = array_encoding
+        self.json_codec = get_codec(json_codec)
+        self.webhook_receiver = webhook_receiver
+        if webhook_receiver is not None and webhook_receiver.json_codec is None:
+            webhook_receiver.json_codec = self.json_codec
 
     @property
     def _client(self) -> httpx.Client:
@@ -67,6 +109,7 @@ class Client:
                 self._api_token,
                 self._base_url,
                 self._timeout,
+                rate_limiter=self._rate_limiter,
                 **self._client_kwargs,
             )  # type: ignore[assignment]
         return self.__client  # type: ignore[return-value]
@@ -79,22 +122,112 @@ class Client:
                 self._api_token,
                 self._base_url,
                 self._timeout,
+                rate_limiter=self._rate_limiter,
                 **self._client_kwargs,
             )  # type: ignore[assignment]
         return self.__async_client  # type: ignore[return-value]
 
     def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        _encode_json_body(self.json_codec, kwargs)
         resp = self._client.request(method, path, **kwargs)
         _raise_for_status(resp)
 
         return resp
 
     async def _async_request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        _encode_json_body(self.json_codec, kwargs)
         resp = await self._async_client.request(method, path, **kwargs)
         _raise_for_status(resp)
 
         return resp
 
+    def _decode_json(self, resp: httpx.Response) -> Any:  # noqa: ANN401
+        return self.json_codec.loads(resp.content)
+
+    def _idempotent_post(
+        self, path: str, body: Dict[str, Any], idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if idempotency_key is None:
+            # A generated key only makes retries of this request safe,
+            # and can't be looked up again, so it isn't recorded
+            resp = self._request(
+                "POST",
+                path,
+                json=body,
+                headers={IDEMPOTENCY_KEY_HEADER: new_idempotency_key()},
+            )
+            return self._decode_json(resp)
+
+        fingerprint = request_fingerprint(path, body)
+        while True:
+            obj, pending = self.idempotency_table.begin(idempotency_key, fingerprint)
+            if obj is not None:
+                return obj
+            if pending is None:
+                break
+
+            # Wait for the same request in flight, and send it ourselves if that fails
+            try:
+                return copy.deepcopy(pending.result())
+            except Exception:  # noqa: BLE001, S112 # pylint: disable=broad-exception-caught
+                continue
+
+        try:
+            resp = self._request(
+                "POST",
+                path,
+                json=body,
+                headers={IDEMPOTENCY_KEY_HEADER: idempotency_key},
+            )
+            obj = self._decode_json(resp)
+        except BaseException as exc:
+            self.idempotency_table.abort(idempotency_key, exc)
+            raise
+
+        self.idempotency_table.put(idempotency_key, obj, fingerprint)
+        return obj
+
+    async def _async_idempotent_post(
+        self, path: str, body: Dict[str, Any], idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if idempotency_key is None:
+            resp = await self._async_request(
+                "POST",
+                path,
+                json=body,
+                headers={IDEMPOTENCY_KEY_HEADER: new_idempotency_key()},
+            )
+            return self._decode_json(resp)
+
+        fingerprint = request_fingerprint(path, body)
+        while True:
+            obj, pending = self.idempotency_table.begin(idempotency_key, fingerprint)
+            if obj is not None:
+                return obj
+            if pending is None:
+                break
+
+            try:
+                result = await asyncio.shield(asyncio.wrap_future(pending))
+                return copy.deepcopy(result)
+            except Exception:  # noqa: BLE001, S112 # pylint: disable=broad-exception-caught
+                continue
+
+        try:
+            resp = await self._async_request(
+                "POST",
+                path,
+                json=body,
+                headers={IDEMPOTENCY_KEY_HEADER: idempotency_key},
+            )
+            obj = self._decode_json(resp)
+        except BaseException as exc:
+            self.idempotency_table.abort(idempotency_key, exc)
+            raise
+
+        self.idempotency_table.put(idempotency_key, obj, fingerprint)
+        return obj
+
     @property
     def accounts(self) -> Accounts:
         """
@@ -117,6 +250,13 @@ class Client:
         """
         return Deployments(client=self)
 
+    @property
+    def files(self) -> Files:
+        """
+        Namespace for operations related to files.
+        """
+        return Files(client=self)
+
     @property
     def hardware(self) -> Hardware:
         """
@@ -156,55 +296,65 @@ class Client:
         self,
         ref: str,
         input: Optional[Dict[str, Any]] = None,
+        *,
+        completion: Completion = "poll",
         **params: Unpack["Predictions.CreatePredictionParams"],
     ) -> Union[Any, Iterator[Any]]:  # noqa: ANN401
         """
         Run a model and wait for its output.
         """
 
-        return run(self, ref, input, **params)
+        return run(self, ref, input, completion=completion, **params)
 
     async def async_run(
         self,
         ref: str,
         input: Optional[Dict[str, Any]] = None,
+        *,
+        completion: Completion = "poll",
         **params: Unpack["Predictions.CreatePredictionParams"],
     ) -> Union[Any, AsyncIterator[Any]]:  # noqa: ANN401
         """
         Run a model and wait for its output asynchronously.
         """
 
-        return await async_run(self, ref, input, **params)
+        return await async_run(self, ref, input, completion=completion, **params)
 
     def stream(
         self,
         ref: str,
         input: Optional[Dict[str, Any]] = None,
+        *,
+        validate: bool = False,
         **params: Unpack["Predictions.CreatePredictionParams"],
-    ) -> Iterator["ServerSentEvent"]:
+    ) -> Iterator[Union["ServerSentEvent", "LightweightServerSentEvent"]]:
         """
         Stream a model's output.
         """
 
-        return stream(self, ref, input, **params)
+        return stream(self, ref, input, validate=validate, **params)
 
     async def async_stream(
         self,
         ref: str,
         input: Optional[Dict[str, Any]] = None,
+        *,
+        validate: bool = False,
         **params: Unpack["Predictions.CreatePredictionParams"],
-    ) -> AsyncIterator["ServerSentEvent"]:
+    ) -> AsyncIterator[Union["ServerSentEvent", "LightweightServerSentEvent"]]:
         """
         Stream a model's output asynchronously.
         """
 
-        return async_stream(self, ref, input, **params)
+        return async_stream(self, ref, input, validate=validate, **params)
 
 
 # Adapted from https://github.com/encode/httpx/issues/108#issuecomment-1132753155
 class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
     """A custom HTTP transport that automatically retries requests using an exponential backoff strategy
     for specific HTTP status codes and request methods.
+
+    Requests with other methods, like POST, are retried only if they have an `Idempotency-Key` header.
     """
 
     RETRYABLE_METHODS = frozenset(["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"])
@@ -227,8 +377,10 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
         jitter_ratio: float = 0.1,
         retryable_methods: Optional[Iterable[str]] = None,
         retry_status_codes: Optional[Iterable[int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         self._wrapped_transport = wrapped_transport
+        self._rate_limiter = rate_limiter
 
         if jitter_ratio < 0 or jitter_ratio > 0.5:
             raise ValueError(
@@ -250,31 +402,50 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
         self.jitter_ratio = jitter_ratio
         self.max_backoff_wait = max_backoff_wait
 
+    def _is_retryable(self, request: httpx.Request) -> bool:
+        return (
+            request.method in self.retryable_methods
+            or IDEMPOTENCY_KEY_HEADER in request.headers
+        )
+
     def _calculate_sleep(
         self, attempts_made: int, headers: Union[httpx.Headers, Mapping[str, str]]
     ) -> float:
-        retry_after_header = (headers.get("Retry-After") or "").strip()
-        if retry_after_header:
-            if retry_after_header.isdigit():
-                return float(retry_after_header)
-
-            try:
-                parsed_date = datetime.fromisoformat(retry_after_header).astimezone()
-                diff = (parsed_date - datetime.now().astimezone()).total_seconds()
-                if diff > 0:
-                    return min(diff, self.max_backoff_wait)
-            except ValueError:
-                pass
+        retry_after = parse_retry_after(headers)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff_wait)
 
         backoff = self.backoff_factor * (2 ** (attempts_made - 1))
         jitter = (backoff * self.jitter_ratio) * random.choice([1, -1])  # noqa: S311
         total_backoff = backoff + jitter
         return min(total_backoff, self.max_backoff_wait)
 
-    def handle_request(self, request: httpx.Request) -> httpx.Response:
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(request)
+
         response = self._wrapped_transport.handle_request(request)  # type: ignore
 
-        if request.method not in self.retryable_methods:
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(request, response)
+
+        return response
+
+    async def _async_send(self, request: httpx.Request) -> httpx.Response:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.async_acquire(request)
+
+        response = await self._wrapped_transport.handle_async_request(request)  # type: ignore
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(request, response)
+
+        return response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._send(request)
+
+        if not self._is_retryable(request):
             return response
 
         remaining_attempts = self.max_attempts - 1
@@ -292,15 +463,15 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
             sleep_for = self._calculate_sleep(attempts_made, response.headers)
             time.sleep(sleep_for)
 
-            response = self._wrapped_transport.handle_request(request)  # type: ignore
+            response = self._send(request)
 
             attempts_made += 1
             remaining_attempts -= 1
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
-        response = await self._wrapped_transport.handle_async_request(request)  # type: ignore
+        response = await self._async_send(request)
 
-        if request.method not in self.retryable_methods:
+        if not self._is_retryable(request):
             return response
 
         remaining_attempts = self.max_attempts - 1
@@ -318,7 +489,7 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
             sleep_for = self._calculate_sleep(attempts_made, response.headers)
             await asyncio.sleep(sleep_for)
 
-            response = await self._wrapped_transport.handle_async_request(request)  # type: ignore
+            response = await self._async_send(request)
 
             attempts_made += 1
             remaining_attempts -= 1
@@ -335,6 +506,11 @@ def _build_httpx_client(
     api_token: Optional[str] = None,
     base_url: Optional[str] = None,
     timeout: Optional[httpx.Timeout] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    *,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+    host_limits: Optional[Mapping[str, httpx.Limits]] = None,
     **kwargs,
 ) -> Union[httpx.Client, httpx.AsyncClient]:
     headers = kwargs.pop("headers", {})
@@ -355,21 +531,63 @@ def _build_httpx_client(
         5.0, read=30.0, write=30.0, connect=5.0, pool=10.0
     )
 
-    transport = kwargs.pop("transport", None) or (
-        httpx.HTTPTransport()
-        if client_type is httpx.Client
-        else httpx.AsyncHTTPTransport()
-    )
+    transport = kwargs.pop("transport", None)
+    if transport is None:
+        transport = _build_transport(client_type, limits, http2=http2)
+    elif limits is not None or http2 or host_limits:
+        raise ValueError(
+            "limits, http2, and host_limits can't be combined with a custom transport"
+        )
+
+    # Each mounted transport has its own connection pool,
+    # which caps the connections to the hosts it matches
+    mounts = dict(kwargs.pop("mounts", None) or {})
+    for pattern, host_limit in (host_limits or {}).items():
+        mounts[pattern] = RetryTransport(
+            wrapped_transport=_build_transport(client_type, host_limit, http2=http2),
+            rate_limiter=rate_limiter,
+        )
 
     return client_type(
         base_url=base_url,
         headers=headers,
         timeout=timeout,
-        transport=RetryTransport(wrapped_transport=transport),  # type: ignore[arg-type]
+        transport=RetryTransport(
+            wrapped_transport=transport,  # type: ignore[arg-type]
+            rate_limiter=rate_limiter,
+        ),
+        mounts=mounts,
         **kwargs,
     )
 
 
+def _build_transport(
+    client_type: Type[Union[httpx.Client, httpx.AsyncClient]],
+    limits: Optional[httpx.Limits],
+    *,
+    http2: bool,
+) -> Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport]:
+    options: Dict[str, Any] = {"http2": http2}
+    if limits is not None:
+        options["limits"] = limits
+
+    if client_type is httpx.Client:
+        return httpx.HTTPTransport(**options)
+    return httpx.AsyncHTTPTransport(**options)
+
+
+def _encode_json_body(codec: JSONCodec, kwargs: Dict[str, Any]) -> None:
+    if kwargs.get("json") is None:
+        kwargs.pop("json", None)
+        return
+
+    kwargs["content"] = codec.dumps(kwargs.pop("json"))
+    kwargs["headers"] = {
+        **(kwargs.get("headers") or {}),
+        "Content-Type": "application/json",
+    }
+
+
 def _raise_for_status(resp: httpx.Response) -> None:
     if 400 <= resp.status_code < 600:
         raise VaikerAIError.from_response(resp)
@@ -0,0 +1,144 @@
+import abc
+import json
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec  # type: ignore
+
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+
+class JSONCodec(abc.ABC):
+    """
+    A strategy for encoding request bodies as JSON and decoding JSON responses.
+    """
+
+    name: str
+    """The name of the codec."""
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """
+        Encode an object as JSON.
+        """
+
+    @abc.abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:  # noqa: ANN401
+        """
+        Decode a JSON document.
+        """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    A codec that uses the `json` module from the standard library.
+    """
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:  # noqa: ANN401
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    A codec that uses `orjson`.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not HAS_ORJSON:
+            raise ImportError("orjson is required for the orjson codec")
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        return orjson.dumps(obj)  # type: ignore
+
+    def loads(self, data: Union[bytes, str]) -> Any:  # noqa: ANN401
+        return orjson.loads(data)  # type: ignore
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    A codec that uses `msgspec`.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if not HAS_MSGSPEC:
+            raise ImportError("msgspec is required for the msgspec codec")
+
+        self._encoder = msgspec.json.Encoder()  # type: ignore
+        self._decoder = msgspec.json.Decoder()  # type: ignore
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:  # noqa: ANN401
+        return self._decoder.decode(data)
+
+
+_CODECS = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+}
+
+
+def get_codec(codec: Union[str, JSONCodec] = "stdlib") -> JSONCodec:
+    """
+    Return a JSON codec by name.
+
+    Args:
+        codec: `"stdlib"`, `"orjson"`, `"msgspec"`, or `"auto"` to pick the fastest installed codec.
+            A `JSONCodec` instance is returned as is.
+    Returns:
+        JSONCodec: The codec.
+    Raises:
+        ImportError: If the codec's library isn't installed.
+        ValueError: If there's no codec with that name.
+    """
+
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec == "auto":
+        if HAS_ORJSON:
+            return OrjsonCodec()
+        if HAS_MSGSPEC:
+            return MsgspecCodec()
+        return StdlibJSONCodec()
+
+    if codec not in _CODECS:
+        raise ValueError(
+            f"Unknown JSON codec: {codec!r}. Expected one of {', '.join(['auto', *_CODECS])}"
+        )
+
+    return _CODECS[codec]()
+
+
+__all__ = [
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "get_codec",
+]
@@ -1,9 +1,19 @@
-from typing import Any, Dict, Iterator, List, Optional, Union, overload
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    overload,
+)
 
 from typing_extensions import deprecated
 
 from vaikerai.model import Model
-from vaikerai.pagination import Page
+from vaikerai.pagination import Page, _async_iter_items, _iter_items, _json_to_page
 from vaikerai.resource import Namespace, Resource
 
 
@@ -84,10 +94,8 @@ class Collections(Namespace):
             "GET", "/v1/collections" if cursor is ... else cursor
         )
 
-        obj = resp.json()
-        obj["results"] = [_json_to_collection(result) for result in obj["results"]]
-
-        return Page[Collection](**obj)
+        obj = self._client._decode_json(resp)
+        return _json_to_page(obj, Collection, _json_to_collection)
 
     async def async_list(
         self,
@@ -111,10 +119,44 @@ class Collections(Namespace):
             "GET", "/v1/collections" if cursor is ... else cursor
         )
 
-        obj = resp.json()
-        obj["results"] = [_json_to_collection(result) for result in obj["results"]]
+        obj = self._client._decode_json(resp)
+        return _json_to_page(obj, Collection, _json_to_collection)
+
+    def iter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Collection], bool]] = None,
+    ) -> Iterator[Collection]:
+        """
+        Iterate over all collections, fetching pages only as they're needed.
+
+        Parameters:
+            limit: The maximum number of collections to return.
+            until: A predicate that stops iteration at the first collection it returns `True` for. That collection isn't returned.
+        Returns:
+            Iterator[Collection]: An iterator of collections.
+        """
+
+        return _iter_items(self.list, limit=limit, until=until)
+
+    def aiter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Collection], bool]] = None,
+    ) -> AsyncIterator[Collection]:
+        """
+        Asynchronously iterate over all collections, fetching pages only as they're needed.
+
+        Parameters:
+            limit: The maximum number of collections to return.
+            until: A predicate that stops iteration at the first collection it returns `True` for. That collection isn't returned.
+        Returns:
+            AsyncIterator[Collection]: An async iterator of collections.
+        """
 
-        return Page[Collection](**obj)
+        return _async_iter_items(self.async_list, limit=limit, until=until)
 
     def get(self, slug: str) -> Collection:
         """Get a collection of models by collection name.
@@ -127,7 +169,7 @@ class Collections(Namespace):
 
         resp = self._client._request("GET", f"/v1/collections/{slug}")
 
-        return _json_to_collection(resp.json())
+        return _json_to_collection(self._client._decode_json(resp))
 
     async def async_get(self, slug: str) -> Collection:
         """Get a collection of models by collection name.
@@ -140,7 +182,7 @@ class Collections(Namespace):
 
         resp = await self._client._async_request("GET", f"/v1/collections/{slug}")
 
-        return _json_to_collection(resp.json())
+        return _json_to_collection(self._client._decode_json(resp))
 
 
 def _json_to_collection(json: Dict[str, Any]) -> Collection:
@@ -1,15 +1,44 @@
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+    overload,
+)
 
-from typing_extensions import Unpack, deprecated
+from typing_extensions import NotRequired, Unpack, deprecated
 
 from vaikerai.account import Account
-from vaikerai.pagination import Page
+from vaikerai.batch import (
+    BatchResult,
+    async_create_many,
+    async_run_many,
+    create_many,
+    run_many,
+)
+from vaikerai.pagination import (
+    Page,
+    _async_iter_items,
+    _iter_items,
+    _json_to_page,
+    _lazy_page,
+)
 from vaikerai.prediction import (
     Prediction,
+    _async_create_prediction_body,
     _create_prediction_body,
     _json_to_prediction,
 )
-from vaikerai.resource import Namespace, Resource
+from vaikerai.resource import Namespace, Resource, ResourceView
 
 try:
     from pydantic import v1 as pydantic  # type: ignore
@@ -131,13 +160,34 @@ class Deployments(Namespace):
 
     _client: "Client"
 
+    @overload
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[False] = False,
+    ) -> Page[Deployment]: ...
+
+    @overload
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[True],
+    ) -> Page[ResourceView[Deployment]]: ...
+
     def list(
         self,
         cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
-    ) -> Page[Deployment]:
+        *,
+        lazy: bool = False,
+    ) -> Union[Page[Deployment], Page[ResourceView[Deployment]]]:
         """
         List all deployments.
 
+        Parameters:
+            cursor: The cursor to use for pagination. Use the value of `Page.next` or `Page.previous`.
+            lazy: Whether to return lightweight views of the results, which validate each field the first time it's accessed.
         Returns:
             A page of Deployments.
         """
@@ -149,20 +199,46 @@ class Deployments(Namespace):
             "GET", "/v1/deployments" if cursor is ... else cursor
         )
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_deployment(self._client, result) for result in obj["results"]
-        ]
+        obj = self._client._decode_json(resp)
+        if lazy:
+            return _lazy_page(
+                obj,
+                Deployment,
+                lambda result: _json_to_deployment(self._client, result),
+            )
+
+        return _json_to_page(
+            obj, Deployment, lambda result: _json_to_deployment(self._client, result)
+        )
+
+    @overload
+    async def async_list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[False] = False,
+    ) -> Page[Deployment]: ...
 
-        return Page[Deployment](**obj)
+    @overload
+    async def async_list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[True],
+    ) -> Page[ResourceView[Deployment]]: ...
 
     async def async_list(
         self,
         cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
-    ) -> Page[Deployment]:
+        *,
+        lazy: bool = False,
+    ) -> Union[Page[Deployment], Page[ResourceView[Deployment]]]:
         """
         List all deployments.
 
+        Parameters:
+            cursor: The cursor to use for pagination. Use the value of `Page.next` or `Page.previous`.
+            lazy: Whether to return lightweight views of the results, which validate each field the first time it's accessed.
         Returns:
             A page of Deployments.
         """
@@ -173,12 +249,53 @@ class Deployments(Namespace):
             "GET", "/v1/deployments" if cursor is ... else cursor
         )
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_deployment(self._client, result) for result in obj["results"]
-        ]
+        obj = self._client._decode_json(resp)
+        if lazy:
+            return _lazy_page(
+                obj,
+                Deployment,
+                lambda result: _json_to_deployment(self._client, result),
+            )
+
+        return _json_to_page(
+            obj, Deployment, lambda result: _json_to_deployment(self._client, result)
+        )
+
+    def iter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Deployment], bool]] = None,
+    ) -> Iterator[Deployment]:
+        """
+        Iterate over all deployments, fetching pages only as they're needed.
+
+        Parameters:
+            limit: The maximum number of deployments to return.
+            until: A predicate that stops iteration at the first deployment it returns `True` for. That deployment isn't returned.
+        Returns:
+            Iterator[Deployment]: An iterator of deployments.
+        """
+
+        return _iter_items(self.list, limit=limit, until=until)
+
+    def aiter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Deployment], bool]] = None,
+    ) -> AsyncIterator[Deployment]:
+        """
+        Asynchronously iterate over all deployments, fetching pages only as they're needed.
+
+        Parameters:
+            limit: The maximum number of deployments to return.
+            until: A predicate that stops iteration at the first deployment it returns `True` for. That deployment isn't returned.
+        Returns:
+            AsyncIterator[Deployment]: An async iterator of deployments.
+        """
 
-        return Page[Deployment](**obj)
+        return _async_iter_items(self.async_list, limit=limit, until=until)
 
     def get(self, name: str) -> Deployment:
         """
@@ -197,7 +314,7 @@ class Deployments(Namespace):
             f"/v1/deployments/{owner}/{name}",
         )
 
-        return _json_to_deployment(self._client, resp.json())
+        return _json_to_deployment(self._client, self._client._decode_json(resp))
 
     async def async_get(self, name: str) -> Deployment:
         """
@@ -216,7 +333,7 @@ class Deployments(Namespace):
             f"/v1/deployments/{owner}/{name}",
         )
 
-        return _json_to_deployment(self._client, resp.json())
+        return _json_to_deployment(self._client, self._client._decode_json(resp))
 
     class CreateDeploymentParams(TypedDict):
         """
@@ -241,6 +358,13 @@ class Deployments(Namespace):
         max_instances: int
         """The maximum number of instances for scaling."""
 
+        idempotency_key: NotRequired[str]
+        """
+        A unique key for this request, so that it can be retried without creating a duplicate deployment.
+
+        A random key is generated if one isn't provided.
+        """
+
     def create(self, **params: Unpack[CreateDeploymentParams]) -> Deployment:
         """
         Create a new deployment.
@@ -256,13 +380,14 @@ class Deployments(Namespace):
                 _, name = name.split("/", 1)
             params["name"] = name
 
-        resp = self._client._request(
-            "POST",
+        idempotency_key = params.pop("idempotency_key", None)
+        obj = self._client._idempotent_post(
             "/v1/deployments",
-            json=params,
+            params,  # type: ignore[arg-type]
+            idempotency_key,
         )
 
-        return _json_to_deployment(self._client, resp.json())
+        return _json_to_deployment(self._client, obj)
 
     async def async_create(
         self, **params: Unpack[CreateDeploymentParams]
@@ -281,13 +406,14 @@ class Deployments(Namespace):
                 _, name = name.split("/", 1)
             params["name"] = name
 
-        resp = await self._client._async_request(
-            "POST",
+        idempotency_key = params.pop("idempotency_key", None)
+        obj = await self._client._async_idempotent_post(
             "/v1/deployments",
-            json=params,
+            params,  # type: ignore[arg-type]
+            idempotency_key,
         )
 
-        return _json_to_deployment(self._client, resp.json())
+        return _json_to_deployment(self._client, obj)
 
     class UpdateDeploymentParams(TypedDict, total=False):
         """
@@ -329,7 +455,7 @@ class Deployments(Namespace):
             json=params,
         )
 
-        return _json_to_deployment(self._client, resp.json())
+        return _json_to_deployment(self._client, self._client._decode_json(resp))
 
     async def async_update(
         self,
@@ -354,7 +480,7 @@ class Deployments(Namespace):
             json=params,
         )
 
-        return _json_to_deployment(self._client, resp.json())
+        return _json_to_deployment(self._client, self._client._decode_json(resp))
 
     def delete(self, deployment_owner: str, deployment_name: str) -> None:
         """
@@ -417,15 +543,18 @@ class DeploymentPredictions(Namespace):
         Create a new prediction with the deployment.
         """
 
-        body = _create_prediction_body(version=None, input=input, **params)
+        idempotency_key = params.pop("idempotency_key", None)
+        body = _create_prediction_body(
+            self._client, version=None, input=input, **params
+        )
 
-        resp = self._client._request(
-            "POST",
+        obj = self._client._idempotent_post(
             f"/v1/deployments/{self._deployment.owner}/{self._deployment.name}/predictions",
-            json=body,
+            body,
+            idempotency_key,
         )
 
-        return _json_to_prediction(self._client, resp.json())
+        return _json_to_prediction(self._client, obj)
 
     async def async_create(
         self,
@@ -436,15 +565,18 @@ class DeploymentPredictions(Namespace):
         Create a new prediction with the deployment.
         """
 
-        body = _create_prediction_body(version=None, input=input, **params)
+        idempotency_key = params.pop("idempotency_key", None)
+        body = await _async_create_prediction_body(
+            self._client, version=None, input=input, **params
+        )
 
-        resp = await self._client._async_request(
-            "POST",
+        obj = await self._client._async_idempotent_post(
             f"/v1/deployments/{self._deployment.owner}/{self._deployment.name}/predictions",
-            json=body,
+            body,
+            idempotency_key,
         )
 
-        return _json_to_prediction(self._client, resp.json())
+        return _json_to_prediction(self._client, obj)
 
 
 class DeploymentsPredictions(Namespace):
@@ -463,15 +595,14 @@ class DeploymentsPredictions(Namespace):
         """
 
         url = _create_prediction_url_from_deployment(deployment)
-        body = _create_prediction_body(version=None, input=input, **params)
-
-        resp = self._client._request(
-            "POST",
-            url,
-            json=body,
+        idempotency_key = params.pop("idempotency_key", None)
+        body = _create_prediction_body(
+            self._client, version=None, input=input, **params
         )
 
-        return _json_to_prediction(self._client, resp.json())
+        obj = self._client._idempotent_post(url, body, idempotency_key)
+
+        return _json_to_prediction(self._client, obj)
 
     async def async_create(
         self,
@@ -484,15 +615,124 @@ class DeploymentsPredictions(Namespace):
         """
 
         url = _create_prediction_url_from_deployment(deployment)
-        body = _create_prediction_body(version=None, input=input, **params)
+        idempotency_key = params.pop("idempotency_key", None)
+        body = await _async_create_prediction_body(
+            self._client, version=None, input=input, **params
+        )
 
-        resp = await self._client._async_request(
-            "POST",
-            url,
-            json=body,
+        obj = await self._client._async_idempotent_post(url, body, idempotency_key)
+
+        return _json_to_prediction(self._client, obj)
+
+    def create_many(
+        self,
+        deployment: Union[str, Tuple[str, str], Deployment],
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Create a prediction with the deployment for each input.
+
+        Args:
+            deployment: The deployment to create predictions with.
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        return create_many(
+            lambda input, **kwargs: self.create(deployment, input, **kwargs),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
         )
 
-        return _json_to_prediction(self._client, resp.json())
+    async def async_create_many(
+        self,
+        deployment: Union[str, Tuple[str, str], Deployment],
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Create a prediction with the deployment for each input.
+
+        Args:
+            deployment: The deployment to create predictions with.
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        return await async_create_many(
+            lambda input, **kwargs: self.async_create(deployment, input, **kwargs),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
+        )
+
+    def run_many(
+        self,
+        deployment: Union[str, Tuple[str, str], Deployment],
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Run the deployment for each input and wait for the outputs.
+
+        Args:
+            deployment: The deployment to create predictions with.
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        return run_many(
+            self._client,
+            lambda input, **kwargs: self.create(deployment, input, **kwargs),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
+        )
+
+    async def async_run_many(
+        self,
+        deployment: Union[str, Tuple[str, str], Deployment],
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Run the deployment for each input and wait for the outputs.
+
+        Args:
+            deployment: The deployment to create predictions with.
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        return await async_run_many(
+            self._client,
+            lambda input, **kwargs: self.async_create(deployment, input, **kwargs),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
+        )
 
 
 def _create_prediction_url_from_deployment(
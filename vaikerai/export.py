@@ -0,0 +1,324 @@
+import asyncio
+import json
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+
+try:
+    import pyarrow  # type: ignore
+    import pyarrow.parquet  # type: ignore
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+if TYPE_CHECKING:
+    from vaikerai.client import Client
+    from vaikerai.codec import JSONCodec
+
+ExportFormat = Literal["jsonl", "parquet"]
+"""
+The format of an export.
+
+- `jsonl`: A file with one JSON object per line, as returned by the API.
+- `parquet`: A directory of Parquet files with one column per field,
+  readable as a single dataset by `pyarrow.dataset` or `pandas.read_parquet`.
+  Requires `pyarrow`.
+"""
+
+DEFAULT_BATCH_SIZE = 10_000
+"""The number of records to write to each Parquet file."""
+
+
+def _export(  # pylint: disable=too-many-arguments
+    client: "Client",
+    url: str,
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    columns: List[str],
+    format: ExportFormat = "jsonl",  # pylint: disable=redefined-builtin
+    incremental: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Export every record of a list endpoint to a file, one page at a time.
+
+    Parameters:
+        client: The client to make requests with.
+        url: The path of the list endpoint.
+        path: The file (or, for Parquet, the directory) to export to.
+        columns: The fields to write as Parquet columns.
+        format: The format to export to.
+        incremental: Whether to only export records newer than the last completed export.
+        batch_size: The number of records to write to each Parquet file.
+    Returns:
+        int: The number of records exported.
+    """
+
+    run = _Export(
+        path,
+        columns=columns,
+        format=format,
+        batch_size=batch_size,
+        codec=client.json_codec,
+    )
+    cursor = run.start(incremental=incremental)
+    try:
+        while cursor is not None:
+            resp = client._request("GET", url if cursor is ... else cursor)
+            cursor = run.process(client._decode_json(resp))
+    finally:
+        run.writer.close()
+
+    return run.count
+
+
+async def _async_export(  # pylint: disable=too-many-arguments
+    client: "Client",
+    url: str,
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    columns: List[str],
+    format: ExportFormat = "jsonl",  # pylint: disable=redefined-builtin
+    incremental: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Export every record of a list endpoint to a file, one page at a time.
+    Files are written on a worker thread, so the event loop isn't blocked.
+
+    Parameters:
+        client: The client to make requests with.
+        url: The path of the list endpoint.
+        path: The file (or, for Parquet, the directory) to export to.
+        columns: The fields to write as Parquet columns.
+        format: The format to export to.
+        incremental: Whether to only export records newer than the last completed export.
+        batch_size: The number of records to write to each Parquet file.
+    Returns:
+        int: The number of records exported.
+    """
+
+    loop = asyncio.get_running_loop()
+    run = _Export(
+        path,
+        columns=columns,
+        format=format,
+        batch_size=batch_size,
+        codec=client.json_codec,
+    )
+    cursor = await loop.run_in_executor(None, run.start, incremental)
+    try:
+        while cursor is not None:
+            resp = await client._async_request("GET", url if cursor is ... else cursor)
+            cursor = await loop.run_in_executor(
+                None, run.process, client._decode_json(resp)
+            )
+    finally:
+        run.writer.close()
+
+    return run.count
+
+
+class _Export:
+    """
+    The state of an export, which is saved next to it after every durable write.
+
+    The state records the cursor of the next page to fetch,
+    and where the export ended when it was saved,
+    so that an interrupted export resumes without duplicating or skipping records.
+    Once an export completes, the state records the creation time of the newest record,
+    so that an incremental export stops at the first record it has already seen.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        columns: List[str],
+        format: ExportFormat,  # pylint: disable=redefined-builtin
+        batch_size: int,
+        codec: "JSONCodec",
+    ) -> None:
+        if format == "jsonl":
+            self.writer: Union[_JSONLWriter, _ParquetWriter] = _JSONLWriter(path, codec)
+        elif format == "parquet":
+            self.writer = _ParquetWriter(path, columns, batch_size, codec)
+        else:
+            raise ValueError(f"Unsupported export format: {format!r}")
+
+        self.state_path = f"{os.fspath(path)}.state.json"
+        self.count = 0
+        self.since: Optional[str] = None
+        self.newest: Optional[str] = None
+
+    def start(self, incremental: bool) -> Union[str, "ellipsis", None]:  # noqa: F821, FBT001
+        state = self._load_state()
+        cursor = state.get("cursor")
+
+        if cursor is not None:
+            # Resume an interrupted export where its last durable write ended
+            self.since = state.get("since")
+            self.newest = state.get("newest")
+            self.writer.open(state.get("position"))
+            return cursor
+
+        if incremental:
+            self.since = state.get("newest")
+        self.writer.open(state.get("position") if incremental else None)
+        return ...
+
+    def process(self, obj: Dict[str, Any]) -> Optional[str]:
+        cursor = obj.get("next")
+
+        for record in obj["results"]:
+            created_at = record.get("created_at") or ""
+            if self.since is not None and created_at <= self.since:
+                cursor = None
+                break
+
+            self.writer.write(record)
+            self.count += 1
+            if self.newest is None or created_at > self.newest:
+                self.newest = created_at
+
+        position = self.writer.commit(final=cursor is None)
+        if position is not None:
+            self._save_state(
+                {
+                    "cursor": cursor,
+                    "since": self.since if cursor is not None else None,
+                    "newest": self.newest or self.since,
+                    "position": position,
+                }
+            )
+
+        return cursor
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        tmp = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
+
+
+class _JSONLWriter:
+    """
+    Appends records to a JSON Lines file.
+    The position is the size of the file after the last commit,
+    which it's truncated to when an export resumes.
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], codec: "JSONCodec"
+    ) -> None:
+        self.path = os.fspath(path)
+        self.codec = codec
+        self.file: Any = None
+
+    def open(self, position: Optional[int]) -> None:
+        if position is None:
+            self.file = open(self.path, "wb")
+            return
+
+        self.file = open(self.path, "ab")
+        position = min(position, os.fstat(self.file.fileno()).st_size)
+        self.file.truncate(position)
+        self.file.seek(position)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self.file.write(self.codec.dumps(record))
+        self.file.write(b"\n")
+
+    def commit(self, final: bool) -> Optional[int]:  # noqa: FBT001
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+
+
+class _ParquetWriter:
+    """
+    Writes records to a directory of Parquet files, `batch_size` records at a time.
+    Nested values are stored as JSON strings.
+    The position is the number of files written,
+    so records that were buffered when an export was interrupted are fetched again.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        columns: List[str],
+        batch_size: int,
+        codec: "JSONCodec",
+    ) -> None:
+        if not HAS_PYARROW:
+            raise ImportError(
+                "Exporting to Parquet requires pyarrow. Install it with `pip install vaikerai[parquet]`"
+            )
+
+        self.path = os.fspath(path)
+        self.columns = columns
+        self.batch_size = batch_size
+        self.codec = codec
+        self.schema = pyarrow.schema([(column, pyarrow.string()) for column in columns])
+        self.buffer: Dict[str, List[Optional[str]]] = {}
+        self.buffered = 0
+        self.part = 0
+
+    def open(self, position: Optional[int]) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        self.part = position or 0
+        if position is None:
+            for name in os.listdir(self.path):
+                if name.startswith("part-") and name.endswith(".parquet"):
+                    os.remove(os.path.join(self.path, name))
+        self._reset()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        for column in self.columns:
+            value = record.get(column)
+            if value is not None and not isinstance(value, str):
+                value = self.codec.dumps(value).decode("utf-8")
+            self.buffer[column].append(value)
+        self.buffered += 1
+
+    def commit(self, final: bool) -> Optional[int]:  # noqa: FBT001
+        if self.buffered < self.batch_size and not (final and self.buffered):
+            return self.part if final else None
+
+        table = pyarrow.Table.from_pydict(self.buffer, schema=self.schema)
+        name = os.path.join(self.path, f"part-{self.part:05d}.parquet")
+        pyarrow.parquet.write_table(table, f"{name}.tmp")
+        os.replace(f"{name}.tmp", name)
+
+        self.part += 1
+        self._reset()
+        return self.part
+
+    def close(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self.buffer = {column: [] for column in self.columns}
+        self.buffered = 0
+
+
+__all__ = ["ExportFormat", "HAS_PYARROW"]
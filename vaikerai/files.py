@@ -1,10 +1,275 @@
+import asyncio
 import base64
 import io
+import json
 import mimetypes
 import os
-from typing import Optional
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 import httpx
+from typing_extensions import NotRequired, Unpack
+
+from vaikerai.resource import Namespace, Resource
+
+DEFAULT_UPLOAD_THRESHOLD = 1024 * 1024
+"""
+The size in bytes above which file inputs are uploaded
+instead of being sent inline as base64-encoded data URIs.
+"""
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class File(Resource):
+    """
+    A file uploaded to VaikerAI.
+    """
+
+    id: str
+    """The ID of the file."""
+
+    name: str
+    """The name of the file."""
+
+    content_type: str
+    """The content type of the file."""
+
+    size: int
+    """The size of the file in bytes."""
+
+    etag: Optional[str] = None
+    """The ETag of the file."""
+
+    checksums: Optional[Dict[str, str]] = None
+    """The checksums of the file."""
+
+    metadata: Optional[Dict[str, Any]] = None
+    """The metadata of the file."""
+
+    created_at: Optional[str] = None
+    """The time the file was created."""
+
+    expires_at: Optional[str] = None
+    """The time the file will expire."""
+
+    urls: Dict[str, str]
+    """URLs associated with the file."""
+
+
+class Files(Namespace):
+    """
+    Namespace for operations related to files.
+    """
+
+    class CreateFileParams(TypedDict):
+        """Parameters for creating a file."""
+
+        filename: NotRequired[str]
+        """The name of the file. Defaults to the name of the file on disk."""
+
+        content_type: NotRequired[str]
+        """The content type of the file. Defaults to a guess based on its name."""
+
+        metadata: NotRequired[Dict[str, Any]]
+        """User-provided metadata associated with the file."""
+
+    def create(
+        self,
+        file: Union[str, Path, BinaryIO, io.IOBase],
+        **params: Unpack["Files.CreateFileParams"],
+    ) -> File:
+        """
+        Upload a file.
+
+        The file is sent in chunks as it's read,
+        so it's never loaded into memory in full.
+
+        Args:
+            file: The path to a file, or a file handle opened in binary mode.
+            filename: The name of the file.
+            content_type: The content type of the file.
+            metadata: User-provided metadata associated with the file.
+        Returns:
+            File: The uploaded file.
+        """
+
+        if isinstance(file, (str, Path)):
+            with open(file, "rb") as f:
+                return self.create(f, **params)
+
+        files, data = _create_file_params(file, **params)
+        resp = self._client._request("POST", "/v1/files", files=files, data=data)
+
+        return _json_to_file(self._client._decode_json(resp))
+
+    async def async_create(
+        self,
+        file: Union[str, Path, BinaryIO, io.IOBase],
+        **params: Unpack["Files.CreateFileParams"],
+    ) -> File:
+        """
+        Upload a file asynchronously.
+
+        The file is sent in chunks as it's read,
+        so it's never loaded into memory in full.
+        Chunks are read in a worker thread, so reading doesn't block the event loop.
+
+        Args:
+            file: The path to a file, or a file handle opened in binary mode.
+            filename: The name of the file.
+            content_type: The content type of the file.
+            metadata: User-provided metadata associated with the file.
+        Returns:
+            File: The uploaded file.
+        """
+
+        if isinstance(file, (str, Path)):
+            with open(file, "rb") as f:
+                return await self.async_create(f, **params)
+
+        headers, content = _async_multipart_body(file, **params)
+        resp = await self._client._async_request(
+            "POST", "/v1/files", headers=headers, content=content
+        )
+
+        return _json_to_file(self._client._decode_json(resp))
+
+    def get(self, id: str) -> File:
+        """
+        Get an uploaded file.
+
+        Args:
+            id: The ID of the file.
+        Returns:
+            File: The file.
+        """
+
+        resp = self._client._request("GET", f"/v1/files/{id}")
+
+        return _json_to_file(self._client._decode_json(resp))
+
+    async def async_get(self, id: str) -> File:
+        """
+        Get an uploaded file.
+
+        Args:
+            id: The ID of the file.
+        Returns:
+            File: The file.
+        """
+
+        resp = await self._client._async_request("GET", f"/v1/files/{id}")
+
+        return _json_to_file(self._client._decode_json(resp))
+
+    def delete(self, id: str) -> None:
+        """
+        Delete an uploaded file.
+
+        Args:
+            id: The ID of the file.
+        """
+
+        self._client._request("DELETE", f"/v1/files/{id}")
+
+    async def async_delete(self, id: str) -> None:
+        """
+        Delete an uploaded file.
+
+        Args:
+            id: The ID of the file.
+        """
+
+        await self._client._async_request("DELETE", f"/v1/files/{id}")
+
+    def encode(self, file: io.IOBase) -> str:
+        """
+        Return a value that can be sent as a file input.
+
+        Files no larger than the client's `upload_threshold` are encoded inline
+        as data URIs. Larger files are uploaded, and the URL of the upload is returned.
+        If the client has an `upload_cache`, files with the same contents
+        are only encoded or uploaded once.
+
+        Args:
+            file: A file handle to encode.
+        Returns:
+            str: A data URI, or a URL to the uploaded file.
+        """
+
+        cache = self._client.upload_cache
+        digest = cache.digest(file) if cache is not None else None
+        if cache is None or digest is None:
+            return self._encode(file)
+
+        # Hold the digest's lock while encoding,
+        # so that concurrent calls with the same contents wait for the first one
+        with cache.lock(digest):
+            value = cache.get(digest)
+            if value is None:
+                value = self._encode(file)
+                cache.put(digest, value)
+
+        return value
+
+    def _encode(self, file: io.IOBase) -> str:
+        if _should_upload(file, self._client.upload_threshold):
+            file.seek(0)
+            return self.create(file).urls["get"]
+
+        return upload_file(file)
+
+    async def async_encode(self, file: io.IOBase) -> str:
+        """
+        Return a value that can be sent as a file input, asynchronously.
+
+        This works like `encode`, but never blocks the event loop:
+        files are hashed and read, and the cache is loaded and saved, in worker threads,
+        and uploaded with the client's asynchronous HTTP client.
+
+        Args:
+            file: A file handle to encode.
+        Returns:
+            str: A data URI, or a URL to the uploaded file.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        cache = self._client.upload_cache
+        digest = (
+            await loop.run_in_executor(None, cache.digest, file)
+            if cache is not None
+            else None
+        )
+        if cache is None or digest is None:
+            return await self._async_encode(file)
+
+        # The cache may read from or write to disk, so it's used in worker threads
+        async with cache.async_lock(digest):
+            value = await loop.run_in_executor(None, cache.get, digest)
+            if value is None:
+                value = await self._async_encode(file)
+                await loop.run_in_executor(None, cache.put, digest, value)
+
+        return value
+
+    async def _async_encode(self, file: io.IOBase) -> str:
+        if _should_upload(file, self._client.upload_threshold):
+            file.seek(0)
+            return (await self.async_create(file)).urls["get"]
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, upload_file, file)
 
 
 def upload_file(file: io.IOBase, output_file_prefix: Optional[str] = None) -> str:
@@ -38,3 +303,93 @@ def upload_file(file: io.IOBase, output_file_prefix: Optional[str] = None) -> st
         mimetypes.guess_type(getattr(file, "name", ""))[0] or "application/octet-stream"
     )
     return f"data:{mime_type};base64,{encoded_body}"
+
+
+def _should_upload(file: io.IOBase, threshold: Optional[int]) -> bool:
+    if threshold is None or isinstance(file, io.TextIOBase):
+        return False
+
+    size = _file_size(file)
+    return size is not None and size > threshold
+
+
+def _file_size(file: io.IOBase) -> Optional[int]:
+    try:
+        return os.fstat(file.fileno()).st_size
+    except (AttributeError, OSError):
+        pass
+
+    try:
+        position = file.tell()
+        size = file.seek(0, os.SEEK_END)
+        file.seek(position)
+    except (AttributeError, OSError):
+        return None
+
+    return size
+
+
+def _create_file_params(
+    file: Union[BinaryIO, io.IOBase],
+    **params: Unpack["Files.CreateFileParams"],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    filename = params.get("filename") or os.path.basename(getattr(file, "name", "file"))
+    content_type = (
+        params.get("content_type")
+        or mimetypes.guess_type(filename)[0]
+        or "application/octet-stream"
+    )
+
+    files = {"content": (filename, file, content_type)}
+    data = {}
+    if metadata := params.get("metadata"):
+        data["metadata"] = json.dumps(metadata)
+
+    return files, data
+
+
+def _async_multipart_body(
+    file: Union[BinaryIO, io.IOBase],
+    **params: Unpack["Files.CreateFileParams"],
+) -> Tuple[Dict[str, str], AsyncIterator[bytes]]:
+    # httpx reads multipart files synchronously,
+    # so build the body by hand and read the file in a worker thread.
+    files, data = _create_file_params(file, **params)
+    filename, _, content_type = files["content"]
+
+    boundary = os.urandom(16).hex()
+    parts = [
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+        f"{value}\r\n"
+        for name, value in data.items()
+    ]
+    parts.append(
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="content"; filename="{_quote(filename)}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    )
+    head = "".join(parts).encode("utf-8")
+    tail = f"\r\n--{boundary}--\r\n".encode()
+
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+    size = _file_size(file)
+    if size is not None:
+        headers["Content-Length"] = str(len(head) + size - file.tell() + len(tail))
+
+    async def content() -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+
+        yield head
+        while chunk := await loop.run_in_executor(None, file.read, _CHUNK_SIZE):
+            yield chunk
+        yield tail
+
+    return headers, content()
+
+
+def _quote(filename: str) -> str:
+    return filename.replace("\\", "\\\\").replace('"', "%22")
+
+
+def _json_to_file(json: Dict[str, Any]) -> File:  # pylint: disable=redefined-outer-name
+    return File(**json)
@@ -46,7 +46,7 @@ class HardwareNamespace(Namespace):
         """
 
         resp = self._client._request("GET", "/v1/hardware")
-        obj = resp.json()
+        obj = self._client._decode_json(resp)
 
         return [_json_to_hardware(entry) for entry in obj]
 
@@ -59,7 +59,7 @@ class HardwareNamespace(Namespace):
         """
 
         resp = await self._client._async_request("GET", "/v1/hardware")
-        obj = resp.json()
+        obj = self._client._decode_json(resp)
 
         return [_json_to_hardware(entry) for entry in obj]
 
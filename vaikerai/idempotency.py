@@ -0,0 +1,164 @@
+import copy
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+class IdempotencyKeyConflictError(ValueError):
+    """Exception raised when an idempotency key is reused for a different request."""
+
+
+def new_idempotency_key() -> str:
+    """
+    Generate a new random idempotency key.
+    """
+
+    return uuid.uuid4().hex
+
+
+def request_fingerprint(path: str, body: Dict[str, Any]) -> str:
+    """
+    Return a digest of a create request, to detect idempotency keys reused for different requests.
+    """
+
+    content = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{path}\n{content}".encode()).hexdigest()
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    fingerprint: Optional[str]
+    obj: Dict[str, Any]
+
+
+class IdempotencyTable:
+    """
+    A bounded, thread-safe record of the resources created for each idempotency key.
+
+    When a create call is repeated with a key that has already succeeded,
+    the recorded resource is returned instead of sending another request.
+    A call repeated while the first is still in flight waits for its result.
+    Reusing a key for a different request raises `IdempotencyKeyConflictError`.
+    """
+
+    maxsize: int
+    """The maximum number of keys to remember."""
+
+    ttl: float
+    """The number of seconds to remember each key."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 24 * 60 * 60) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._pending: Dict[str, Tuple[Optional[str], "Future[Dict[str, Any]]"]] = {}
+
+    def get(
+        self, key: str, fingerprint: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the resource created for `key`, if any.
+        """
+
+        with self._lock:
+            entry = self._lookup(key, fingerprint)
+            if entry is None:
+                return None
+
+        return copy.deepcopy(entry.obj)
+
+    def begin(
+        self, key: str, fingerprint: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional["Future[Dict[str, Any]]"]]:
+        """
+        Start a create request for `key`.
+
+        Returns:
+            A copy of the resource already created for `key`, if any.
+            Otherwise, a future for the request already in flight for `key`, if any.
+            Otherwise, `(None, None)`, and the caller must send the request,
+            then call `put` with its result or `abort` if it fails.
+        """
+
+        with self._lock:
+            entry = self._lookup(key, fingerprint)
+            if entry is None:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    _check_fingerprint(key, pending[0], fingerprint)
+                    return None, pending[1]
+
+                self._pending[key] = (fingerprint, Future())
+                return None, None
+
+        return copy.deepcopy(entry.obj), None
+
+    def put(
+        self, key: str, obj: Dict[str, Any], fingerprint: Optional[str] = None
+    ) -> None:
+        """
+        Record the resource created for `key`.
+        """
+
+        with self._lock:
+            self._entries[key] = _Entry(time.monotonic() + self.ttl, fingerprint, obj)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            _, future = self._pending.pop(key, (None, None))
+
+        if future is not None:
+            future.set_result(obj)
+
+    def abort(self, key: str, exc: BaseException) -> None:
+        """
+        Record that the create request started for `key` with `begin` failed,
+        so that a request waiting on it can be sent instead.
+        """
+
+        with self._lock:
+            _, future = self._pending.pop(key, (None, None))
+
+        if future is not None:
+            future.set_exception(exc)
+
+    def clear(self) -> None:
+        """
+        Forget all recorded keys.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: str, fingerprint: Optional[str]) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        _check_fingerprint(key, entry.fingerprint, fingerprint)
+        self._entries.move_to_end(key)
+        return entry
+
+
+def _check_fingerprint(
+    key: str, recorded: Optional[str], fingerprint: Optional[str]
+) -> None:
+    if recorded is not None and fingerprint is not None and recorded != fingerprint:
+        raise IdempotencyKeyConflictError(
+            f"Idempotency key {key!r} was already used for a different request"
+        )
@@ -1,7 +1,21 @@
+import array
+import asyncio
 import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import GeneratorType
-from typing import Any, Callable
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 try:
     import numpy as np  # type: ignore
@@ -11,30 +25,260 @@ except ImportError:
     HAS_NUMPY = False
 
 
-# pylint: disable=too-many-return-statements
+class _FileInput:
+    """
+    A placeholder for a file in an input, until the file has been encoded.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Hashable) -> None:
+        self.key = key
+
+
+class _ArrayInput:
+    """
+    A NumPy array to be encoded as a `.npy` file,
+    which is only written when the file is about to be encoded.
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, array: "np.ndarray") -> None:  # type: ignore
+        self.array = array
+
+    def to_file(self) -> "_BufferFile":
+        file = io.BytesIO()
+        np.lib.format.write_array(file, self.array, allow_pickle=False)  # type: ignore
+        return _BufferFile(file.getbuffer(), name="array.npy", source=self.array)
+
+
+_File = Union[Path, io.IOBase, _ArrayInput]
+_Ref = Tuple[Any, Any, Hashable]
+
+ArrayEncoding = Literal["list", "npy"]
+"""
+How NumPy arrays are encoded:
+as nested lists of numbers (`"list"`),
+or as `.npy` files (`"npy"`) that are sent like any other file input.
+"""
+
+
 def encode_json(
     obj: Any,  # noqa: ANN401
     upload_file: Callable[[io.IOBase], str],
+    *,
+    max_workers: int = 8,
+    array_encoding: ArrayEncoding = "list",
 ) -> Any:  # noqa: ANN401
     """
     Return a JSON-compatible version of the object.
+
+    Files are collected from the whole object first,
+    and then encoded with `upload_file` in a thread pool of up to `max_workers` threads.
+    A file that appears more than once in the object is only encoded once.
+
+    Binary data (`bytes`, `bytearray`, `memoryview`, and `array.array`) is encoded as a file,
+    as are NumPy arrays if `array_encoding` is `"npy"`.
     """
-    # Effectively the same thing as cog.json.encode_json.
+
+    files: Dict[Hashable, _File] = {}
+    refs: List[_Ref] = []
+    encoded = _encode(obj, files, refs, array_encoding)
+    if not files:
+        return encoded
+
+    if len(files) == 1 or max_workers <= 1:
+        values = {key: _encode_file(file, upload_file) for key, file in files.items()}
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+            futures = {
+                key: executor.submit(_encode_file, file, upload_file)
+                for key, file in files.items()
+            }
+            values = {key: future.result() for key, future in futures.items()}
+
+    return _resolve(encoded, refs, values)
+
+
+async def async_encode_json(
+    obj: Any,  # noqa: ANN401
+    upload_file: Callable[[io.IOBase], Awaitable[str]],
+    *,
+    max_concurrency: int = 8,
+    array_encoding: ArrayEncoding = "list",
+) -> Any:  # noqa: ANN401
+    """
+    Return a JSON-compatible version of the object asynchronously.
+
+    Files are collected from the whole object first,
+    and then encoded with `upload_file` in up to `max_concurrency` concurrent tasks.
+    A file that appears more than once in the object is only encoded once.
+
+    Binary data (`bytes`, `bytearray`, `memoryview`, and `array.array`) is encoded as a file,
+    as are NumPy arrays if `array_encoding` is `"npy"`.
+    """
+
+    files: Dict[Hashable, _File] = {}
+    refs: List[_Ref] = []
+    encoded = _encode(obj, files, refs, array_encoding)
+    if not files:
+        return encoded
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def encode_file(file: _File) -> str:
+        async with semaphore:
+            if isinstance(file, _ArrayInput):
+                # Writing a large array can take a while, so it's done in a worker thread
+                return await upload_file(await loop.run_in_executor(None, file.to_file))
+            if isinstance(file, Path):
+                with file.open("rb") as f:
+                    return await upload_file(f)
+            return await upload_file(file)
+
+    results = await asyncio.gather(*(encode_file(file) for file in files.values()))
+    values = dict(zip(files.keys(), results))
+
+    return _resolve(encoded, refs, values)
+
+
+# pylint: disable=too-many-return-statements
+def _encode(
+    obj: Any,  # noqa: ANN401
+    files: Dict[Hashable, _File],
+    refs: List[_Ref],
+    array_encoding: ArrayEncoding = "list",
+) -> Any:  # noqa: ANN401
+    # Effectively the same thing as cog.json.encode_json,
+    # except that files are replaced with placeholders to be encoded later.
 
     if isinstance(obj, dict):
-        return {key: encode_json(value, upload_file) for key, value in obj.items()}
+        result = {}
+        for key, value in obj.items():
+            result[key] = _encode(value, files, refs, array_encoding)
+            if isinstance(result[key], _FileInput):
+                refs.append((result, key, result[key].key))
+        return result
     if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
-        return [encode_json(value, upload_file) for value in obj]
+        result = []
+        for value in obj:
+            result.append(_encode(value, files, refs, array_encoding))
+            if isinstance(result[-1], _FileInput):
+                refs.append((result, len(result) - 1, result[-1].key))
+        return result
     if isinstance(obj, Path):
-        with obj.open("rb") as file:
-            return upload_file(file)
+        key = ("path", obj.resolve())
+        files.setdefault(key, obj)
+        return _FileInput(key)
     if isinstance(obj, io.IOBase):
-        return upload_file(obj)
+        key = ("file", id(obj))
+        files.setdefault(key, obj)
+        return _FileInput(key)
+    if isinstance(obj, (bytes, bytearray, memoryview, array.array)):
+        # The file keeps a reference to the buffer,
+        # so its id can't be reused by another object while it's being encoded
+        key = ("buffer", id(obj))
+        if key not in files:
+            files[key] = _BufferFile(obj)
+        return _FileInput(key)
     if HAS_NUMPY:
         if isinstance(obj, np.integer):  # type: ignore
             return int(obj)
         if isinstance(obj, np.floating):  # type: ignore
             return float(obj)
         if isinstance(obj, np.ndarray):  # type: ignore
+            if array_encoding == "npy":
+                key = ("buffer", id(obj))
+                files.setdefault(key, _ArrayInput(obj))
+                return _FileInput(key)
             return obj.tolist()
     return obj
+
+
+class _BufferFile(io.BufferedIOBase):
+    """
+    A read-only file over a buffer, which reads from it without copying it up front.
+    """
+
+    def __init__(
+        self,
+        buffer: Any,  # noqa: ANN401
+        *,
+        name: Optional[str] = None,
+        source: Any = None,  # noqa: ANN401
+    ) -> None:
+        super().__init__()
+        view = memoryview(buffer)
+        # Only contiguous buffers can be read as bytes in place
+        self._buffer = (
+            view.cast("B") if view.c_contiguous else memoryview(view.tobytes())
+        )
+        self._position = 0
+        # Keep the object the buffer was made from alive along with the file
+        self._source = source
+        if name is not None:
+            self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        end = len(self._buffer)
+        if size is not None and size >= 0:
+            end = min(end, self._position + size)
+
+        chunk = self._buffer[self._position : end].tobytes()
+        self._position = max(self._position, end)
+        return chunk
+
+    read1 = read
+
+    def readinto(self, b: Any) -> int:  # noqa: ANN401
+        chunk = self._buffer[self._position : self._position + len(b)]
+        b[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence: {whence}")
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position: {offset}")
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._position
+
+
+def _encode_file(file: _File, upload_file: Callable[[io.IOBase], str]) -> str:
+    if isinstance(file, _ArrayInput):
+        return upload_file(file.to_file())
+    if isinstance(file, Path):
+        with file.open("rb") as f:
+            return upload_file(f)
+    return upload_file(file)
+
+
+def _resolve(
+    encoded: Any,  # noqa: ANN401
+    refs: List[_Ref],
+    values: Dict[Hashable, str],
+) -> Any:  # noqa: ANN401
+    if isinstance(encoded, _FileInput):
+        return values[encoded.key]
+
+    for container, index, key in refs:
+        container[index] = values[key]
+
+    return encoded
@@ -1,16 +1,44 @@
-from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 from typing_extensions import NotRequired, TypedDict, Unpack, deprecated
 
+from vaikerai.batch import (
+    BatchResult,
+    async_create_many,
+    async_run_many,
+    create_many,
+    run_many,
+)
 from vaikerai.exceptions import VaikerAIException
 from vaikerai.identifier import ModelVersionIdentifier
-from vaikerai.pagination import Page
+from vaikerai.pagination import (
+    Page,
+    _async_iter_items,
+    _iter_items,
+    _json_to_page,
+    _lazy_page,
+)
 from vaikerai.prediction import (
     Prediction,
+    _async_create_prediction_body,
     _create_prediction_body,
     _json_to_prediction,
 )
-from vaikerai.resource import Namespace, Resource
+from vaikerai.resource import Namespace, Resource, ResourceView
 from vaikerai.version import Version, Versions
 
 try:
@@ -154,12 +182,34 @@ class Models(Namespace):
 
         return ModelsPredictions(client=self._client)
 
-    def list(self, cursor: Union[str, "ellipsis", None] = ...) -> Page[Model]:  # noqa: F821
+    @overload
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[False] = False,
+    ) -> Page[Model]: ...
+
+    @overload
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[True],
+    ) -> Page[ResourceView[Model]]: ...
+
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: bool = False,
+    ) -> Union[Page[Model], Page[ResourceView[Model]]]:
         """
         List all public models.
 
         Parameters:
             cursor: The cursor to use for pagination. Use the value of `Page.next` or `Page.previous`.
+            lazy: Whether to return lightweight views of the results, which validate each field the first time it's accessed.
         Returns:
             Page[Model]: A page of of models.
         Raises:
@@ -171,22 +221,44 @@ class Models(Namespace):
 
         resp = self._client._request("GET", "/v1/models" if cursor is ... else cursor)
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_model(self._client, result) for result in obj["results"]
-        ]
+        obj = self._client._decode_json(resp)
+        if lazy:
+            return _lazy_page(
+                obj, Model, lambda result: _json_to_model(self._client, result)
+            )
+
+        return _json_to_page(
+            obj, Model, lambda result: _json_to_model(self._client, result)
+        )
+
+    @overload
+    async def async_list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[False] = False,
+    ) -> Page[Model]: ...
 
-        return Page[Model](**obj)
+    @overload
+    async def async_list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[True],
+    ) -> Page[ResourceView[Model]]: ...
 
     async def async_list(
         self,
         cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
-    ) -> Page[Model]:
+        *,
+        lazy: bool = False,
+    ) -> Union[Page[Model], Page[ResourceView[Model]]]:
         """
         List all public models.
 
         Parameters:
             cursor: The cursor to use for pagination. Use the value of `Page.next` or `Page.previous`.
+            lazy: Whether to return lightweight views of the results, which validate each field the first time it's accessed.
         Returns:
             Page[Model]: A page of of models.
         Raises:
@@ -200,12 +272,51 @@ class Models(Namespace):
             "GET", "/v1/models" if cursor is ... else cursor
         )
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_model(self._client, result) for result in obj["results"]
-        ]
+        obj = self._client._decode_json(resp)
+        if lazy:
+            return _lazy_page(
+                obj, Model, lambda result: _json_to_model(self._client, result)
+            )
+
+        return _json_to_page(
+            obj, Model, lambda result: _json_to_model(self._client, result)
+        )
+
+    def iter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Model], bool]] = None,
+    ) -> Iterator[Model]:
+        """
+        Iterate over all models, fetching pages only as they're needed.
+
+        Parameters:
+            limit: The maximum number of models to return.
+            until: A predicate that stops iteration at the first model it returns `True` for. That model isn't returned.
+        Returns:
+            Iterator[Model]: An iterator of models.
+        """
+
+        return _iter_items(self.list, limit=limit, until=until)
 
-        return Page[Model](**obj)
+    def aiter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Model], bool]] = None,
+    ) -> AsyncIterator[Model]:
+        """
+        Asynchronously iterate over all models, fetching pages only as they're needed.
+
+        Parameters:
+            limit: The maximum number of models to return.
+            until: A predicate that stops iteration at the first model it returns `True` for. That model isn't returned.
+        Returns:
+            AsyncIterator[Model]: An async iterator of models.
+        """
+
+        return _async_iter_items(self.async_list, limit=limit, until=until)
 
     def search(self, query: str) -> Page[Model]:
         """
@@ -220,12 +331,10 @@ class Models(Namespace):
             "QUERY", "/v1/models", content=query, headers={"Content-Type": "text/plain"}
         )
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_model(self._client, result) for result in obj["results"]
-        ]
-
-        return Page[Model](**obj)
+        obj = self._client._decode_json(resp)
+        return _json_to_page(
+            obj, Model, lambda result: _json_to_model(self._client, result)
+        )
 
     async def async_search(self, query: str) -> Page[Model]:
         """
@@ -240,12 +349,10 @@ class Models(Namespace):
             "QUERY", "/v1/models", content=query, headers={"Content-Type": "text/plain"}
         )
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_model(self._client, result) for result in obj["results"]
-        ]
-
-        return Page[Model](**obj)
+        obj = self._client._decode_json(resp)
+        return _json_to_page(
+            obj, Model, lambda result: _json_to_model(self._client, result)
+        )
 
     @overload
     def get(self, key: str) -> Model: ...
@@ -261,7 +368,7 @@ class Models(Namespace):
         url = _get_model_url(*args, **kwargs)
         resp = self._client._request("GET", url)
 
-        return _json_to_model(self._client, resp.json())
+        return _json_to_model(self._client, self._client._decode_json(resp))
 
     @overload
     async def async_get(self, key: str) -> Model: ...
@@ -282,7 +389,7 @@ class Models(Namespace):
         url = _get_model_url(*args, **kwargs)
         resp = await self._client._async_request("GET", url)
 
-        return _json_to_model(self._client, resp.json())
+        return _json_to_model(self._client, self._client._decode_json(resp))
 
     @overload
     def delete(self, key: str) -> Model: ...
@@ -298,7 +405,7 @@ class Models(Namespace):
         url = _delete_model_url(*args, **kwargs)
         resp = self._client._request("DELETE", url)
 
-        return _json_to_model(self._client, resp.json())
+        return _json_to_model(self._client, self._client._decode_json(resp))
 
     @overload
     async def async_delete(self, key: str) -> Model: ...
@@ -319,7 +426,7 @@ class Models(Namespace):
         url = _delete_model_url(*args, **kwargs)
         resp = await self._client._async_request("DELETE", url)
 
-        return _json_to_model(self._client, resp.json())
+        return _json_to_model(self._client, self._client._decode_json(resp))
 
     class CreateModelParams(TypedDict):
         """Parameters for creating a model."""
@@ -360,7 +467,7 @@ class Models(Namespace):
         body = _create_model_body(owner, name, **params)
         resp = self._client._request("POST", "/v1/models", json=body)
 
-        return _json_to_model(self._client, resp.json())
+        return _json_to_model(self._client, self._client._decode_json(resp))
 
     async def async_create(
         self, owner: str, name: str, **params: Unpack["Models.CreateModelParams"]
@@ -372,7 +479,7 @@ class Models(Namespace):
         body = body = _create_model_body(owner, name, **params)
         resp = await self._client._async_request("POST", "/v1/models", json=body)
 
-        return _json_to_model(self._client, resp.json())
+        return _json_to_model(self._client, self._client._decode_json(resp))
 
 
 class ModelsPredictions(Namespace):
@@ -391,15 +498,14 @@ class ModelsPredictions(Namespace):
         """
 
         url = _create_prediction_url_from_model(model)
-        body = _create_prediction_body(version=None, input=input, **params)
-
-        resp = self._client._request(
-            "POST",
-            url,
-            json=body,
+        idempotency_key = params.pop("idempotency_key", None)
+        body = _create_prediction_body(
+            self._client, version=None, input=input, **params
         )
 
-        return _json_to_prediction(self._client, resp.json())
+        obj = self._client._idempotent_post(url, body, idempotency_key)
+
+        return _json_to_prediction(self._client, obj)
 
     async def async_create(
         self,
@@ -412,15 +518,124 @@ class ModelsPredictions(Namespace):
         """
 
         url = _create_prediction_url_from_model(model)
-        body = _create_prediction_body(version=None, input=input, **params)
+        idempotency_key = params.pop("idempotency_key", None)
+        body = await _async_create_prediction_body(
+            self._client, version=None, input=input, **params
+        )
 
-        resp = await self._client._async_request(
-            "POST",
-            url,
-            json=body,
+        obj = await self._client._async_idempotent_post(url, body, idempotency_key)
+
+        return _json_to_prediction(self._client, obj)
+
+    def create_many(
+        self,
+        model: Union[str, Tuple[str, str], "Model"],
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Create a prediction with the model for each input.
+
+        Args:
+            model: The model to create predictions with.
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        return create_many(
+            lambda input, **kwargs: self.create(model, input, **kwargs),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
         )
 
-        return _json_to_prediction(self._client, resp.json())
+    async def async_create_many(
+        self,
+        model: Union[str, Tuple[str, str], "Model"],
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Create a prediction with the model for each input.
+
+        Args:
+            model: The model to create predictions with.
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        return await async_create_many(
+            lambda input, **kwargs: self.async_create(model, input, **kwargs),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
+        )
+
+    def run_many(
+        self,
+        model: Union[str, Tuple[str, str], "Model"],
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Run the model for each input and wait for the outputs.
+
+        Args:
+            model: The model to create predictions with.
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        return run_many(
+            self._client,
+            lambda input, **kwargs: self.create(model, input, **kwargs),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
+        )
+
+    async def async_run_many(
+        self,
+        model: Union[str, Tuple[str, str], "Model"],
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Run the model for each input and wait for the outputs.
+
+        Args:
+            model: The model to create predictions with.
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        return await async_run_many(
+            self._client,
+            lambda input, **kwargs: self.async_create(model, input, **kwargs),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
+        )
 
 
 def _create_model_body(  # pylint: disable=too-many-arguments
@@ -1,12 +1,19 @@
+import asyncio
+import contextlib
+import queue
+import threading
 from typing import (
     TYPE_CHECKING,
+    Any,
     AsyncGenerator,
     Awaitable,
     Callable,
+    Dict,
     Generator,
     Generic,
     List,
     Optional,
+    Type,
     TypeVar,
     Union,
 )
@@ -16,9 +23,9 @@ try:
 except ImportError:
     import pydantic  # type: ignore
 
-from vaikerai.resource import Resource
+from vaikerai.resource import R, Resource, ResourceView
 
-T = TypeVar("T", bound=Resource)
+T = TypeVar("T", bound=Union[Resource, ResourceView])
 
 if TYPE_CHECKING:
     pass
@@ -48,15 +55,53 @@ class Page(pydantic.BaseModel, Generic[T]):  # type: ignore
         return len(self.results)
 
 
+def _json_to_page(
+    obj: Dict[str, Any],
+    resource_type: Type[R],
+    factory: Callable[[Dict[str, Any]], R],
+) -> Page[R]:
+    # Results are validated once by `factory`, so build the page without validating them again
+    return Page[resource_type].construct(  # type: ignore[valid-type]
+        previous=obj.get("previous"),
+        next=obj.get("next"),
+        results=[factory(result) for result in obj["results"]],
+    )
+
+
+def _lazy_page(
+    obj: Dict[str, Any],
+    resource_type: Type[R],
+    factory: Callable[[Dict[str, Any]], R],
+) -> Page[ResourceView[R]]:
+    return Page.construct(
+        previous=obj.get("previous"),
+        next=obj.get("next"),
+        results=[
+            ResourceView(result, resource_type, factory) for result in obj["results"]
+        ],
+    )
+
+
+_DONE = object()
+
+
 def paginate(
     list_method: Callable[[Union[str, "ellipsis", None]], Page[T]],  # noqa: F821
+    *,
+    prefetch: int = 0,
 ) -> Generator[Page[T], None, None]:
     """
     Iterate over all items using the provided list method.
 
     Args:
         list_method: A method that takes a cursor argument and returns a Page of items.
+        prefetch: The number of pages to fetch ahead on a background thread
+            while the current page is being processed. Pages are fetched one at a time if 0.
     """
+    if prefetch > 0:
+        yield from _prefetch_pages(list_method, prefetch)
+        return
+
     cursor: Union[str, "ellipsis", None] = ...  # noqa: F821
     while cursor is not None:
         page = list_method(cursor)
@@ -66,15 +111,139 @@ def paginate(
 
 async def async_paginate(
     list_method: Callable[[Union[str, "ellipsis", None]], Awaitable[Page[T]]],  # noqa: F821
+    *,
+    prefetch: int = 0,
 ) -> AsyncGenerator[Page[T], None]:
     """
     Asynchronously iterate over all items using the provided list method.
 
     Args:
         list_method: An async method that takes a cursor argument and returns a Page of items.
+        prefetch: The number of pages to fetch ahead in a background task
+            while the current page is being processed. Pages are fetched one at a time if 0.
     """
+    if prefetch > 0:
+        pages = _async_prefetch_pages(list_method, prefetch)
+        try:
+            async for page in pages:
+                yield page
+        finally:
+            await pages.aclose()
+        return
+
     cursor: Union[str, "ellipsis", None] = ...  # noqa: F821
     while cursor is not None:
         page = await list_method(cursor)
         yield page
         cursor = page.next
+
+
+def _iter_items(
+    list_method: Callable[[Union[str, "ellipsis", None]], Page[T]],  # noqa: F821
+    *,
+    limit: Optional[int] = None,
+    until: Optional[Callable[[T], bool]] = None,
+) -> Generator[T, None, None]:
+    # Pages are only fetched as the caller asks for more items,
+    # so stopping early never requests a page that isn't read
+    if limit is not None and limit <= 0:
+        return
+
+    count = 0
+    for page in paginate(list_method):
+        for item in page:
+            if until is not None and until(item):
+                return
+            yield item
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
+async def _async_iter_items(
+    list_method: Callable[[Union[str, "ellipsis", None]], Awaitable[Page[T]]],  # noqa: F821
+    *,
+    limit: Optional[int] = None,
+    until: Optional[Callable[[T], bool]] = None,
+) -> AsyncGenerator[T, None]:
+    if limit is not None and limit <= 0:
+        return
+
+    count = 0
+    async for page in async_paginate(list_method):
+        for item in page:
+            if until is not None and until(item):
+                return
+            yield item
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
+def _prefetch_pages(
+    list_method: Callable[[Union[str, "ellipsis", None]], Page[T]],  # noqa: F821
+    depth: int,
+) -> Generator[Page[T], None, None]:
+    # At most `depth` pages wait in the queue, plus one being fetched and one being processed
+    pages: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item: object) -> None:
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def fetch() -> None:
+        cursor: Union[str, "ellipsis", None] = ...  # noqa: F821
+        try:
+            while cursor is not None and not stopped.is_set():
+                page = list_method(cursor)
+                put(page)
+                cursor = page.next
+        except Exception as e:  # noqa: BLE001
+            put(e)
+        else:
+            put(_DONE)
+
+    thread = threading.Thread(target=fetch, name="vaikerai-paginate", daemon=True)
+    thread.start()
+    try:
+        while (item := pages.get()) is not _DONE:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
+async def _async_prefetch_pages(
+    list_method: Callable[[Union[str, "ellipsis", None]], Awaitable[Page[T]]],  # noqa: F821
+    depth: int,
+) -> AsyncGenerator[Page[T], None]:
+    pages: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=depth)
+
+    async def fetch() -> None:
+        cursor: Union[str, "ellipsis", None] = ...  # noqa: F821
+        try:
+            while cursor is not None:
+                page = await list_method(cursor)
+                await pages.put(page)
+                cursor = page.next
+        except Exception as e:  # noqa: BLE001
+            await pages.put(e)
+        else:
+            await pages.put(_DONE)
+
+    task = asyncio.ensure_future(fetch())
+    try:
+        while (item := await pages.get()) is not _DONE:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
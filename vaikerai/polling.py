@@ -0,0 +1,201 @@
+import abc
+import random
+import threading
+
+TERMINAL_STATUSES = frozenset(["succeeded", "failed", "canceled"])
+
+
+class PollingStats:
+    """
+    Counters describing the status requests made by a polling strategy.
+    """
+
+    polls: int
+    """The number of status requests made."""
+
+    baseline_polls: float
+    """The number of status requests a fixed `poll_interval` would have made."""
+
+    time_waited: float
+    """The total number of seconds spent waiting between status requests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.polls = 0
+        self.baseline_polls = 0.0
+        self.time_waited = 0.0
+
+    @property
+    def saved(self) -> int:
+        """
+        The number of status requests saved compared to polling at a fixed interval.
+        """
+
+        return max(0, int(self.baseline_polls) - self.polls)
+
+    def record(self, interval: float, base_interval: float) -> None:
+        """
+        Record a status request made after waiting `interval` seconds.
+        """
+
+        with self._lock:
+            self.polls += 1
+            self.time_waited += interval
+            if base_interval > 0:
+                self.baseline_polls += interval / base_interval
+            else:
+                self.baseline_polls += 1
+
+    def reset(self) -> None:
+        """
+        Reset all counters to zero.
+        """
+
+        with self._lock:
+            self.polls = 0
+            self.baseline_polls = 0.0
+            self.time_waited = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(polls={self.polls}, saved={self.saved}, "
+            f"time_waited={self.time_waited:.3f})"
+        )
+
+
+class PollingStrategy(abc.ABC):
+    """
+    A base class for deciding how long to wait between status requests.
+    """
+
+    stats: PollingStats
+    """Counters for the status requests made using this strategy."""
+
+    def __init__(self) -> None:
+        self.stats = PollingStats()
+
+    @abc.abstractmethod
+    def interval(
+        self, attempt: int, previous: float, status: str, base_interval: float
+    ) -> float:
+        """
+        Return the number of seconds to wait before the next status request.
+
+        Args:
+            attempt: The number of status requests already made in this wait loop.
+            previous: The interval returned for the previous attempt.
+            status: The current status of the prediction.
+            base_interval: The client's configured `poll_interval`.
+        """
+
+    def schedule(self, base_interval: float) -> "PollingSchedule":
+        """
+        Start a new wait loop using this strategy.
+        """
+
+        return PollingSchedule(self, base_interval)
+
+
+class PollingSchedule:
+    """
+    The state of a single wait loop driven by a polling strategy.
+    """
+
+    attempt: int
+    """The number of status requests made so far."""
+
+    previous: float
+    """The most recent interval."""
+
+    def __init__(self, strategy: PollingStrategy, base_interval: float) -> None:
+        self._strategy = strategy
+        self._base_interval = base_interval
+        self.attempt = 0
+        self.previous = base_interval
+
+    def next_interval(self, status: str) -> float:
+        """
+        Return the number of seconds to wait before the next status request,
+        and count that request in the strategy's stats.
+        """
+
+        interval = self._strategy.interval(
+            self.attempt, self.previous, status, self._base_interval
+        )
+        self.attempt += 1
+        self.previous = interval
+        self._strategy.stats.record(interval, self._base_interval)
+        return interval
+
+
+class FixedPollingStrategy(PollingStrategy):
+    """
+    Wait the client's `poll_interval` between every status request.
+    """
+
+    def interval(
+        self, attempt: int, previous: float, status: str, base_interval: float
+    ) -> float:
+        return base_interval
+
+
+class BackoffPollingStrategy(PollingStrategy):
+    """
+    Wait progressively longer between status requests, using decorrelated jitter.
+
+    The first `fast_start_polls` requests are made every `poll_interval` seconds,
+    so that short predictions complete without added latency.
+    After that, each interval is drawn at random between `poll_interval` and
+    `multiplier` times the previous interval, up to a cap that depends on the
+    prediction's status: predictions that are still `starting` are usually
+    waiting for hardware to boot, and are checked less often than predictions
+    that are `processing`.
+    """
+
+    def __init__(
+        self,
+        *,
+        fast_start_polls: int = 4,
+        multiplier: float = 3.0,
+        starting_max_interval: float = 5.0,
+        processing_max_interval: float = 2.0,
+        jitter: bool = True,
+    ) -> None:
+        super().__init__()
+
+        if multiplier < 1:
+            raise ValueError(f"multiplier should be at least 1, actual {multiplier}")
+
+        self.fast_start_polls = fast_start_polls
+        self.multiplier = multiplier
+        self.starting_max_interval = starting_max_interval
+        self.processing_max_interval = processing_max_interval
+        self.jitter = jitter
+
+    def interval(
+        self, attempt: int, previous: float, status: str, base_interval: float
+    ) -> float:
+        if attempt < self.fast_start_polls:
+            return base_interval
+
+        max_interval = (
+            self.starting_max_interval
+            if status == "starting"
+            else self.processing_max_interval
+        )
+        max_interval = max(max_interval, base_interval)
+
+        upper = max(previous, base_interval) * self.multiplier
+        if self.jitter:
+            upper = random.uniform(base_interval, upper)  # noqa: S311
+
+        return min(upper, max_interval)
+
+
+__all__ = [
+    "BackoffPollingStrategy",
+    "FixedPollingStrategy",
+    "PollingSchedule",
+    "PollingStats",
+    "PollingStrategy",
+]
@@ -1,4 +1,5 @@
 import asyncio
+import os
 import re
 import time
 from dataclasses import dataclass
@@ -6,7 +7,9 @@ from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Literal,
@@ -18,13 +21,27 @@ from typing import (
 
 from typing_extensions import NotRequired, TypedDict, Unpack
 
+from vaikerai.batch import (
+    BatchResult,
+    async_create_many,
+    async_run_many,
+    create_many,
+    run_many,
+)
 from vaikerai.exceptions import ModelError, VaikerAIError
-from vaikerai.files import upload_file
-from vaikerai.json import encode_json
-from vaikerai.pagination import Page
-from vaikerai.resource import Namespace, Resource
-from vaikerai.stream import EventSource
+from vaikerai.export import ExportFormat, _async_export, _export
+from vaikerai.json import async_encode_json, encode_json
+from vaikerai.pagination import (
+    Page,
+    _async_iter_items,
+    _iter_items,
+    _json_to_page,
+    _lazy_page,
+)
+from vaikerai.resource import Namespace, Resource, ResourceView
+from vaikerai.stream import ServerSentEvent, _async_stream_events, _stream_events
 from vaikerai.version import Version
+from vaikerai.waiter import PredictionWaiter
 
 try:
     from pydantic import v1 as pydantic  # type: ignore
@@ -35,7 +52,80 @@ if TYPE_CHECKING:
     from vaikerai.client import Client
     from vaikerai.deployment import Deployment
     from vaikerai.model import Model
-    from vaikerai.stream import ServerSentEvent
+    from vaikerai.stream import LightweightServerSentEvent
+
+
+class _LogReader:
+    """
+    Reads a growing log incrementally.
+
+    The reader remembers how much of the log it has read,
+    so each call only splits and scans the text that was added since the previous one,
+    and the progress is updated from the new text alone.
+    Carriage returns, as written by progress bars, also end a progress update.
+    """
+
+    __slots__ = ("_offset", "_marker", "_pending", "_segment", "progress")
+
+    _separators = re.compile(r"[\r\n]")
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._marker = ""
+        self._pending: List[str] = []
+        self._segment = ""
+        self.progress: Optional["Prediction.Progress"] = None
+
+    def read(self, logs: Optional[str]) -> List[str]:
+        """
+        Return the complete lines added to the log since it was last read.
+        """
+
+        logs = logs or ""
+        if (
+            len(logs) < self._offset
+            or logs[self._offset - len(self._marker) : self._offset] != self._marker
+        ):
+            # The log was replaced, rather than appended to
+            self._reset()
+
+        new = logs[self._offset :]
+        if not new:
+            return []
+
+        self._offset = len(logs)
+        self._marker = logs[-64:]
+
+        segments = self._separators.split(self._segment + new)
+        self._segment = segments[-1]
+        for segment in reversed(segments):
+            progress = Prediction.Progress._parse_line(segment)
+            if progress is not None:
+                self.progress = progress
+                break
+
+        if "\n" not in new:
+            self._pending.append(new)
+            return []
+
+        lines = new.split("\n")
+        self._pending.append(lines[0])
+        lines[0] = "".join(self._pending)
+        self._pending = [lines.pop()]
+        # Logs may end their lines with CRLF
+        return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+    def flush(self) -> List[str]:
+        """
+        Return the last line of the log, if it doesn't end with a newline.
+        """
+
+        line = "".join(self._pending)
+        self._pending = []
+        return [line] if line else []
 
 
 class Prediction(Resource):
@@ -115,33 +205,47 @@ class Prediction(Resource):
 
             lines = logs.split("\n")
             for idx in reversed(range(len(lines))):
-                line = lines[idx].strip()
-                if cls._pattern.match(line):
-                    matches = cls._pattern.findall(line)
-                    if len(matches) == 1:
-                        percentage, current, total = map(int, matches[0])
-                        return cls(percentage / 100.0, current, total)
+                progress = cls._parse_line(lines[idx])
+                if progress is not None:
+                    return progress
+
+            return None
+
+        @classmethod
+        def _parse_line(cls, line: str) -> Optional["Prediction.Progress"]:
+            line = line.strip()
+            if cls._pattern.match(line):
+                matches = cls._pattern.findall(line)
+                if len(matches) == 1:
+                    percentage, current, total = map(int, matches[0])
+                    return cls(percentage / 100.0, current, total)
 
             return None
 
+    _log_reader: _LogReader = pydantic.PrivateAttr(default_factory=_LogReader)
+
     @property
     def progress(self) -> Optional[Progress]:
         """
         The progress of the prediction, if available.
+
+        Only the part of the logs that's new since the last access is parsed.
         """
 
         if self.logs is None or self.logs == "":
             return None
 
-        return Prediction.Progress.parse(self.logs)
+        self._log_reader.read(self.logs)
+        return self._log_reader.progress
 
     def wait(self) -> None:
         """
         Wait for prediction to finish.
         """
 
+        schedule = self._client.polling_strategy.schedule(self._client.poll_interval)
         while self.status not in ["succeeded", "failed", "canceled"]:
-            time.sleep(self._client.poll_interval)
+            time.sleep(schedule.next_interval(self.status))
             self.reload()
 
     async def async_wait(self) -> None:
@@ -149,14 +253,23 @@ class Prediction(Resource):
         Wait for prediction to finish asynchronously.
         """
 
+        schedule = self._client.polling_strategy.schedule(self._client.poll_interval)
         while self.status not in ["succeeded", "failed", "canceled"]:
-            await asyncio.sleep(self._client.poll_interval)
+            await asyncio.sleep(schedule.next_interval(self.status))
             await self.async_reload()
 
-    def stream(self) -> Iterator["ServerSentEvent"]:
+    def stream(
+        self, *, validate: bool = False
+    ) -> Iterator[Union["ServerSentEvent", "LightweightServerSentEvent"]]:
         """
         Stream the prediction output.
 
+        Events are yielded as `LightweightServerSentEvent` objects,
+        or as validated `ServerSentEvent` models if `validate` is true.
+
+        If the connection drops before the prediction completes,
+        the stream reconnects and resumes after the last event it received.
+
         Raises:
             VaikerAIError: If the model does not support streaming.
         """
@@ -165,17 +278,20 @@ class Prediction(Resource):
         if not url or not isinstance(url, str):
             raise VaikerAIError("Model does not support streaming")
 
-        headers = {}
-        headers["Accept"] = "text/event-stream"
-        headers["Cache-Control"] = "no-store"
+        yield from _stream_events(self._client, url, validate=validate)
 
-        with self._client._client.stream("GET", url, headers=headers) as response:
-            yield from EventSource(response)
-
-    async def async_stream(self) -> AsyncIterator["ServerSentEvent"]:
+    async def async_stream(
+        self, *, validate: bool = False
+    ) -> AsyncIterator[Union["ServerSentEvent", "LightweightServerSentEvent"]]:
         """
         Stream the prediction output asynchronously.
 
+        Events are yielded as `LightweightServerSentEvent` objects,
+        or as validated `ServerSentEvent` models if `validate` is true.
+
+        If the connection drops before the prediction completes,
+        the stream reconnects and resumes after the last event it received.
+
         Raises:
             VaikerAIError: If the model does not support streaming.
         """
@@ -187,15 +303,8 @@ class Prediction(Resource):
         if not url or not isinstance(url, str):
             raise VaikerAIError("Model does not support streaming")
 
-        headers = {}
-        headers["Accept"] = "text/event-stream"
-        headers["Cache-Control"] = "no-store"
-
-        async with self._client._async_client.stream(
-            "GET", url, headers=headers
-        ) as response:
-            async for event in EventSource(response):
-                yield event
+        async for event in _async_stream_events(self._client, url, validate=validate):
+            yield event
 
     def cancel(self) -> None:
         """
@@ -239,13 +348,14 @@ class Prediction(Resource):
         """
 
         # TODO: check output is list
+        schedule = self._client.polling_strategy.schedule(self._client.poll_interval)  # pylint: disable=no-member
         previous_output = self.output or []
         while self.status not in ["succeeded", "failed", "canceled"]:
             output = self.output or []
             new_output = output[len(previous_output) :]
             yield from new_output
             previous_output = output
-            time.sleep(self._client.poll_interval)  # pylint: disable=no-member
+            time.sleep(schedule.next_interval(self.status))
             self.reload()
 
         if self.status == "failed":
@@ -255,12 +365,97 @@ class Prediction(Resource):
         new_output = output[len(previous_output) :]
         yield from new_output
 
+    def _stream_output_iterator(self) -> Iterator[Any]:
+        # Yield output as it's streamed, and fall back to polling
+        # if the prediction can't be streamed or the stream can't be read to the end
+        url = self.urls and self.urls.get("stream", None)
+        if not url or not isinstance(url, str):
+            yield from self.output_iterator()
+            return
+
+        count = 0
+        try:
+            for event in _stream_events(self._client, url):
+                if event.event is ServerSentEvent.EventType.OUTPUT:
+                    yield event.data
+                    count += 1
+        except RuntimeError:
+            self.reload()
+            raise ModelError(self) from None
+        except Exception:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+            self.reload()
+            yield from (self.output or [])[count:]
+            yield from self.output_iterator()
+
+    async def _async_stream_output_iterator(self) -> AsyncIterator[Any]:
+        url = self.urls and self.urls.get("stream", None)
+        if not url or not isinstance(url, str):
+            async for output in self.async_output_iterator():
+                yield output
+            return
+
+        count = 0
+        try:
+            async for event in _async_stream_events(self._client, url):
+                if event.event is ServerSentEvent.EventType.OUTPUT:
+                    yield event.data
+                    count += 1
+        except RuntimeError:
+            await self.async_reload()
+            raise ModelError(self) from None
+        except Exception:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+            await self.async_reload()
+            for output in (self.output or [])[count:]:
+                yield output
+            async for output in self.async_output_iterator():
+                yield output
+
+    def iter_logs(self) -> Iterator[str]:
+        """
+        Return an iterator of the prediction's log lines, as they're written.
+
+        The prediction is reloaded until it completes,
+        and only the lines added since the previous reload are returned each time.
+        """
+
+        reader = _LogReader()
+        schedule = self._client.polling_strategy.schedule(self._client.poll_interval)  # pylint: disable=no-member
+        yield from reader.read(self.logs)
+        while self.status not in ["succeeded", "failed", "canceled"]:
+            time.sleep(schedule.next_interval(self.status))
+            self.reload()
+            yield from reader.read(self.logs)
+
+        yield from reader.flush()
+
+    async def aiter_logs(self) -> AsyncIterator[str]:
+        """
+        Return an asynchronous iterator of the prediction's log lines, as they're written.
+
+        The prediction is reloaded until it completes,
+        and only the lines added since the previous reload are returned each time.
+        """
+
+        reader = _LogReader()
+        schedule = self._client.polling_strategy.schedule(self._client.poll_interval)  # pylint: disable=no-member
+        for line in reader.read(self.logs):
+            yield line
+        while self.status not in ["succeeded", "failed", "canceled"]:
+            await asyncio.sleep(schedule.next_interval(self.status))
+            await self.async_reload()
+            for line in reader.read(self.logs):
+                yield line
+
+        for line in reader.flush():
+            yield line
+
     async def async_output_iterator(self) -> AsyncIterator[Any]:
         """
         Return an asynchronous iterator of the prediction output.
         """
 
         # TODO: check output is list
+        schedule = self._client.polling_strategy.schedule(self._client.poll_interval)  # pylint: disable=no-member
         previous_output = self.output or []
         while self.status not in ["succeeded", "failed", "canceled"]:
             output = self.output or []
@@ -268,7 +463,7 @@ class Prediction(Resource):
             for item in new_output:
                 yield item
             previous_output = output
-            await asyncio.sleep(self._client.poll_interval)  # pylint: disable=no-member
+            await asyncio.sleep(schedule.next_interval(self.status))
             await self.async_reload()
 
         if self.status == "failed":
@@ -285,12 +480,34 @@ class Predictions(Namespace):
     Namespace for operations related to predictions.
     """
 
-    def list(self, cursor: Union[str, "ellipsis", None] = ...) -> Page[Prediction]:  # noqa: F821
+    @overload
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[False] = False,
+    ) -> Page[Prediction]: ...
+
+    @overload
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[True],
+    ) -> Page[ResourceView[Prediction]]: ...
+
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: bool = False,
+    ) -> Union[Page[Prediction], Page[ResourceView[Prediction]]]:
         """
         List your predictions.
 
         Parameters:
             cursor: The cursor to use for pagination. Use the value of `Page.next` or `Page.previous`.
+            lazy: Whether to return lightweight views of the results, which validate each field the first time it's accessed.
         Returns:
             Page[Prediction]: A page of of predictions.
         Raises:
@@ -304,22 +521,46 @@ class Predictions(Namespace):
             "GET", "/v1/predictions" if cursor is ... else cursor
         )
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_prediction(self._client, result) for result in obj["results"]
-        ]
+        obj = self._client._decode_json(resp)
+        if lazy:
+            return _lazy_page(
+                obj,
+                Prediction,
+                lambda result: _json_to_prediction(self._client, result),
+            )
+
+        return _json_to_page(
+            obj, Prediction, lambda result: _json_to_prediction(self._client, result)
+        )
+
+    @overload
+    async def async_list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[False] = False,
+    ) -> Page[Prediction]: ...
 
-        return Page[Prediction](**obj)
+    @overload
+    async def async_list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[True],
+    ) -> Page[ResourceView[Prediction]]: ...
 
     async def async_list(
         self,
         cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
-    ) -> Page[Prediction]:
+        *,
+        lazy: bool = False,
+    ) -> Union[Page[Prediction], Page[ResourceView[Prediction]]]:
         """
         List your predictions.
 
         Parameters:
             cursor: The cursor to use for pagination. Use the value of `Page.next` or `Page.previous`.
+            lazy: Whether to return lightweight views of the results, which validate each field the first time it's accessed.
         Returns:
             Page[Prediction]: A page of of predictions.
         Raises:
@@ -333,12 +574,117 @@ class Predictions(Namespace):
             "GET", "/v1/predictions" if cursor is ... else cursor
         )
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_prediction(self._client, result) for result in obj["results"]
-        ]
+        obj = self._client._decode_json(resp)
+        if lazy:
+            return _lazy_page(
+                obj,
+                Prediction,
+                lambda result: _json_to_prediction(self._client, result),
+            )
+
+        return _json_to_page(
+            obj, Prediction, lambda result: _json_to_prediction(self._client, result)
+        )
+
+    def iter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Prediction], bool]] = None,
+    ) -> Iterator[Prediction]:
+        """
+        Iterate over all predictions, fetching pages only as they're needed.
+
+        Predictions are returned newest first.
+
+        Parameters:
+            limit: The maximum number of predictions to return.
+            until: A predicate that stops iteration at the first prediction it returns `True` for. That prediction isn't returned.
+        Returns:
+            Iterator[Prediction]: An iterator of predictions.
+        """
+
+        return _iter_items(self.list, limit=limit, until=until)
+
+    def aiter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Prediction], bool]] = None,
+    ) -> AsyncIterator[Prediction]:
+        """
+        Asynchronously iterate over all predictions, fetching pages only as they're needed.
+
+        Predictions are returned newest first.
+
+        Parameters:
+            limit: The maximum number of predictions to return.
+            until: A predicate that stops iteration at the first prediction it returns `True` for. That prediction isn't returned.
+        Returns:
+            AsyncIterator[Prediction]: An async iterator of predictions.
+        """
+
+        return _async_iter_items(self.async_list, limit=limit, until=until)
+
+    def export(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        format: ExportFormat = "jsonl",  # pylint: disable=redefined-builtin
+        incremental: bool = False,
+    ) -> int:
+        """
+        Export all predictions to a file, writing each page as soon as it's fetched.
 
-        return Page[Prediction](**obj)
+        Progress is saved to a `.state.json` file next to the export,
+        so an interrupted export resumes from where it stopped when it's run again.
+
+        Parameters:
+            path: The file to export to, or the directory for Parquet exports.
+            format: The format to export to, either `jsonl` or `parquet`.
+            incremental: Whether to only export predictions created since the last completed export to `path`, appending them to it. Otherwise, `path` is overwritten.
+        Returns:
+            int: The number of predictions exported.
+        """
+
+        return _export(
+            self._client,
+            "/v1/predictions",
+            path,
+            columns=list(Prediction.__fields__),
+            format=format,
+            incremental=incremental,
+        )
+
+    async def async_export(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        format: ExportFormat = "jsonl",  # pylint: disable=redefined-builtin
+        incremental: bool = False,
+    ) -> int:
+        """
+        Export all predictions to a file, writing each page as soon as it's fetched.
+
+        Progress is saved to a `.state.json` file next to the export,
+        so an interrupted export resumes from where it stopped when it's run again.
+
+        Parameters:
+            path: The file to export to, or the directory for Parquet exports.
+            format: The format to export to, either `jsonl` or `parquet`.
+            incremental: Whether to only export predictions created since the last completed export to `path`, appending them to it. Otherwise, `path` is overwritten.
+        Returns:
+            int: The number of predictions exported.
+        """
+
+        return await _async_export(
+            self._client,
+            "/v1/predictions",
+            path,
+            columns=list(Prediction.__fields__),
+            format=format,
+            incremental=incremental,
+        )
 
     def get(self, id: str) -> Prediction:
         """
@@ -352,7 +698,7 @@ class Predictions(Namespace):
 
         resp = self._client._request("GET", f"/v1/predictions/{id}")
 
-        return _json_to_prediction(self._client, resp.json())
+        return _json_to_prediction(self._client, self._client._decode_json(resp))
 
     async def async_get(self, id: str) -> Prediction:
         """
@@ -366,7 +712,7 @@ class Predictions(Namespace):
 
         resp = await self._client._async_request("GET", f"/v1/predictions/{id}")
 
-        return _json_to_prediction(self._client, resp.json())
+        return _json_to_prediction(self._client, self._client._decode_json(resp))
 
     class CreatePredictionParams(TypedDict):
         """Parameters for creating a prediction."""
@@ -383,6 +729,13 @@ class Predictions(Namespace):
         stream: NotRequired[bool]
         """Enable streaming of prediction output."""
 
+        idempotency_key: NotRequired[str]
+        """
+        A unique key for this request, so that it can be retried without creating a duplicate prediction.
+
+        A random key is generated if one isn't provided.
+        """
+
     @overload
     def create(
         self,
@@ -426,10 +779,7 @@ class Predictions(Namespace):
             version = args[0] if len(args) > 0 else None
             input = args[1] if len(args) > 1 else input
 
-        if sum(bool(x) for x in [model, version, deployment]) != 1:
-            raise ValueError(
-                "Exactly one of 'model', 'version', or 'deployment' must be specified."
-            )
+        _check_prediction_target(model, version, deployment)
 
         if model is not None:
             from vaikerai.model import (  # pylint: disable=import-outside-toplevel
@@ -453,19 +803,17 @@ class Predictions(Namespace):
                 **params,
             )
 
+        idempotency_key = params.pop("idempotency_key", None)
         body = _create_prediction_body(
+            self._client,
             version,
             input,
             **params,
         )
 
-        resp = self._client._request(
-            "POST",
-            "/v1/predictions",
-            json=body,
-        )
+        obj = self._client._idempotent_post("/v1/predictions", body, idempotency_key)
 
-        return _json_to_prediction(self._client, resp.json())
+        return _json_to_prediction(self._client, obj)
 
     @overload
     async def async_create(
@@ -510,10 +858,7 @@ class Predictions(Namespace):
             version = args[0] if len(args) > 0 else None
             input = args[1] if len(args) > 1 else input
 
-        if sum(bool(x) for x in [model, version, deployment]) != 1:
-            raise ValueError(
-                "Exactly one of 'model', 'version', or 'deployment' must be specified."
-            )
+        _check_prediction_target(model, version, deployment)
 
         if model is not None:
             from vaikerai.model import (  # pylint: disable=import-outside-toplevel
@@ -537,19 +882,165 @@ class Predictions(Namespace):
                 **params,
             )
 
-        body = _create_prediction_body(
+        idempotency_key = params.pop("idempotency_key", None)
+        body = await _async_create_prediction_body(
+            self._client,
             version,
             input,
             **params,
         )
 
-        resp = await self._client._async_request(
-            "POST",
-            "/v1/predictions",
-            json=body,
+        obj = await self._client._async_idempotent_post(
+            "/v1/predictions", body, idempotency_key
+        )
+
+        return _json_to_prediction(self._client, obj)
+
+    def create_many(  # pylint: disable=too-many-arguments
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        model: Optional[Union[str, Tuple[str, str], "Model"]] = None,
+        version: Optional[Union[Version, str]] = None,
+        deployment: Optional[Union[str, Tuple[str, str], "Deployment"]] = None,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Create a prediction for each input with the specified model, version, or deployment.
+
+        Args:
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        _check_prediction_target(model, version, deployment)
+
+        return create_many(
+            lambda input, **kwargs: self.create(
+                model=model,
+                version=version,
+                deployment=deployment,
+                input=input,
+                **kwargs,
+            ),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
+        )
+
+    async def async_create_many(  # pylint: disable=too-many-arguments
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        model: Optional[Union[str, Tuple[str, str], "Model"]] = None,
+        version: Optional[Union[Version, str]] = None,
+        deployment: Optional[Union[str, Tuple[str, str], "Deployment"]] = None,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Create a prediction for each input with the specified model, version, or deployment.
+
+        Args:
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        _check_prediction_target(model, version, deployment)
+
+        return await async_create_many(
+            lambda input, **kwargs: self.async_create(
+                model=model,
+                version=version,
+                deployment=deployment,
+                input=input,
+                **kwargs,
+            ),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
+        )
+
+    def run_many(  # pylint: disable=too-many-arguments
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        model: Optional[Union[str, Tuple[str, str], "Model"]] = None,
+        version: Optional[Union[Version, str]] = None,
+        deployment: Optional[Union[str, Tuple[str, str], "Deployment"]] = None,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Run the specified model, version, or deployment for each input and wait for the outputs.
+
+        Args:
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        _check_prediction_target(model, version, deployment)
+
+        return run_many(
+            self._client,
+            lambda input, **kwargs: self.create(
+                model=model,
+                version=version,
+                deployment=deployment,
+                input=input,
+                **kwargs,
+            ),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
         )
 
-        return _json_to_prediction(self._client, resp.json())
+    async def async_run_many(  # pylint: disable=too-many-arguments
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        model: Optional[Union[str, Tuple[str, str], "Model"]] = None,
+        version: Optional[Union[Version, str]] = None,
+        deployment: Optional[Union[str, Tuple[str, str], "Deployment"]] = None,
+        max_concurrency: int = 8,
+        **params: Unpack["Predictions.CreatePredictionParams"],
+    ) -> List[BatchResult]:
+        """
+        Run the specified model, version, or deployment for each input and wait for the outputs.
+
+        Args:
+            inputs: The inputs to create predictions for.
+            max_concurrency: The maximum number of predictions to create at the same time.
+        Returns:
+            A result for each input, in the same order as the inputs.
+            Errors are reported per result instead of being raised.
+        """
+
+        _check_prediction_target(model, version, deployment)
+
+        return await async_run_many(
+            self._client,
+            lambda input, **kwargs: self.async_create(
+                model=model,
+                version=version,
+                deployment=deployment,
+                input=input,
+                **kwargs,
+            ),
+            inputs,
+            params=params,
+            max_concurrency=max_concurrency,
+        )
 
     def cancel(self, id: str) -> Prediction:
         """
@@ -566,7 +1057,7 @@ class Predictions(Namespace):
             f"/v1/predictions/{id}/cancel",
         )
 
-        return _json_to_prediction(self._client, resp.json())
+        return _json_to_prediction(self._client, self._client._decode_json(resp))
 
     async def async_cancel(self, id: str) -> Prediction:
         """
@@ -583,10 +1074,60 @@ class Predictions(Namespace):
             f"/v1/predictions/{id}/cancel",
         )
 
-        return _json_to_prediction(self._client, resp.json())
+        return _json_to_prediction(self._client, self._client._decode_json(resp))
+
+    def watch(
+        self, predictions: Iterable[Union[Prediction, str]]
+    ) -> Iterator[Prediction]:
+        """
+        Wait for many predictions, yielding each one as soon as it finishes.
+
+        All predictions share a single polling loop,
+        which lists recent predictions instead of fetching each one.
+        If a prediction can't be fetched, the others are still waited for,
+        and its error is raised once they've finished.
+
+        Args:
+            predictions: The predictions, or prediction IDs, to wait for.
+        Returns:
+            An iterator of finished predictions, in the order they finished.
+        """
+
+        return PredictionWaiter(self._client).iter_completed(predictions)
+
+    def async_watch(
+        self, predictions: Iterable[Union[Prediction, str]]
+    ) -> AsyncIterator[Prediction]:
+        """
+        Wait for many predictions asynchronously, yielding each one as soon as it finishes.
+
+        All predictions share a single polling loop,
+        which lists recent predictions instead of fetching each one.
+        If a prediction can't be fetched, the others are still waited for,
+        and its error is raised once they've finished.
+
+        Args:
+            predictions: The predictions, or prediction IDs, to wait for.
+        Returns:
+            An asynchronous iterator of finished predictions, in the order they finished.
+        """
+
+        return PredictionWaiter(self._client).async_iter_completed(predictions)
+
+
+def _check_prediction_target(
+    model: Optional[Union[str, Tuple[str, str], "Model"]],
+    version: Optional[Union[Version, str]],
+    deployment: Optional[Union[str, Tuple[str, str], "Deployment"]],
+) -> None:
+    if sum(bool(x) for x in [model, version, deployment]) != 1:
+        raise ValueError(
+            "Exactly one of 'model', 'version', or 'deployment' must be specified."
+        )
 
 
 def _create_prediction_body(  # pylint: disable=too-many-arguments
+    client: "Client",
     version: Optional[Union[Version, str]],
     input: Optional[Dict[str, Any]],
     webhook: Optional[str] = None,
@@ -597,7 +1138,11 @@ def _create_prediction_body(  # pylint: disable=too-many-arguments
     body = {}
 
     if input is not None:
-        body["input"] = encode_json(input, upload_file=upload_file)
+        body["input"] = encode_json(
+            input,
+            upload_file=client.files.encode,
+            array_encoding=client.array_encoding,
+        )
 
     if version is not None:
         body["version"] = version.id if isinstance(version, Version) else version
@@ -617,6 +1162,24 @@ def _create_prediction_body(  # pylint: disable=too-many-arguments
     return body
 
 
+async def _async_create_prediction_body(
+    client: "Client",
+    version: Optional[Union[Version, str]],
+    input: Optional[Dict[str, Any]],
+    **params: Any,  # noqa: ANN401
+) -> Dict[str, Any]:
+    body = _create_prediction_body(client, version, None, **params)
+
+    if input is not None:
+        body["input"] = await async_encode_json(
+            input,
+            upload_file=client.files.async_encode,
+            array_encoding=client.array_encoding,
+        )
+
+    return body
+
+
 def _json_to_prediction(client: "Client", json: Dict[str, Any]) -> Prediction:
     prediction = Prediction(**json)
     prediction._client = client
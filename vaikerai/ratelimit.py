@@ -0,0 +1,206 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Mapping, Optional, Union
+
+import httpx
+
+DEFAULT_RATES = {
+    "create": 10.0,
+    "get": 50.0,
+    "list": 50.0,
+    "other": 50.0,
+}
+"""The default number of requests per second admitted for each endpoint class."""
+
+_LIST_PATHS = frozenset(
+    [
+        "/v1/collections",
+        "/v1/deployments",
+        "/v1/hardware",
+        "/v1/models",
+        "/v1/predictions",
+        "/v1/trainings",
+    ]
+)
+
+
+def parse_retry_after(
+    headers: Union[httpx.Headers, Mapping[str, str]],
+) -> Optional[float]:
+    """
+    Return the number of seconds to wait according to a `Retry-After` header, if any.
+    """
+
+    retry_after_header = (headers.get("Retry-After") or "").strip()
+    if not retry_after_header:
+        return None
+
+    if retry_after_header.isdigit():
+        return float(retry_after_header)
+
+    try:
+        parsed_date = datetime.fromisoformat(retry_after_header).astimezone()
+    except ValueError:
+        return None
+
+    diff = (parsed_date - datetime.now().astimezone()).total_seconds()
+    return diff if diff > 0 else None
+
+
+def endpoint_class(request: httpx.Request) -> str:
+    """
+    Classify a request as a `create`, `get`, `list`, or `other` request.
+    """
+
+    path = request.url.path.rstrip("/")
+
+    if request.method == "POST":
+        return "other" if path.endswith("/cancel") else "create"
+
+    if request.method in ("GET", "QUERY"):
+        if path in _LIST_PATHS or path.endswith("/versions"):
+            return "list"
+        if "cursor" in request.url.params:
+            return "list"
+        return "get"
+
+    return "other"
+
+
+class _Bucket:
+    """
+    A token bucket implemented with the generic cell rate algorithm,
+    so that a single timestamp tracks when the next request may start.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.max_rate = rate
+        self.ceiling: Optional[float] = None
+        self.burst = burst
+        self.theoretical_arrival = 0.0
+        self.paused_until = 0.0
+        self.decreased_at = 0.0
+
+    def reserve(self, now: float) -> float:
+        interval = 1.0 / self.rate
+        tolerance = interval * max(self.burst - 1, 0)
+
+        start = max(now, self.theoretical_arrival - tolerance, self.paused_until)
+        self.theoretical_arrival = max(self.theoretical_arrival, start) + interval
+        return start - now
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter that admits requests against a token bucket per endpoint class.
+
+    The rate of each bucket adapts to the responses it observes.
+    A 429 response halves the rate (at most once per cooldown period),
+    remembers the rate that triggered it as a ceiling,
+    and pauses the bucket for as long as the `Retry-After` header asks.
+    Successful responses increase the rate additively,
+    quickly up to 90% of the ceiling and slowly beyond it,
+    so that throughput settles just under the server's limit
+    instead of oscillating around it.
+
+    The same limiter can be shared between threads and event loops.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        *,
+        burst: float = 5.0,
+        min_rate: float = 0.5,
+        decrease_factor: float = 0.5,
+        increase: float = 1.0,
+        cooldown: float = 1.0,
+    ) -> None:
+        if not 0 < decrease_factor < 1:
+            raise ValueError(
+                f"decrease factor should be between 0 and 1, actual {decrease_factor}"
+            )
+
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.increase = increase
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._buckets = {
+            name: _Bucket(rate, burst)
+            for name, rate in {**DEFAULT_RATES, **(rates or {})}.items()
+        }
+
+    def rate(self, name: str) -> float:
+        """
+        Return the current number of requests per second admitted for an endpoint class.
+        """
+
+        return self._buckets[name].rate
+
+    def reserve(self, request: httpx.Request) -> float:
+        """
+        Reserve a slot for a request and return the number of seconds to wait before sending it.
+        """
+
+        bucket = self._buckets.get(endpoint_class(request))
+        if bucket is None:
+            return 0.0
+
+        with self._lock:
+            return bucket.reserve(time.monotonic())
+
+    def acquire(self, request: httpx.Request) -> None:
+        """
+        Wait until a request may be sent.
+        """
+
+        delay = self.reserve(request)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self, request: httpx.Request) -> None:
+        """
+        Wait until a request may be sent, asynchronously.
+        """
+
+        delay = self.reserve(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def observe(self, request: httpx.Request, response: httpx.Response) -> None:
+        """
+        Adapt the rate for a request's endpoint class to its response.
+        """
+
+        bucket = self._buckets.get(endpoint_class(request))
+        if bucket is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+
+            if response.status_code == 429:
+                retry_after = parse_retry_after(response.headers)
+                if retry_after is not None:
+                    bucket.paused_until = max(bucket.paused_until, now + retry_after)
+                    bucket.theoretical_arrival = max(
+                        bucket.theoretical_arrival, bucket.paused_until
+                    )
+
+                if now - bucket.decreased_at >= max(self.cooldown, retry_after or 0):
+                    bucket.ceiling = bucket.rate
+                    bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+                    bucket.decreased_at = now
+            elif response.status_code < 400:
+                step = self.increase / bucket.rate
+                if bucket.ceiling is not None and bucket.rate >= 0.9 * bucket.ceiling:
+                    step *= 0.1
+                bucket.rate = min(bucket.max_rate, bucket.rate + step)
+
+
+__all__ = ["RateLimiter"]
@@ -0,0 +1,323 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from vaikerai.codec import JSONCodec, StdlibJSONCodec
+from vaikerai.polling import TERMINAL_STATUSES
+from vaikerai.prediction import _json_to_prediction
+from vaikerai.replay import ReplayStore
+from vaikerai.webhook import (
+    DuplicateWebhookError,
+    WebhookSigningSecret,
+    WebhookValidationError,
+    WebhookVerifier,
+)
+
+if TYPE_CHECKING:
+    from vaikerai.prediction import Prediction
+
+_STDLIB_CODEC = StdlibJSONCodec()
+
+DEFAULT_TIMEOUT = 600.0
+"""The default number of seconds to wait for a webhook before falling back to polling."""
+
+
+class WebhookReceiver:
+    """
+    Receives prediction webhooks and resolves the predictions waiting on them in-process.
+
+    The receiver can be mounted in an existing web application with `asgi` or `wsgi`,
+    or serve requests itself with `listen`.
+    Each request is verified with a `WebhookVerifier`,
+    and a completed prediction resolves everything waiting on it,
+    so that `run(..., completion="webhook")` finishes without polling.
+    Webhooks that arrive before anything waits on them are remembered for a while,
+    so predictions that finish quickly aren't missed.
+    If a `replay_store` is given, redelivered webhooks are acknowledged without being handled again.
+    """
+
+    url: str
+    """The URL that VaikerAI sends webhooks to, which must reach this receiver."""
+
+    verifier: WebhookVerifier
+    """The verifier that checks the signature of each webhook."""
+
+    timeout: float
+    """The number of seconds to wait for a webhook before falling back to polling."""
+
+    json_codec: Optional[JSONCodec]
+    """
+    The codec that decodes webhook bodies.
+    Defaults to the codec of the client the receiver is given to,
+    or the standard library's `json` module.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        url: str,
+        secret: Union[WebhookSigningSecret, Iterable[WebhookSigningSecret]],
+        *,
+        tolerance: Optional[int] = 300,
+        timeout: float = DEFAULT_TIMEOUT,
+        maxsize: int = 1024,
+        replay_store: Optional[ReplayStore] = None,
+        json_codec: Optional[JSONCodec] = None,
+    ) -> None:
+        self.url = url
+        self.verifier = WebhookVerifier(
+            secret, tolerance=tolerance, replay_store=replay_store
+        )
+        self.timeout = timeout
+        self.json_codec = json_codec
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._waiting: Dict[str, List["Future[Dict[str, Any]]"]] = {}
+        self._completed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def expect(self, prediction_id: str) -> "Future[Dict[str, Any]]":
+        """
+        Return a future that resolves to a prediction's JSON representation
+        once a webhook for its completion is received.
+        """
+
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._lock:
+            obj = self._completed.pop(prediction_id, None)
+            if obj is None:
+                self._waiting.setdefault(prediction_id, []).append(future)
+                return future
+
+        future.set_result(obj)
+        return future
+
+    def discard(self, prediction_id: str, future: "Future[Dict[str, Any]]") -> None:
+        """
+        Stop waiting on a future returned by `expect`.
+        """
+
+        with self._lock:
+            futures = self._waiting.get(prediction_id, [])
+            if future in futures:
+                futures.remove(future)
+            if not futures:
+                self._waiting.pop(prediction_id, None)
+        future.cancel()
+
+    def wait(self, prediction: "Prediction", timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a webhook for a prediction's completion, and update the prediction from it.
+
+        Args:
+            prediction: The prediction to wait for.
+            timeout: The number of seconds to wait. Defaults to `timeout`.
+        Returns:
+            Whether a webhook was received before the timeout.
+        """
+
+        future = self.expect(prediction.id)
+        try:
+            obj = future.result(timeout=self.timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            self.discard(prediction.id, future)
+            return False
+
+        _update(prediction, obj)
+        return True
+
+    async def async_wait(
+        self, prediction: "Prediction", timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Wait for a webhook for a prediction's completion asynchronously,
+        and update the prediction from it.
+
+        Args:
+            prediction: The prediction to wait for.
+            timeout: The number of seconds to wait. Defaults to `timeout`.
+        Returns:
+            Whether a webhook was received before the timeout.
+        """
+
+        future = self.expect(prediction.id)
+        try:
+            obj = await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                self.timeout if timeout is None else timeout,
+            )
+        except asyncio.TimeoutError:
+            self.discard(prediction.id, future)
+            return False
+
+        _update(prediction, obj)
+        return True
+
+    def handle(self, headers: Mapping[str, str], body: bytes) -> HTTPStatus:
+        """
+        Handle a webhook request, and return the HTTP status code to respond with.
+        """
+
+        try:
+            self.verifier.verify(headers, body)
+        except DuplicateWebhookError:
+            # Acknowledge the redelivery, so that it isn't retried again
+            return HTTPStatus.NO_CONTENT
+        except WebhookValidationError:
+            return HTTPStatus.BAD_REQUEST
+
+        codec = self.json_codec or _STDLIB_CODEC
+        try:
+            obj = codec.loads(body)
+        except Exception:  # noqa: BLE001
+            # Each codec raises its own error for invalid JSON
+            return HTTPStatus.BAD_REQUEST
+
+        if not isinstance(obj, dict) or not isinstance(obj.get("id"), str):
+            return HTTPStatus.BAD_REQUEST
+
+        if obj.get("status") in TERMINAL_STATUSES:
+            self._resolve(obj)
+
+        return HTTPStatus.NO_CONTENT
+
+    async def asgi(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """
+        An ASGI application that handles webhook requests.
+        """
+
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            status = HTTPStatus.METHOD_NOT_ALLOWED
+        else:
+            chunks = []
+            while True:
+                message = await receive()
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    break
+
+            headers = {
+                name.decode("latin-1"): value.decode("latin-1")
+                for name, value in scope["headers"]
+            }
+            status = self.handle(headers, b"".join(chunks))
+
+        await send(
+            {"type": "http.response.start", "status": int(status), "headers": []}
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    def wsgi(
+        self,
+        environ: Dict[str, Any],
+        start_response: Callable[[str, List[Tuple[str, str]]], Any],
+    ) -> Iterable[bytes]:
+        """
+        A WSGI application that handles webhook requests.
+        """
+
+        if environ["REQUEST_METHOD"] != "POST":
+            status = HTTPStatus.METHOD_NOT_ALLOWED
+        else:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            headers = {
+                name[5:].replace("_", "-").lower(): value
+                for name, value in environ.items()
+                if name.startswith("HTTP_")
+            }
+            status = self.handle(headers, environ["wsgi.input"].read(length))
+
+        start_response(f"{status.value} {status.phrase}", [])
+        return [b""]
+
+    def listen(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """
+        Serve webhook requests on a background thread.
+
+        Args:
+            host: The host to listen on.
+            port: The port to listen on. Defaults to any free port.
+        Returns:
+            The host and port the receiver is listening on.
+        """
+
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                status = receiver.handle(
+                    {name: value for name, value in self.headers.items()},
+                    self.rfile.read(length),
+                )
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="vaikerai-webhooks", daemon=True
+        ).start()
+
+        address = self._server.server_address
+        return str(address[0]), int(address[1])
+
+    def close(self) -> None:
+        """
+        Stop serving webhook requests started with `listen`.
+        """
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def _resolve(self, obj: Dict[str, Any]) -> None:
+        with self._lock:
+            futures = self._waiting.pop(obj["id"], None)
+            if futures is None:
+                self._completed[obj["id"]] = obj
+                while len(self._completed) > self._maxsize:
+                    self._completed.popitem(last=False)
+                return
+
+        for future in futures:
+            if not future.done():
+                future.set_result(obj)
+
+
+def _update(prediction: "Prediction", obj: Dict[str, Any]) -> None:
+    updated = _json_to_prediction(prediction._client, obj)
+    for name, value in updated.dict().items():
+        setattr(prediction, name, value)
+
+
+__all__ = ["WebhookReceiver"]
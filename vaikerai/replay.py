@@ -0,0 +1,116 @@
+import abc
+import heapq
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class ReplayStore(abc.ABC):
+    """
+    A base class for remembering the IDs of webhooks that have already been received,
+    so that retried or replayed deliveries can be detected.
+
+    Each ID only needs to be remembered until the webhook's timestamp falls outside
+    the verifier's tolerance, after which the timestamp check rejects it anyway.
+    Implement this class to share a store between several receiver processes,
+    for example with Redis's `SET key 1 NX EXAT expires_at`, and `DEL key` to discard an ID.
+    """
+
+    @abc.abstractmethod
+    def add(self, webhook_id: str, expires_at: float) -> bool:
+        """
+        Remember a webhook ID until `expires_at`, unless it's already remembered.
+
+        The check and the insert must be atomic,
+        so that concurrent deliveries of the same webhook are only accepted once.
+
+        Args:
+            webhook_id: The value of the webhook's `webhook-id` header.
+            expires_at: The Unix time after which the ID can be forgotten.
+        Returns:
+            Whether the ID is new, rather than already remembered.
+        """
+
+    @abc.abstractmethod
+    def discard(self, webhook_id: str) -> None:
+        """
+        Forget a webhook ID, so that a redelivery of the webhook is accepted again.
+
+        Call this when handling a webhook fails after it was verified,
+        so that the sender's retry isn't rejected as a duplicate.
+
+        Args:
+            webhook_id: The value of the webhook's `webhook-id` header.
+        """
+
+
+class MemoryReplayStore(ReplayStore):
+    """
+    A thread-safe, in-process store of webhook IDs.
+
+    IDs are spread across `shards`, each with its own lock,
+    so concurrent requests rarely wait on each other.
+    Expired IDs are evicted in order of expiry as new ones are added,
+    so memory is bounded by the number of webhooks received within the tolerance window.
+    If `maxsize` is set, the IDs closest to expiring are also evicted
+    once the store holds more than that many,
+    which bounds memory under a flood at the cost of weaker protection.
+    """
+
+    maxsize: Optional[int]
+    """The maximum number of IDs to keep, if any."""
+
+    def __init__(self, shards: int = 16, maxsize: Optional[int] = None) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+
+        self.maxsize = maxsize
+        self._shards = [_Shard() for _ in range(shards)]
+        self._shard_maxsize = -(-maxsize // shards) if maxsize is not None else None
+
+    def add(self, webhook_id: str, expires_at: float) -> bool:
+        shard = self._shards[hash(webhook_id) % len(self._shards)]
+        now = time.time()
+
+        with shard.lock:
+            shard.evict(now)
+            if webhook_id in shard.entries:
+                return False
+
+            shard.entries[webhook_id] = expires_at
+            heapq.heappush(shard.expiries, (expires_at, webhook_id))
+            if self._shard_maxsize is not None:
+                while len(shard.entries) > self._shard_maxsize:
+                    shard.pop()
+            return True
+
+    def discard(self, webhook_id: str) -> None:
+        shard = self._shards[hash(webhook_id) % len(self._shards)]
+
+        with shard.lock:
+            # Its expiry is left in the heap, and skipped when it's popped
+            shard.entries.pop(webhook_id, None)
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+
+class _Shard:
+    __slots__ = ("lock", "entries", "expiries")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: Dict[str, float] = {}
+        self.expiries: List[Tuple[float, str]] = []
+
+    def evict(self, now: float) -> None:
+        while self.expiries and self.expiries[0][0] <= now:
+            self.pop()
+
+    def pop(self) -> None:
+        expires_at, webhook_id = heapq.heappop(self.expiries)
+        if self.entries.get(webhook_id) == expires_at:
+            del self.entries[webhook_id]
+
+
+__all__ = ["ReplayStore", "MemoryReplayStore"]
@@ -1,5 +1,5 @@
 import abc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Iterator, Type, TypeVar
 
 try:
     from pydantic import v1 as pydantic  # type: ignore
@@ -16,6 +16,95 @@ class Resource(pydantic.BaseModel):  # type: ignore
     """
 
 
+R = TypeVar("R", bound=Resource)
+
+
+class ResourceView(Generic[R]):
+    """
+    A lightweight, read-only view of an object on the server.
+
+    Fields are read from the JSON returned by the API
+    and validated one at a time, the first time they're accessed.
+    Call `to_resource()` to get the full, validated resource.
+    """
+
+    __slots__ = ("_data", "_values", "_resource_type", "_factory")
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        resource_type: Type[R],
+        factory: Callable[[Dict[str, Any]], R],
+    ) -> None:
+        self._data = data
+        self._values: Dict[str, Any] = {}
+        self._resource_type = resource_type
+        self._factory = factory
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        # Private names are never fields, and the slots aren't set yet
+        # while an instance is being copied or unpickled
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        field = self._resource_type.__fields__.get(name)
+        if field is None:
+            raise AttributeError(
+                f"{self._resource_type.__name__} has no field {name!r}. "
+                "Call `to_resource()` to get the full object."
+            )
+
+        if name in self._data:
+            value, errors = field.validate(
+                self._data[name], {}, loc=name, cls=self._resource_type
+            )
+            if errors:
+                raise pydantic.ValidationError([errors], self._resource_type)
+        elif field.required:
+            raise AttributeError(f"{self._resource_type.__name__} has no {name!r}")
+        else:
+            value = field.get_default()
+
+        self._values[name] = value
+        return value
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], "ResourceView"]]:
+        # Allow views in pydantic models, such as `Page`, without validating them again
+        yield cls._validate
+
+    @classmethod
+    def _validate(cls, value: Any) -> "ResourceView":  # noqa: ANN401
+        if not isinstance(value, ResourceView):
+            raise TypeError(f"expected a ResourceView, got {type(value).__name__}")
+        return value
+
+    def __repr__(self) -> str:
+        name = self._data.get("id")
+        if name is None and "owner" in self._data:
+            name = f"{self._data['owner']}/{self._data.get('name')}"
+        return f"<{self._resource_type.__name__}View: {name}>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the JSON returned by the API for this object.
+        """
+
+        return self._data
+
+    def to_resource(self) -> R:
+        """
+        Return the full, validated resource.
+        """
+
+        return self._factory(self._data)
+
+
 class Namespace(abc.ABC):
     """
     A base class for representing objects of a particular type on the server.
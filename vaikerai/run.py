@@ -5,6 +5,7 @@ from typing import (
     Dict,
     Iterator,
     List,
+    Literal,
     Optional,
     Union,
 )
@@ -12,9 +13,9 @@ from typing import (
 from typing_extensions import Unpack
 
 from vaikerai import identifier
+from vaikerai.cache import CachedVersion
 from vaikerai.exceptions import ModelError
 from vaikerai.model import Model
-from vaikerai.prediction import Prediction
 from vaikerai.schema import make_schema_backwards_compatible
 from vaikerai.version import Version, Versions
 
@@ -22,44 +23,76 @@ if TYPE_CHECKING:
     from vaikerai.client import Client
     from vaikerai.identifier import ModelVersionIdentifier
     from vaikerai.prediction import Predictions
+    from vaikerai.receiver import WebhookReceiver
+
+
+Completion = Literal["poll", "webhook"]
+"""
+How to find out that a prediction has completed.
+
+- `poll`: Reload the prediction until it completes.
+- `webhook`: Wait for the client's webhook receiver to be notified,
+  and reload the prediction only if that takes longer than the receiver's timeout.
+"""
 
 
 def run(
     client: "Client",
     ref: Union["Model", "Version", "ModelVersionIdentifier", str],
     input: Optional[Dict[str, Any]] = None,
+    *,
+    completion: Completion = "poll",
     **params: Unpack["Predictions.CreatePredictionParams"],
 ) -> Union[Any, Iterator[Any]]:  # noqa: ANN401
     """
     Run a model and wait for its output.
     """
 
+    receiver = _webhook_receiver(client, completion)
     version, owner, name, version_id = identifier._resolve(ref)
 
+    if not (version_id is not None or (owner and name)):
+        raise ValueError(
+            f"Invalid argument: {ref}. Expected model, version, or reference in the format owner/name or owner/name:version"
+        )
+
+    has_output_iterator = False
+    if version:
+        has_output_iterator = _has_output_iterator_array_type(version)
+    elif owner and name and version_id:
+        cached = client.version_cache.get(owner, name, version_id)
+        if cached is None:
+            version = Versions(client, model=(owner, name)).get(version_id)
+            cached = _cache_version(client, owner, name, version)
+        has_output_iterator = cached.has_output_iterator
+
+    if receiver is not None:
+        _add_webhook_params(receiver, params)
+    elif has_output_iterator:
+        # Stream the output as it's produced, instead of polling for it
+        params.setdefault("stream", True)
+
     if version_id is not None:
         prediction = client.predictions.create(
             version=version_id, input=input or {}, **params
         )
-    elif owner and name:
+    else:
         prediction = client.models.predictions.create(
             model=(owner, name), input=input or {}, **params
         )
-    else:
-        raise ValueError(
-            f"Invalid argument: {ref}. Expected model, version, or reference in the format owner/name or owner/name:version"
-        )
-
-    if not version and (owner and name and version_id):
-        version = Versions(client, model=(owner, name)).get(version_id)
 
-    if version and (iterator := _make_output_iterator(version, prediction)):
-        return iterator
+    if has_output_iterator and receiver is None:
+        return prediction._stream_output_iterator()
 
-    prediction.wait()
+    if receiver is None or not receiver.wait(prediction):
+        prediction.wait()
 
     if prediction.status == "failed":
         raise ModelError(prediction)
 
+    if has_output_iterator:
+        return iter(prediction.output or [])
+
     return prediction.output
 
 
@@ -67,41 +100,101 @@ async def async_run(
     client: "Client",
     ref: Union["Model", "Version", "ModelVersionIdentifier", str],
     input: Optional[Dict[str, Any]] = None,
+    *,
+    completion: Completion = "poll",
     **params: Unpack["Predictions.CreatePredictionParams"],
 ) -> Union[Any, AsyncIterator[Any]]:  # noqa: ANN401
     """
     Run a model and wait for its output asynchronously.
     """
 
+    receiver = _webhook_receiver(client, completion)
     version, owner, name, version_id = identifier._resolve(ref)
 
+    if not (version or version_id or (owner and name)):
+        raise ValueError(
+            f"Invalid argument: {ref}. Expected model, version, or reference in the format owner/name or owner/name:version"
+        )
+
+    has_output_iterator = False
+    if version:
+        has_output_iterator = _has_output_iterator_array_type(version)
+    elif owner and name and version_id:
+        cached = client.version_cache.get(owner, name, version_id)
+        if cached is None:
+            fetched = await Versions(client, model=(owner, name)).async_get(version_id)
+            cached = _cache_version(client, owner, name, fetched)
+        has_output_iterator = cached.has_output_iterator
+
+    if receiver is not None:
+        _add_webhook_params(receiver, params)
+    elif has_output_iterator:
+        # Stream the output as it's produced, instead of polling for it
+        params.setdefault("stream", True)
+
     if version or version_id:
         prediction = await client.predictions.async_create(
             version=(version or version_id), input=input or {}, **params
         )
-    elif owner and name:
+    else:
         prediction = await client.models.predictions.async_create(
             model=(owner, name), input=input or {}, **params
         )
-    else:
-        raise ValueError(
-            f"Invalid argument: {ref}. Expected model, version, or reference in the format owner/name or owner/name:version"
-        )
-
-    if not version and (owner and name and version_id):
-        version = await Versions(client, model=(owner, name)).async_get(version_id)
 
-    if version and (iterator := _make_async_output_iterator(version, prediction)):
-        return iterator
+    if has_output_iterator and receiver is None:
+        return prediction._async_stream_output_iterator()
 
-    await prediction.async_wait()
+    if receiver is None or not await receiver.async_wait(prediction):
+        await prediction.async_wait()
 
     if prediction.status == "failed":
         raise ModelError(prediction)
 
+    if has_output_iterator:
+        return _async_iter(prediction.output or [])
+
     return prediction.output
 
 
+def _webhook_receiver(
+    client: "Client", completion: Completion
+) -> Optional["WebhookReceiver"]:
+    if completion == "poll":
+        return None
+
+    if completion != "webhook":
+        raise ValueError(f"Invalid completion: {completion!r}")
+
+    if client.webhook_receiver is None:
+        raise ValueError(
+            'completion="webhook" requires a client with a `webhook_receiver`'
+        )
+
+    return client.webhook_receiver
+
+
+def _add_webhook_params(receiver: "WebhookReceiver", params: Dict[str, Any]) -> None:
+    webhook = params.get("webhook")
+    if webhook is not None and webhook != receiver.url:
+        raise ValueError(
+            f'completion="webhook" sends webhooks to {receiver.url!r}, '
+            f"but webhook={webhook!r} was given"
+        )
+    params["webhook"] = receiver.url
+
+    # The receiver only resolves predictions when it's told they've completed
+    events = params.get("webhook_events_filter")
+    if events is None:
+        params["webhook_events_filter"] = ["completed"]
+    elif "completed" not in events:
+        params["webhook_events_filter"] = [*events, "completed"]
+
+
+async def _async_iter(items: List[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
 def _has_output_iterator_array_type(version: Version) -> bool:
     schema = make_schema_backwards_compatible(
         version.openapi_schema, version.cog_version
@@ -112,22 +205,12 @@ def _has_output_iterator_array_type(version: Version) -> bool:
     )
 
 
-def _make_output_iterator(
-    version: Version, prediction: Prediction
-) -> Optional[Iterator[Any]]:
-    if _has_output_iterator_array_type(version):
-        return prediction.output_iterator()
-
-    return None
-
-
-def _make_async_output_iterator(
-    version: Version, prediction: Prediction
-) -> Optional[AsyncIterator[Any]]:
-    if _has_output_iterator_array_type(version):
-        return prediction.async_output_iterator()
-
-    return None
+def _cache_version(
+    client: "Client", owner: str, name: str, version: Version
+) -> CachedVersion:
+    cached = CachedVersion(version, _has_output_iterator_array_type(version))
+    client.version_cache.put(owner, name, version.id, cached)
+    return cached
 
 
 __all__: List = []
@@ -1,15 +1,21 @@
+import asyncio
+import time
+from collections import deque
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
+    Deque,
     Dict,
     Iterator,
     List,
     Optional,
+    Set,
     Union,
 )
 
+import httpx
 from typing_extensions import Unpack
 
 from vaikerai import identifier
@@ -22,8 +28,6 @@ except ImportError:
 
 
 if TYPE_CHECKING:
-    import httpx
-
     from vaikerai.client import Client
     from vaikerai.identifier import ModelVersionIdentifier
     from vaikerai.model import Model
@@ -58,15 +62,76 @@ class ServerSentEvent(pydantic.BaseModel):  # type: ignore
         return ""
 
 
+_EVENT_TYPES = {
+    event_type.value.encode("ascii"): event_type
+    for event_type in ServerSentEvent.EventType
+}
+
+
+class LightweightServerSentEvent:
+    """
+    A server-sent event, without validation.
+
+    This has the same attributes as `ServerSentEvent`,
+    but is much cheaper to create for every token of a stream.
+    """
+
+    __slots__ = ("event", "data", "id", "retry")
+
+    event: ServerSentEvent.EventType
+    data: str
+    id: str
+    retry: Optional[int]
+
+    def __init__(
+        self,
+        event: ServerSentEvent.EventType,
+        data: str,
+        id: str,
+        retry: Optional[int] = None,
+    ) -> None:
+        self.event = event
+        self.data = data
+        self.id = id
+        self.retry = retry
+
+    def __str__(self) -> str:
+        if self.event is ServerSentEvent.EventType.OUTPUT:
+            return self.data
+
+        return ""
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(event={self.event!r}, data={self.data!r}, "
+            f"id={self.id!r}, retry={self.retry!r})"
+        )
+
+    def to_model(self) -> ServerSentEvent:
+        """
+        Return a validated `ServerSentEvent` for this event.
+        """
+
+        return ServerSentEvent(
+            event=self.event, data=self.data, id=self.id, retry=self.retry
+        )
+
+
 class EventSource:
     """
     A server-sent event source.
+
+    By default, events are decoded directly from the response bytes
+    into `LightweightServerSentEvent` objects.
+    Pass `validate=True` to get validated `ServerSentEvent` models instead.
     """
 
     response: "httpx.Response"
+    validate: bool
 
-    def __init__(self, response: "httpx.Response") -> None:
+    def __init__(self, response: "httpx.Response", *, validate: bool = False) -> None:
         self.response = response
+        self.validate = validate
         content_type, _, _ = response.headers["content-type"].partition(";")
         if content_type != "text/event-stream":
             raise ValueError(
@@ -138,44 +203,269 @@ class EventSource:
 
             return None
 
-    def __iter__(self) -> Iterator[ServerSentEvent]:
-        decoder = EventSource.Decoder()
+    class ByteDecoder:
+        """
+        An incremental decoder for server-sent events that works on raw bytes.
+
+        Lines may end with LF or CRLF, and may be split across chunks.
+        Events with an unknown type are ignored.
+        """
+
+        event: Optional["ServerSentEvent.EventType"]
+        data: List[bytes]
+        last_event_id: Optional[str]
+        retry: Optional[int]
+
+        def __init__(self) -> None:
+            self.event = None
+            self.data = []
+            self.last_event_id = None
+            self.retry = None
+            self._buffer = b""
+
+        def feed(self, chunk: bytes) -> List[LightweightServerSentEvent]:
+            """
+            Decode a chunk of bytes and return the events it completes.
+            """
+
+            lines = (self._buffer + chunk if self._buffer else chunk).split(b"\n")
+            self._buffer = lines.pop()
 
-        for line in self.response.iter_lines():
-            line = line.rstrip("\n")
-            sse = decoder.decode(line)
-            if sse is not None:
-                if sse.event == ServerSentEvent.EventType.ERROR:
+            events = []
+            event, data, last_event_id, retry = (
+                self.event,
+                self.data,
+                self.last_event_id,
+                self.retry,
+            )
+
+            for line in lines:
+                if line[-1:] == b"\r":
+                    line = line[:-1]
+
+                if not line:
+                    if event is not None and last_event_id is not None:
+                        events.append(
+                            LightweightServerSentEvent(
+                                event,
+                                b"\n".join(data).decode("utf-8"),
+                                last_event_id,
+                                retry,
+                            )
+                        )
+                    event, data, retry = None, [], None
+                    continue
+
+                fieldname, _, value = line.partition(b":")
+                if value[:1] == b" ":
+                    value = value[1:]
+
+                if fieldname == b"data":
+                    data.append(value)
+                elif fieldname == b"event":
+                    event = _EVENT_TYPES.get(value)
+                elif fieldname == b"id":
+                    if b"\0" not in value:
+                        last_event_id = value.decode("utf-8")
+                elif fieldname == b"retry":
+                    try:
+                        retry = int(value)
+                    except ValueError:
+                        pass
+
+            self.event, self.data, self.last_event_id, self.retry = (
+                event,
+                data,
+                last_event_id,
+                retry,
+            )
+            return events
+
+    def __iter__(
+        self,
+    ) -> Iterator[Union[ServerSentEvent, LightweightServerSentEvent]]:
+        decoder = EventSource.ByteDecoder()
+
+        for chunk in self.response.iter_bytes():
+            for sse in decoder.feed(chunk):
+                if sse.event is ServerSentEvent.EventType.ERROR:
                     raise RuntimeError(sse.data)
 
-                yield sse
+                yield sse.to_model() if self.validate else sse
 
-                if sse.event == ServerSentEvent.EventType.DONE:
+                if sse.event is ServerSentEvent.EventType.DONE:
                     return
 
-    async def __aiter__(self) -> AsyncIterator[ServerSentEvent]:
-        decoder = EventSource.Decoder()
-        async for line in self.response.aiter_lines():
-            line = line.rstrip("\n")
-            sse = decoder.decode(line)
-            if sse is not None:
-                if sse.event == ServerSentEvent.EventType.ERROR:
+    async def __aiter__(
+        self,
+    ) -> AsyncIterator[Union[ServerSentEvent, LightweightServerSentEvent]]:
+        decoder = EventSource.ByteDecoder()
+
+        async for chunk in self.response.aiter_bytes():
+            for sse in decoder.feed(chunk):
+                if sse.event is ServerSentEvent.EventType.ERROR:
                     raise RuntimeError(sse.data)
 
-                yield sse
+                yield sse.to_model() if self.validate else sse
 
-                if sse.event == ServerSentEvent.EventType.DONE:
+                if sse.event is ServerSentEvent.EventType.DONE:
                     return
 
 
+DEFAULT_RECONNECT_DELAY = 1.0
+"""The number of seconds to wait before reconnecting, unless the server sets `retry`."""
+
+MAX_RECONNECTS = 5
+"""The number of consecutive reconnection attempts made without receiving an event."""
+
+_SEEN_EVENT_IDS = 256
+"""The number of recent event IDs remembered to skip events a server sends again after reconnecting."""
+
+
+class _Reconnection:
+    """
+    The state shared by the connections that make up a single resumable stream.
+    """
+
+    def __init__(self) -> None:
+        self.last_event_id: Optional[str] = None
+        self.delay = DEFAULT_RECONNECT_DELAY
+        self.attempts = 0
+        self.done = False
+        # Servers only replay events after `Last-Event-ID`,
+        # so only the most recent IDs need to be remembered
+        self._seen: Set[str] = set()
+        self._recent: Deque[str] = deque()
+
+    def headers(self) -> Dict[str, str]:
+        headers = {}
+        headers["Accept"] = "text/event-stream"
+        headers["Cache-Control"] = "no-store"
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+        return headers
+
+    def receive(self, sse: Union[ServerSentEvent, LightweightServerSentEvent]) -> bool:
+        """
+        Record an event, and return whether it's new.
+        """
+
+        if sse.retry is not None:
+            self.delay = sse.retry / 1000
+        if sse.event is ServerSentEvent.EventType.DONE:
+            self.done = True
+
+        self.last_event_id = sse.id
+        if sse.id in self._seen:
+            return False
+
+        self._seen.add(sse.id)
+        self._recent.append(sse.id)
+        if len(self._recent) > _SEEN_EVENT_IDS:
+            self._seen.discard(self._recent.popleft())
+
+        self.attempts = 0
+        return True
+
+    def should_reconnect(self, error: Optional[Exception] = None) -> bool:
+        """
+        Return whether to reconnect after a connection ended, with or without an error.
+        """
+
+        if self.done:
+            return False
+
+        self.attempts += 1
+        if self.attempts > MAX_RECONNECTS:
+            if error is not None:
+                raise error
+            raise VaikerAIError("Stream ended before the prediction completed")
+
+        return True
+
+
+def _status_error(response: "httpx.Response") -> VaikerAIError:
+    """
+    Return the error for a response that's worth reconnecting after,
+    like those from an overloaded server or load balancer, and raise it for others.
+    """
+
+    error = VaikerAIError.from_response(response)
+    if response.status_code == 429 or response.status_code >= 500:
+        return error
+    raise error
+
+
+def _stream_events(
+    client: "Client", url: str, *, validate: bool = False
+) -> Iterator[Union[ServerSentEvent, LightweightServerSentEvent]]:
+    reconnection = _Reconnection()
+
+    while True:
+        error: Optional[Exception] = None
+        try:
+            with client._client.stream(
+                "GET", url, headers=reconnection.headers()
+            ) as response:
+                if not response.is_success:
+                    response.read()
+                    error = _status_error(response)
+                else:
+                    for sse in EventSource(response, validate=validate):
+                        if reconnection.receive(sse):
+                            yield sse
+        except httpx.TransportError as exc:
+            error = exc
+
+        if not reconnection.should_reconnect(error):
+            return
+
+        time.sleep(reconnection.delay)
+
+
+async def _async_stream_events(
+    client: "Client", url: str, *, validate: bool = False
+) -> AsyncIterator[Union[ServerSentEvent, LightweightServerSentEvent]]:
+    reconnection = _Reconnection()
+
+    while True:
+        error: Optional[Exception] = None
+        try:
+            async with client._async_client.stream(
+                "GET", url, headers=reconnection.headers()
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    error = _status_error(response)
+                else:
+                    async for sse in EventSource(response, validate=validate):
+                        if reconnection.receive(sse):
+                            yield sse
+        except httpx.TransportError as exc:
+            error = exc
+
+        if not reconnection.should_reconnect(error):
+            return
+
+        await asyncio.sleep(reconnection.delay)
+
+
 def stream(
     client: "Client",
     ref: Union["Model", "Version", "ModelVersionIdentifier", str],
     input: Optional[Dict[str, Any]] = None,
+    *,
+    validate: bool = False,
     **params: Unpack["Predictions.CreatePredictionParams"],
-) -> Iterator[ServerSentEvent]:
+) -> Iterator[Union[ServerSentEvent, LightweightServerSentEvent]]:
     """
     Run a model and stream its output.
+
+    Events are yielded as `LightweightServerSentEvent` objects,
+    or as validated `ServerSentEvent` models if `validate` is true.
+
+    If the connection drops before the prediction completes,
+    the stream reconnects and resumes after the last event it received.
     """
 
     params = params or {}
@@ -200,22 +490,25 @@ def stream(
     if not url or not isinstance(url, str):
         raise VaikerAIError("Model does not support streaming")
 
-    headers = {}
-    headers["Accept"] = "text/event-stream"
-    headers["Cache-Control"] = "no-store"
-
-    with client._client.stream("GET", url, headers=headers) as response:
-        yield from EventSource(response)
+    yield from _stream_events(client, url, validate=validate)
 
 
 async def async_stream(
     client: "Client",
     ref: Union["Model", "Version", "ModelVersionIdentifier", str],
     input: Optional[Dict[str, Any]] = None,
+    *,
+    validate: bool = False,
     **params: Unpack["Predictions.CreatePredictionParams"],
-) -> AsyncIterator[ServerSentEvent]:
+) -> AsyncIterator[Union[ServerSentEvent, LightweightServerSentEvent]]:
     """
     Run a model and stream its output asynchronously.
+
+    Events are yielded as `LightweightServerSentEvent` objects,
+    or as validated `ServerSentEvent` models if `validate` is true.
+
+    If the connection drops before the prediction completes,
+    the stream reconnects and resumes after the last event it received.
     """
 
     params = params or {}
@@ -240,13 +533,8 @@ async def async_stream(
     if not url or not isinstance(url, str):
         raise VaikerAIError("Model does not support streaming")
 
-    headers = {}
-    headers["Accept"] = "text/event-stream"
-    headers["Cache-Control"] = "no-store"
-
-    async with client._async_client.stream("GET", url, headers=headers) as response:
-        async for event in EventSource(response):
-            yield event
+    async for event in _async_stream_events(client, url, validate=validate):
+        yield event
 
 
-__all__ = ["ServerSentEvent"]
+__all__ = ["LightweightServerSentEvent", "ServerSentEvent"]
@@ -1,7 +1,11 @@
+import os
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Callable,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -13,12 +17,18 @@ from typing import (
 
 from typing_extensions import NotRequired, Unpack
 
-from vaikerai.files import upload_file
+from vaikerai.export import ExportFormat, _async_export, _export
 from vaikerai.identifier import ModelVersionIdentifier
-from vaikerai.json import encode_json
+from vaikerai.json import async_encode_json, encode_json
 from vaikerai.model import Model
-from vaikerai.pagination import Page
-from vaikerai.resource import Namespace, Resource
+from vaikerai.pagination import (
+    Page,
+    _async_iter_items,
+    _iter_items,
+    _json_to_page,
+    _lazy_page,
+)
+from vaikerai.resource import Namespace, Resource, ResourceView
 from vaikerai.version import Version
 
 try:
@@ -124,12 +134,34 @@ class Trainings(Namespace):
     Namespace for operations related to trainings.
     """
 
-    def list(self, cursor: Union[str, "ellipsis", None] = ...) -> Page[Training]:  # noqa: F821
+    @overload
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[False] = False,
+    ) -> Page[Training]: ...
+
+    @overload
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[True],
+    ) -> Page[ResourceView[Training]]: ...
+
+    def list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: bool = False,
+    ) -> Union[Page[Training], Page[ResourceView[Training]]]:
         """
         List your trainings.
 
         Parameters:
             cursor: The cursor to use for pagination. Use the value of `Page.next` or `Page.previous`.
+            lazy: Whether to return lightweight views of the results, which validate each field the first time it's accessed.
         Returns:
             Page[Training]: A page of trainings.
         Raises:
@@ -143,22 +175,44 @@ class Trainings(Namespace):
             "GET", "/v1/trainings" if cursor is ... else cursor
         )
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_training(self._client, result) for result in obj["results"]
-        ]
+        obj = self._client._decode_json(resp)
+        if lazy:
+            return _lazy_page(
+                obj, Training, lambda result: _json_to_training(self._client, result)
+            )
+
+        return _json_to_page(
+            obj, Training, lambda result: _json_to_training(self._client, result)
+        )
 
-        return Page[Training](**obj)
+    @overload
+    async def async_list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: Literal[False] = False,
+    ) -> Page[Training]: ...
 
+    @overload
     async def async_list(
         self,
         cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
-    ) -> Page[Training]:
+        *,
+        lazy: Literal[True],
+    ) -> Page[ResourceView[Training]]: ...
+
+    async def async_list(
+        self,
+        cursor: Union[str, "ellipsis", None] = ...,  # noqa: F821
+        *,
+        lazy: bool = False,
+    ) -> Union[Page[Training], Page[ResourceView[Training]]]:
         """
         List your trainings.
 
         Parameters:
             cursor: The cursor to use for pagination. Use the value of `Page.next` or `Page.previous`.
+            lazy: Whether to return lightweight views of the results, which validate each field the first time it's accessed.
         Returns:
             Page[Training]: A page of trainings.
         Raises:
@@ -172,12 +226,115 @@ class Trainings(Namespace):
             "GET", "/v1/trainings" if cursor is ... else cursor
         )
 
-        obj = resp.json()
-        obj["results"] = [
-            _json_to_training(self._client, result) for result in obj["results"]
-        ]
+        obj = self._client._decode_json(resp)
+        if lazy:
+            return _lazy_page(
+                obj, Training, lambda result: _json_to_training(self._client, result)
+            )
+
+        return _json_to_page(
+            obj, Training, lambda result: _json_to_training(self._client, result)
+        )
+
+    def iter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Training], bool]] = None,
+    ) -> Iterator[Training]:
+        """
+        Iterate over all trainings, fetching pages only as they're needed.
 
-        return Page[Training](**obj)
+        Trainings are returned newest first.
+
+        Parameters:
+            limit: The maximum number of trainings to return.
+            until: A predicate that stops iteration at the first training it returns `True` for. That training isn't returned.
+        Returns:
+            Iterator[Training]: An iterator of trainings.
+        """
+
+        return _iter_items(self.list, limit=limit, until=until)
+
+    def aiter_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        until: Optional[Callable[[Training], bool]] = None,
+    ) -> AsyncIterator[Training]:
+        """
+        Asynchronously iterate over all trainings, fetching pages only as they're needed.
+
+        Trainings are returned newest first.
+
+        Parameters:
+            limit: The maximum number of trainings to return.
+            until: A predicate that stops iteration at the first training it returns `True` for. That training isn't returned.
+        Returns:
+            AsyncIterator[Training]: An async iterator of trainings.
+        """
+
+        return _async_iter_items(self.async_list, limit=limit, until=until)
+
+    def export(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        format: ExportFormat = "jsonl",  # pylint: disable=redefined-builtin
+        incremental: bool = False,
+    ) -> int:
+        """
+        Export all trainings to a file, writing each page as soon as it's fetched.
+
+        Progress is saved to a `.state.json` file next to the export,
+        so an interrupted export resumes from where it stopped when it's run again.
+
+        Parameters:
+            path: The file to export to, or the directory for Parquet exports.
+            format: The format to export to, either `jsonl` or `parquet`.
+            incremental: Whether to only export trainings created since the last completed export to `path`, appending them to it. Otherwise, `path` is overwritten.
+        Returns:
+            int: The number of trainings exported.
+        """
+
+        return _export(
+            self._client,
+            "/v1/trainings",
+            path,
+            columns=list(Training.__fields__),
+            format=format,
+            incremental=incremental,
+        )
+
+    async def async_export(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        format: ExportFormat = "jsonl",  # pylint: disable=redefined-builtin
+        incremental: bool = False,
+    ) -> int:
+        """
+        Export all trainings to a file, writing each page as soon as it's fetched.
+
+        Progress is saved to a `.state.json` file next to the export,
+        so an interrupted export resumes from where it stopped when it's run again.
+
+        Parameters:
+            path: The file to export to, or the directory for Parquet exports.
+            format: The format to export to, either `jsonl` or `parquet`.
+            incremental: Whether to only export trainings created since the last completed export to `path`, appending them to it. Otherwise, `path` is overwritten.
+        Returns:
+            int: The number of trainings exported.
+        """
+
+        return await _async_export(
+            self._client,
+            "/v1/trainings",
+            path,
+            columns=list(Training.__fields__),
+            format=format,
+            incremental=incremental,
+        )
 
     def get(self, id: str) -> Training:
         """
@@ -194,7 +351,7 @@ class Trainings(Namespace):
             f"/v1/trainings/{id}",
         )
 
-        return _json_to_training(self._client, resp.json())
+        return _json_to_training(self._client, self._client._decode_json(resp))
 
     async def async_get(self, id: str) -> Training:
         """
@@ -211,7 +368,7 @@ class Trainings(Namespace):
             f"/v1/trainings/{id}",
         )
 
-        return _json_to_training(self._client, resp.json())
+        return _json_to_training(self._client, self._client._decode_json(resp))
 
     class CreateTrainingParams(TypedDict):
         """Parameters for creating a training."""
@@ -220,6 +377,7 @@ class Trainings(Namespace):
         webhook: NotRequired[str]
         webhook_completed: NotRequired[str]
         webhook_events_filter: NotRequired[List[str]]
+        idempotency_key: NotRequired[str]
 
     @overload
     def create(  # pylint: disable=too-many-arguments
@@ -277,14 +435,11 @@ class Trainings(Namespace):
         if not url:
             raise ValueError("model and version or shorthand version must be specified")
 
-        body = _create_training_body(input, **params)
-        resp = self._client._request(
-            "POST",
-            url,
-            json=body,
-        )
+        idempotency_key = params.pop("idempotency_key", None)
+        body = _create_training_body(self._client, input, **params)
+        obj = self._client._idempotent_post(url, body, idempotency_key)
 
-        return _json_to_training(self._client, resp.json())
+        return _json_to_training(self._client, obj)
 
     async def async_create(
         self,
@@ -303,19 +458,17 @@ class Trainings(Namespace):
             webhook: The URL to send a POST request to when the training is completed. Defaults to None.
             webhook_completed: The URL to receive a POST request when the prediction is completed.
             webhook_events_filter: The events to send to the webhook. Defaults to None.
+            idempotency_key: A unique key for this request, so that it can be retried without creating a duplicate training. Generated if not provided.
         Returns:
             The training object.
         """
 
         url = _create_training_url_from_model_and_version(model, version)
-        body = _create_training_body(input, **params)
-        resp = await self._client._async_request(
-            "POST",
-            url,
-            json=body,
-        )
+        idempotency_key = params.pop("idempotency_key", None)
+        body = await _async_create_training_body(self._client, input, **params)
+        obj = await self._client._async_idempotent_post(url, body, idempotency_key)
 
-        return _json_to_training(self._client, resp.json())
+        return _json_to_training(self._client, obj)
 
     def cancel(self, id: str) -> Training:
         """
@@ -332,7 +485,7 @@ class Trainings(Namespace):
             f"/v1/trainings/{id}/cancel",
         )
 
-        return _json_to_training(self._client, resp.json())
+        return _json_to_training(self._client, self._client._decode_json(resp))
 
     async def async_cancel(self, id: str) -> Training:
         """
@@ -349,10 +502,11 @@ class Trainings(Namespace):
             f"/v1/trainings/{id}/cancel",
         )
 
-        return _json_to_training(self._client, resp.json())
+        return _json_to_training(self._client, self._client._decode_json(resp))
 
 
 def _create_training_body(
+    client: "Client",
     input: Optional[Dict[str, Any]] = None,
     *,
     destination: Optional[Union[str, Tuple[str, str], "Model"]] = None,
@@ -363,7 +517,11 @@ def _create_training_body(
     body = {}
 
     if input is not None:
-        body["input"] = encode_json(input, upload_file=upload_file)
+        body["input"] = encode_json(
+            input,
+            upload_file=client.files.encode,
+            array_encoding=client.array_encoding,
+        )
 
     if destination is None:
         raise ValueError(
@@ -387,6 +545,23 @@ def _create_training_body(
     return body
 
 
+async def _async_create_training_body(
+    client: "Client",
+    input: Optional[Dict[str, Any]] = None,
+    **params: Any,  # noqa: ANN401
+) -> Dict[str, Any]:
+    body = _create_training_body(client, None, **params)
+
+    if input is not None:
+        body["input"] = await async_encode_json(
+            input,
+            upload_file=client.files.async_encode,
+            array_encoding=client.array_encoding,
+        )
+
+    return body
+
+
 def _create_training_url_from_shorthand(ref: str) -> str:
     owner, name, version_id = ModelVersionIdentifier.parse(ref)
     return f"/v1/models/{owner}/{name}/versions/{version_id}/trainings"
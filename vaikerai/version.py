@@ -5,7 +5,7 @@ if TYPE_CHECKING:
     from vaikerai.client import Client
     from vaikerai.model import Model
 
-from vaikerai.pagination import Page
+from vaikerai.pagination import Page, _json_to_page
 from vaikerai.resource import Namespace, Resource
 
 
@@ -63,7 +63,7 @@ class Versions(Namespace):
             "GET", f"/v1/models/{self.model[0]}/{self.model[1]}/versions/{id}"
         )
 
-        return _json_to_version(resp.json())
+        return _json_to_version(self._client._decode_json(resp))
 
     async def async_get(self, id: str) -> Version:
         """
@@ -79,7 +79,7 @@ class Versions(Namespace):
             "GET", f"/v1/models/{self.model[0]}/{self.model[1]}/versions/{id}"
         )
 
-        return _json_to_version(resp.json())
+        return _json_to_version(self._client._decode_json(resp))
 
     def list(self) -> Page[Version]:
         """
@@ -92,10 +92,8 @@ class Versions(Namespace):
         resp = self._client._request(
             "GET", f"/v1/models/{self.model[0]}/{self.model[1]}/versions"
         )
-        obj = resp.json()
-        obj["results"] = [_json_to_version(result) for result in obj["results"]]
-
-        return Page[Version](**obj)
+        obj = self._client._decode_json(resp)
+        return _json_to_page(obj, Version, _json_to_version)
 
     async def async_list(self) -> Page[Version]:
         """
@@ -108,10 +106,8 @@ class Versions(Namespace):
         resp = await self._client._async_request(
             "GET", f"/v1/models/{self.model[0]}/{self.model[1]}/versions"
         )
-        obj = resp.json()
-        obj["results"] = [_json_to_version(result) for result in obj["results"]]
-
-        return Page[Version](**obj)
+        obj = self._client._decode_json(resp)
+        return _json_to_page(obj, Version, _json_to_version)
 
     def delete(self, id: str) -> bool:
         """
@@ -0,0 +1,375 @@
+import asyncio
+import time
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from vaikerai.polling import TERMINAL_STATUSES
+
+if TYPE_CHECKING:
+    from vaikerai.client import Client
+    from vaikerai.pagination import Page
+    from vaikerai.prediction import Prediction
+
+
+class PredictionWaiter:
+    """
+    Wait for many predictions to finish using a single polling loop.
+
+    Each round lists recent predictions newest-first, updating every tracked
+    prediction that appears on those pages, until every tracked prediction is found
+    or the pages are older than the oldest one. Only the stragglers that weren't
+    listed are fetched individually, at most `max_fetches` of them per round.
+    Waiting on thousands of predictions that were created together therefore costs
+    one list request per page of them in each round, instead of one request per prediction.
+    A prediction that can't be fetched fails on its own, without affecting the others.
+    """
+
+    max_pages: Optional[int]
+    """
+    The maximum number of pages to list in each polling round.
+    By default, listing stops once it has covered twice as many predictions as are tracked,
+    so that a busy account isn't listed further than it's worth,
+    and the predictions that weren't found are fetched individually instead.
+    """
+
+    max_fetches: int
+    """The maximum number of predictions to fetch individually in each polling round."""
+
+    max_concurrency: int
+    """The maximum number of predictions to fetch individually at the same time."""
+
+    def __init__(
+        self,
+        client: "Client",
+        *,
+        max_pages: Optional[int] = None,
+        max_fetches: int = 32,
+        max_concurrency: int = 8,
+    ) -> None:
+        self._client = client
+        self.max_pages = max_pages
+        self.max_fetches = max_fetches
+        self.max_concurrency = max_concurrency
+        self._rounds = 0
+
+        self._waiting: Dict[
+            str, Tuple[Optional["Prediction"], List["asyncio.Future[Prediction]"]]
+        ] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def iter_completed(
+        self,
+        predictions: Iterable[Union["Prediction", str]],
+        *,
+        errors: Optional[Dict[str, Exception]] = None,
+    ) -> Iterator["Prediction"]:
+        """
+        Yield each prediction as soon as it finishes.
+
+        Args:
+            predictions: The predictions, or prediction IDs, to wait for.
+            errors: If given, the error for each prediction that couldn't be fetched is added to it by ID.
+                Otherwise, the first such error is raised once the other predictions have finished.
+        Returns:
+            An iterator of finished predictions, in the order they finished.
+        """
+
+        tracked = _track(predictions)
+        failed: Dict[str, Exception] = {}
+        schedule = self._client.polling_strategy.schedule(self._client.poll_interval)
+
+        while True:
+            for id, prediction in list(tracked.items()):
+                if prediction is not None and prediction.status in TERMINAL_STATUSES:
+                    del tracked[id]
+                    yield prediction
+
+            if not tracked:
+                break
+
+            time.sleep(schedule.next_interval(_aggregate_status(tracked)))
+            for id, exc in self._poll(tracked).items():
+                del tracked[id]
+                failed[id] = exc
+
+        _report(failed, errors)
+
+    async def async_iter_completed(
+        self,
+        predictions: Iterable[Union["Prediction", str]],
+        *,
+        errors: Optional[Dict[str, Exception]] = None,
+    ) -> AsyncIterator["Prediction"]:
+        """
+        Yield each prediction as soon as it finishes.
+
+        Args:
+            predictions: The predictions, or prediction IDs, to wait for.
+            errors: If given, the error for each prediction that couldn't be fetched is added to it by ID.
+                Otherwise, the first such error is raised once the other predictions have finished.
+        Returns:
+            An asynchronous iterator of finished predictions, in the order they finished.
+        """
+
+        ids = {
+            self.add(prediction): _split(prediction)[0] for prediction in predictions
+        }
+        failed: Dict[str, Exception] = {}
+
+        pending = set(ids)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                exc = future.exception()
+                if exc is None:
+                    yield future.result()
+                else:
+                    failed[ids[future]] = exc  # type: ignore[assignment]
+
+        _report(failed, errors)
+
+    def add(self, prediction: Union["Prediction", str]) -> "asyncio.Future[Prediction]":
+        """
+        Start tracking a prediction.
+
+        Must be called from a running event loop.
+
+        Args:
+            prediction: The prediction, or prediction ID, to wait for.
+        Returns:
+            A future that resolves to the prediction once it has finished.
+        """
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Prediction]" = loop.create_future()
+
+        id, obj = _split(prediction)
+        if obj is not None and obj.status in TERMINAL_STATUSES:
+            future.set_result(obj)
+            return future
+
+        existing, futures = self._waiting.get(id, (None, []))
+        self._waiting[id] = (existing or obj, [*futures, future])
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+        return future
+
+    async def wait(self, prediction: Union["Prediction", str]) -> "Prediction":
+        """
+        Wait for a prediction to finish.
+
+        Args:
+            prediction: The prediction, or prediction ID, to wait for.
+        Returns:
+            The finished prediction.
+        """
+
+        return await self.add(prediction)
+
+    async def _run(self) -> None:
+        schedule = self._client.polling_strategy.schedule(self._client.poll_interval)
+
+        while self._waiting:
+            tracked = {id: prediction for id, (prediction, _) in self._waiting.items()}
+            await asyncio.sleep(schedule.next_interval(_aggregate_status(tracked)))
+
+            try:
+                failed = await self._async_poll(tracked)
+            except Exception as exc:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+                waiting, self._waiting = self._waiting, {}
+                for _, futures in waiting.values():
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(exc)
+                return
+
+            for id, exc in failed.items():
+                _, futures = self._waiting.pop(id, (None, []))
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+
+            for id, prediction in tracked.items():
+                if id not in self._waiting:
+                    continue
+
+                _, futures = self._waiting[id]
+                futures = [future for future in futures if not future.done()]
+                if not futures:
+                    del self._waiting[id]
+                elif prediction is not None and prediction.status in TERMINAL_STATUSES:
+                    del self._waiting[id]
+                    for future in futures:
+                        future.set_result(prediction)
+                else:
+                    self._waiting[id] = (prediction, futures)
+
+    def _poll(self, tracked: Dict[str, Optional["Prediction"]]) -> Dict[str, Exception]:
+        """
+        Update tracked predictions, and return the errors for those that couldn't be fetched.
+        """
+
+        remaining = set(tracked)
+
+        if len(remaining) > 1:
+            cursor: Union[str, "ellipsis"] = ...  # noqa: F821
+            pages = listed = 0
+            while self._keep_listing(pages, listed, len(tracked)):
+                page = self._client.predictions.list(cursor)
+                pages += 1
+                listed += len(page.results)
+                if not _apply_page(page, tracked, remaining) or page.next is None:
+                    break
+                cursor = page.next
+
+        failed: Dict[str, Exception] = {}
+        for id in self._stragglers(remaining):
+            try:
+                updated = self._client.predictions.get(id)
+            except Exception as exc:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+                failed[id] = exc
+            else:
+                tracked[id] = _merge(tracked[id], updated)
+
+        return failed
+
+    async def _async_poll(
+        self, tracked: Dict[str, Optional["Prediction"]]
+    ) -> Dict[str, Exception]:
+        """
+        Update tracked predictions, and return the errors for those that couldn't be fetched.
+        """
+
+        remaining = set(tracked)
+
+        if len(remaining) > 1:
+            cursor: Union[str, "ellipsis"] = ...  # noqa: F821
+            pages = listed = 0
+            while self._keep_listing(pages, listed, len(tracked)):
+                page = await self._client.predictions.async_list(cursor)
+                pages += 1
+                listed += len(page.results)
+                if not _apply_page(page, tracked, remaining) or page.next is None:
+                    break
+                cursor = page.next
+
+        remaining = self._stragglers(remaining)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        failed: Dict[str, Exception] = {}
+
+        async def fetch(id: str) -> None:
+            try:
+                async with semaphore:
+                    updated = await self._client.predictions.async_get(id)
+            except Exception as exc:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+                failed[id] = exc
+            else:
+                tracked[id] = _merge(tracked[id], updated)
+
+        await asyncio.gather(*(fetch(id) for id in remaining))
+        return failed
+
+    def _keep_listing(self, pages: int, listed: int, tracked: int) -> bool:
+        if self.max_pages is not None:
+            return pages < self.max_pages
+
+        # Past this point, fetching the stragglers is cheaper than paging further
+        return listed < 2 * tracked
+
+    def _stragglers(self, remaining: Set[str]) -> Set[str]:
+        if len(remaining) <= self.max_fetches:
+            return remaining
+
+        # Take turns, so that every straggler is eventually fetched
+        ids = sorted(remaining)
+        start = self._rounds * self.max_fetches % len(ids)
+        self._rounds += 1
+        return set((ids[start:] + ids[:start])[: self.max_fetches])
+
+
+def _report(
+    failed: Dict[str, Exception], errors: Optional[Dict[str, Exception]]
+) -> None:
+    if errors is not None:
+        errors.update(failed)
+    elif failed:
+        raise next(iter(failed.values()))
+
+
+def _split(prediction: Union["Prediction", str]) -> Tuple[str, Optional["Prediction"]]:
+    if isinstance(prediction, str):
+        return prediction, None
+    return prediction.id, prediction
+
+
+def _track(
+    predictions: Iterable[Union["Prediction", str]],
+) -> Dict[str, Optional["Prediction"]]:
+    tracked: Dict[str, Optional["Prediction"]] = {}
+    for prediction in predictions:
+        id, obj = _split(prediction)
+        tracked[id] = tracked.get(id) or obj
+    return tracked
+
+
+def _aggregate_status(tracked: Dict[str, Optional["Prediction"]]) -> str:
+    if any(p is not None and p.status == "processing" for p in tracked.values()):
+        return "processing"
+    return "starting"
+
+
+def _merge(existing: Optional["Prediction"], updated: "Prediction") -> "Prediction":
+    if existing is None:
+        return updated
+
+    for name, value in updated.dict().items():
+        setattr(existing, name, value)
+    return existing
+
+
+def _apply_page(
+    page: "Page[Prediction]",
+    tracked: Dict[str, Optional["Prediction"]],
+    remaining: Set[str],
+) -> bool:
+    """
+    Update tracked predictions from a page of results listed newest-first,
+    and return whether it's worth listing the next page.
+    """
+
+    found = False
+    for result in page:
+        if result.id in remaining:
+            tracked[result.id] = _merge(tracked[result.id], result)
+            remaining.discard(result.id)
+            found = True
+
+    if not remaining or not page.results:
+        return False
+
+    created_at = [tracked[id] and tracked[id].created_at for id in remaining]  # type: ignore[union-attr]
+    if not all(created_at):
+        # Without knowing how old the remaining predictions are,
+        # only keep listing while pages still have tracked predictions on them
+        return found
+
+    oldest_remaining = min(created_at)  # type: ignore[type-var]
+    oldest_listed = page.results[-1].created_at
+    return oldest_listed is None or oldest_listed >= oldest_remaining
+
+
+__all__ = ["PredictionWaiter"]
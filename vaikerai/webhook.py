@@ -1,13 +1,20 @@
 import base64
+import binascii
 import hmac
+import time
 from hashlib import sha256
 from typing import (
     TYPE_CHECKING,
     Dict,
+    Iterable,
+    List,
+    Mapping,
     Optional,
+    Union,
     overload,
 )
 
+from vaikerai.replay import ReplayStore
 from vaikerai.resource import Namespace, Resource
 
 if TYPE_CHECKING:
@@ -46,6 +53,10 @@ class InvalidSignatureError(WebhookValidationError):
     """Exception raised when the webhook signature is invalid."""
 
 
+class DuplicateWebhookError(WebhookValidationError):
+    """Exception raised when a webhook with the same ID has already been received."""
+
+
 class Webhooks(Namespace):
     """
     Namespace for operations related to webhooks.
@@ -73,7 +84,7 @@ class Webhooks(Namespace):
             """
 
             resp = self._client._request("GET", "/v1/webhooks/default/secret")
-            return WebhookSigningSecret(**resp.json())
+            return WebhookSigningSecret(**self._client._decode_json(resp))
 
         async def async_secret(self) -> WebhookSigningSecret:
             """
@@ -86,7 +97,7 @@ class Webhooks(Namespace):
             resp = await self._client._async_request(
                 "GET", "/v1/webhooks/default/secret"
             )
-            return WebhookSigningSecret(**resp.json())
+            return WebhookSigningSecret(**self._client._decode_json(resp))
 
     @overload
     @staticmethod
@@ -94,6 +105,7 @@ class Webhooks(Namespace):
         request: "httpx.Request",
         secret: WebhookSigningSecret,
         tolerance: Optional[int] = None,
+        replay_store: Optional[ReplayStore] = None,
     ) -> bool: ...
 
     @overload
@@ -103,6 +115,7 @@ class Webhooks(Namespace):
         body: str,
         secret: WebhookSigningSecret,
         tolerance: Optional[int] = None,
+        replay_store: Optional[ReplayStore] = None,
     ) -> bool: ...
 
     @staticmethod
@@ -112,6 +125,7 @@ class Webhooks(Namespace):
         body: Optional[str] = None,
         secret: Optional[WebhookSigningSecret] = None,
         tolerance: Optional[int] = None,
+        replay_store: Optional[ReplayStore] = None,
     ) -> None:
         """
         Validate the signature from an incoming webhook request using the provided secret.
@@ -122,6 +136,9 @@ class Webhooks(Namespace):
             body (str): The request body.
             secret (WebhookSigningSecret): The webhook signing secret.
             tolerance (Optional[int]): Maximum allowed time difference (in seconds) between the current time and the webhook timestamp.
+            replay_store (Optional[ReplayStore]): A store of the webhook IDs already received, to reject duplicates. Requires `tolerance`.
+                The ID is recorded as soon as the webhook is validated,
+                so if handling it then fails, call `replay_store.discard(webhook_id)` to accept the retry.
 
         Returns:
             None: If the request is valid.
@@ -132,11 +149,15 @@ class Webhooks(Namespace):
             MissingWebhookBodyError: If the webhook body is missing.
             InvalidTimestampError: If the webhook timestamp is invalid or outside the tolerance.
             InvalidSignatureError: If the webhook signature is invalid.
+            DuplicateWebhookError: If a webhook with the same ID has already been received.
         """
 
         if not secret:
             raise ValueError("Missing webhook signing secret")
 
+        if replay_store is not None and tolerance is None:
+            raise ValueError("Replay protection requires a tolerance")
+
         if request and any([headers, body]):
             raise ValueError("Only one of request or headers/body can be provided")
 
@@ -201,3 +222,168 @@ class Webhooks(Namespace):
 
         if not valid:
             raise InvalidSignatureError("Webhook signature is invalid")
+
+        if replay_store is not None and tolerance is not None:
+            _check_replay(replay_store, webhook_id, int(timestamp), tolerance)
+
+
+class WebhookVerifier:
+    """
+    Verifies the signatures of incoming webhooks, for receivers that handle many of them.
+
+    Unlike `Webhooks.validate`, the secrets are decoded and keyed once, when the verifier is created,
+    and each body is hashed as raw bytes, without decoding it to text or copying it.
+    More than one secret can be given while a secret is being rotated,
+    and a webhook is valid if it's signed with any of them.
+    If a `replay_store` is given, webhooks whose ID has already been received
+    within the tolerance are rejected with `DuplicateWebhookError`.
+    """
+
+    tolerance: Optional[int]
+    """The maximum allowed time difference, in seconds, between the current time and the webhook timestamp."""
+
+    replay_store: Optional[ReplayStore]
+    """The store of webhook IDs already received, if any."""
+
+    def __init__(
+        self,
+        secrets: Union[WebhookSigningSecret, Iterable[WebhookSigningSecret]],
+        *,
+        tolerance: Optional[int] = None,
+        replay_store: Optional[ReplayStore] = None,
+    ) -> None:
+        if isinstance(secrets, WebhookSigningSecret):
+            secrets = [secrets]
+
+        if replay_store is not None and tolerance is None:
+            raise ValueError("Replay protection requires a tolerance")
+
+        self.tolerance = tolerance
+        self.replay_store = replay_store
+        self._keys: List["hmac.HMAC"] = []
+        for secret in secrets:
+            key_parts = secret.key.split("_")
+            if len(key_parts) != 2:
+                raise InvalidSecretKeyError(f"Invalid secret key format: {secret.key}")
+            self._keys.append(
+                hmac.new(base64.b64decode(key_parts[1]), digestmod=sha256)
+            )
+
+        if not self._keys:
+            raise ValueError("Missing webhook signing secret")
+
+    def verify(
+        self,
+        headers: Mapping[str, str],
+        body: Union[bytes, bytearray, memoryview, str],
+    ) -> None:
+        """
+        Verify the signature of an incoming webhook.
+
+        Args:
+            headers: The request headers. Names are matched case-insensitively.
+            body: The raw request body.
+
+        Returns:
+            None: If the webhook is valid.
+
+        Raises:
+            MissingWebhookHeaderError: If required webhook headers are missing.
+            MissingWebhookBodyError: If the webhook body is missing.
+            InvalidTimestampError: If the webhook timestamp is invalid or outside the tolerance.
+            InvalidSignatureError: If the webhook signature is invalid.
+            DuplicateWebhookError: If a webhook with the same ID has already been received.
+        """
+
+        webhook_id = _header(headers, "webhook-id")
+        timestamp = _header(headers, "webhook-timestamp")
+        signature = _header(headers, "webhook-signature")
+
+        if not webhook_id:
+            raise MissingWebhookHeaderError("Missing webhook id")
+        if not timestamp:
+            raise MissingWebhookHeaderError("Missing webhook timestamp")
+        if not signature:
+            raise MissingWebhookHeaderError("Missing webhook signature")
+        if not body:
+            raise MissingWebhookBodyError("Missing webhook body")
+
+        webhook_time = 0
+        if self.tolerance is not None:
+            try:
+                webhook_time = int(timestamp)
+            except ValueError:
+                raise InvalidTimestampError("Invalid webhook timestamp") from None
+            if abs(time.time() - webhook_time) > self.tolerance:
+                raise InvalidTimestampError(
+                    f"Webhook timestamp is outside the allowed tolerance of {self.tolerance} seconds"
+                )
+
+        if isinstance(body, str):
+            body = body.encode()
+
+        prefix = f"{webhook_id}.{timestamp}.".encode()
+        expected = []
+        for sig in signature.split():
+            sig_parts = sig.split(",")
+            if len(sig_parts) < 2:
+                raise InvalidSignatureError(f"Invalid signature format: {sig}")
+            try:
+                expected.append(base64.b64decode(sig_parts[1]))
+            except binascii.Error:
+                raise InvalidSignatureError(
+                    f"Invalid signature format: {sig}"
+                ) from None
+
+        for key in self._keys:
+            h = key.copy()
+            h.update(prefix)
+            h.update(body)
+            computed_signature = h.digest()
+            for sig_bytes in expected:
+                if hmac.compare_digest(sig_bytes, computed_signature):
+                    if self.replay_store is not None and self.tolerance is not None:
+                        _check_replay(
+                            self.replay_store, webhook_id, webhook_time, self.tolerance
+                        )
+                    return
+
+        raise InvalidSignatureError("Webhook signature is invalid")
+
+    def verify_request(self, request: "httpx.Request") -> None:
+        """
+        Verify the signature of an incoming webhook request.
+
+        Args:
+            request: The request object.
+
+        Raises:
+            WebhookValidationError: If the request is invalid.
+        """
+
+        self.verify(request.headers, request.content)
+
+
+def _check_replay(
+    replay_store: ReplayStore, webhook_id: str, webhook_time: int, tolerance: int
+) -> None:
+    # Remember the ID for as long as a replay could pass the timestamp check,
+    # or a retry could arrive, whichever is later.
+    # Only signed webhooks are remembered, so IDs can't be claimed by forged requests.
+    expires_at = max(time.time(), webhook_time) + tolerance
+    if not replay_store.add(webhook_id, expires_at):
+        raise DuplicateWebhookError(f"Webhook {webhook_id} has already been received")
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    # Most header mappings are case-insensitive already,
+    # so only scan the headers when the lowercase name isn't found
+    value = headers.get(name)
+    if value is not None:
+        return value
+
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+
+    return None